@@ -1,5 +1,12 @@
-import yaml
+import copy
+import logging
 import os
+import pickle
+import yaml
+
+from pyefis import __version__
+
+log = logging.getLogger(__name__)
 
 # allows using include preferences and include: keys to include yaml files inside yaml files
 # While it does support including includes within includes, it does not support the include: key being nested deeply.
@@ -20,30 +27,184 @@ import os
 #
 # Thi was made to split monolithic files into smaller includable sections
 # Allowing users to easily swap sections in/out to configure the screens to their liking
+#
+# Every YAML file read through load_yaml() is parsed once and kept in
+# yaml_cache, and each top level config resolved by load_config() is kept in
+# resolved_configs.  Both can be written to a snapshot file and loaded back on
+# the next start, the snapshot is only used when none of the config files it
+# was made from have changed, been removed or been added since.
+
+SNAPSHOT_FILE = ".config_snapshot.pickle"
+
+# libyaml is much faster when it is installed
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML by absolute path
+yaml_cache = dict()
+# Resolved configs by (absolute path, preferences)
+resolved_configs = dict()
+# True when something was parsed that isn't in the loaded snapshot
+snapshot_dirty = True
+
+
+# Callers are free to change what they are given unless they ask for the
+# shared copy
+def load_yaml(fname, shared=False):
+    global snapshot_dirty
+    path = os.path.abspath(fname)
+    if path not in yaml_cache:
+        with open(path) as cf:
+            yaml_cache[path] = yaml.load(cf, Loader=Loader)
+        snapshot_dirty = True
+    if shared:
+        return yaml_cache[path]
+    return copy.deepcopy(yaml_cache[path])
+
+
+def load_config(fname, preferences=None):
+    global snapshot_dirty
+    key = (os.path.abspath(fname), repr(preferences))
+    if key not in resolved_configs:
+        resolved_configs[key] = from_yaml(fname, preferences=preferences)
+        snapshot_dirty = True
+    return copy.deepcopy(resolved_configs[key])
+
 
+# Modification time and size of every config file under config_path and of
+# any other files named in paths.  None for files that don't exist.
+def file_stamps(config_path, paths=()):
+    paths = set(paths)
+    for root, dirs, files in os.walk(config_path):
+        for name in files:
+            if name.endswith(".yaml") or name.endswith(".yaml.custom"):
+                paths.add(os.path.abspath(os.path.join(root, name)))
+    stamps = dict()
+    for path in paths:
+        try:
+            st = os.stat(path)
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamps[path] = None
+    return stamps
 
-def from_yaml(fname, bpath=None, cfg=None, bc=None, preferences=None):
+
+def load_snapshot(snapshot_file, config_path):
+    global snapshot_dirty
+    try:
+        with open(snapshot_file, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        log.warning(f"Ignoring unreadable config snapshot {snapshot_file}: {e}")
+        return False
+    if snapshot.get("version") != __version__ or \
+            snapshot.get("stamps") != file_stamps(config_path, snapshot.get("stamps", ())):
+        log.info("Config files have changed since the snapshot was made")
+        return False
+    yaml_cache.update(snapshot["files"])
+    resolved_configs.update(snapshot["configs"])
+    snapshot_dirty = False
+    return True
+
+
+def save_snapshot(snapshot_file, config_path):
+    global snapshot_dirty
+    snapshot = {
+        "version": __version__,
+        "stamps": file_stamps(config_path, yaml_cache),
+        "files": yaml_cache,
+        "configs": resolved_configs,
+    }
+    try:
+        with open(snapshot_file + ".tmp", "wb") as f:
+            pickle.dump(snapshot, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(snapshot_file + ".tmp", snapshot_file)
+    except Exception as e:
+        log.warning(f"Unable to save config snapshot {snapshot_file}: {e}")
+        return False
+    snapshot_dirty = False
+    return True
+
+
+# Parse every config file under config_path so the snapshot has all of the
+# files that screens, buttons and lists might read later
+def compile_files(config_path):
+    for path in file_stamps(config_path):
+        if path.endswith(".yaml"):
+            try:
+                load_yaml(path, shared=True)
+            except yaml.YAMLError as e:
+                log.warning(f"Unable to parse {path}: {e}")
+
+
+def find_include(f, fpath, bpath, preferences):
+    # Check if file relative to current file
+    ifile = fpath + "/" + f
+    if not os.path.exists(ifile):
+        # Use base path
+        ifile = bpath + "/" + f
+    if os.path.exists(ifile):
+        return ifile
+    # Check preferences
+    if preferences is not None and "includes" in preferences:
+        pfile = preferences["includes"].get(f, False)
+        if pfile:
+            ifile = fpath + "/" + pfile
+            if not os.path.exists(ifile):
+                ifile = bpath + "/" + pfile
+                if not os.path.exists(ifile):
+                    raise FileNotFoundError(f"Cannot find include: {f}")
+            return ifile
+        # Not in the preferences either, leave it to open() to complain
+        return ifile
+    raise FileNotFoundError(f"Cannot find include: {f}")
+
+
+# bc is the stack of files currently being included, a file that includes
+# itself somewhere down its own stack is a loop.  memo holds each file
+# already resolved during this call so a file included from many places is
+# only resolved once.
+def from_yaml(fname, bpath=None, cfg=None, bc=None, preferences=None, memo=None):
     if bc == None:
         bc = list()
-    bc.append(fname)
-    if len(bc) > 500:
-        import pprint
-
-        raise RecursionError(
-            f"{pprint.pformat(bc)}\nPotential loop detected inside yaml includes, the breadcrumbs above might help detect where the issue is"
-        )
+    if memo is None:
+        memo = dict()
 
     fpath = os.path.dirname(fname)
-    if not cfg and not fpath:
+    if cfg is None and not fpath:
         raise SyntaxError(
             f"The filename '{fname}', must include the path, not just the filename"
         )
-    if not cfg:
+    if cfg is None:
         # cfg only populated to process nested data
         if not bpath:
             bpath = fpath
-        with open(fname) as cf:
-            cfg = yaml.safe_load(cf)
+        key = (os.path.abspath(fname), bpath)
+        if key in memo:
+            return copy.deepcopy(memo[key])
+        if key[0] in bc:
+            import pprint
+
+            raise RecursionError(
+                f"{pprint.pformat(bc + [key[0]])}\nLoop detected inside yaml includes, the breadcrumbs above show the files including each other"
+            )
+        bc.append(key[0])
+        try:
+            # An empty file loads as None, which would look like this file
+            # again to the call below
+            new = from_yaml(
+                fname,
+                bpath,
+                load_yaml(fname, shared=True) or {},
+                bc=bc,
+                preferences=preferences,
+                memo=memo,
+            )
+        finally:
+            bc.pop()
+        memo[key] = new
+        return new
 
     new = {}
     if hasattr(cfg, "items"):
@@ -57,61 +218,27 @@ def from_yaml(fname, bpath=None, cfg=None, bc=None, preferences=None):
                     raise SyntaxError(f"#include in {fname} must be string or array")
                 # Process include(s)
                 for f in files:
-                    # Check if file relative to current file
-                    ifile = fpath + "/" + f
-                    if not os.path.exists(ifile):
-                        # Use base path
-                        ifile = bpath + "/" + f
-                    if not os.path.exists(ifile):
-                        # Check preferences
-                        if preferences != None and "includes" in preferences:
-                            pfile = preferences["includes"].get(f, False)
-                            if pfile:
-                                ifile = fpath + "/" + pfile
-                                if not os.path.exists(ifile):
-                                    ifile = bpath + "/" + pfile
-                                    if not os.path.exists(ifile):
-                                        raise FileNotFoundError(
-                                            f"Cannot find include: {f}"
-                                        )
-                        else:
-                            raise FileNotFoundError(f"Cannot find include: {f}")
-                    sub = from_yaml(ifile, bpath, bc=bc, preferences=preferences)
+                    ifile = find_include(f, fpath, bpath, preferences)
+                    sub = from_yaml(
+                        ifile, bpath, bc=bc, preferences=preferences, memo=memo
+                    )
                     if hasattr(sub, "items"):
                         for k, v in sub.items():
                             new[k] = v
             elif isinstance(val, dict):
-                new[key] = from_yaml(fname, bpath, val, bc=bc, preferences=preferences)
+                new[key] = from_yaml(
+                    fname, bpath, val, bc=bc, preferences=preferences, memo=memo
+                )
             elif isinstance(val, list):
                 new[key] = []
                 # Included array elements
                 for l in val:
                     if isinstance(l, dict):
                         if "include" in l:
-                            ifile = fpath + "/" + l["include"]
-                            if not os.path.exists(ifile):
-                                # Use base path
-                                ifile = bpath + "/" + l["include"]
-                            if not os.path.exists(ifile):
-                                # Check preferences
-                                if "includes" in preferences:
-                                    pfile = preferences["includes"].get(
-                                        l["include"], False
-                                    )
-                                    if pfile:
-                                        ifile = fpath + "/" + pfile
-                                        if not os.path.exists(ifile):
-                                            ifile = bpath + "/" + pfile
-                                            if not os.path.exists(ifile):
-                                                raise FileNotFoundError(
-                                                    f"Cannot find include: {pfile}"
-                                                )
-                                else:
-                                    raise FileNotFoundError(f"Cannot find include: {ifile}")
-                            # with open(ifile) as cf:
+                            ifile = find_include(l["include"], fpath, bpath, preferences)
                             litems = from_yaml(
-                                ifile, bpath, bc=bc, preferences=preferences
-                            )  # yaml.safe_load(cf)
+                                ifile, bpath, bc=bc, preferences=preferences, memo=memo
+                            )
                             if "items" in litems:
                                 if litems["items"] != None:
                                     for a in litems["items"]:
@@ -124,6 +251,7 @@ def from_yaml(fname, bpath=None, cfg=None, bc=None, preferences=None):
                                                 a,
                                                 bc=bc,
                                                 preferences=preferences,
+                                                memo=memo,
                                             )
                                         if isinstance(litems["items"], dict):
                                             new[key].append({ap: litems["items"][ap]})
@@ -0,0 +1,258 @@
+#  Copyright (c) 2026 Eric Blevins
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+
+# Shared subscriptions to FIX database items.  Rather than every instrument
+# connecting its own slots to the signals of each item it uses, the hub
+# connects to an item's signals once and calls the consumers from plain
+# Python lists.
+#
+# Consumers subscribe to one of these events:
+#   value       - callback(value)
+#   old, bad, fail, annunciate - callback(state)
+#   quality     - callback(flag, state) for any of old, bad, fail, annunciate
+#   aux         - callback(aux dict)
+#   report      - callback() when a new report of the item is received
+#   changed     - callback(key, event) for any of value, old, bad, fail,
+#                 annunciate and aux
+#
+# Bound methods are held weakly so subscribing doesn't keep an instrument
+# alive, and callbacks whose Qt object has been deleted are dropped.
+#
+# Changes made in the GUI thread are passed on straight away.  Changes made
+# by the FIX client thread go through the mailbox, which keeps only the
+# latest of each event for each key and passes them all on in one go from
+# the GUI thread, so a burst from the client can't fill the event queue
+# with stale values.  With report_coalesced set the mailbox logs how many
+# updates of each key it dropped for a newer one, which helps when sizing
+# the output rates of the FIX gateway.
+
+import logging
+import threading
+import time
+import weakref
+
+from PyQt6.QtCore import *
+
+import pyavtools.fix as fix
+
+QUALITY_FLAGS = ("old", "bad", "fail", "annunciate")
+EVENTS = ("value", "aux", "report", "quality", "changed") + QUALITY_FLAGS
+
+log = logging.getLogger(__name__)
+
+# Subscription by FIX key
+subscriptions = dict()
+mailbox = None
+# Seconds between summaries of the coalesced updates, None for none
+coalesced_period = None
+
+
+# Default Mailbox.report, sums the dropped updates by key and logs them
+# once every period seconds
+class CoalescedLog:
+    def __init__(self, period):
+        self.period = period
+        self.counts = dict()
+        self.start = time.monotonic()
+
+    def __call__(self, dropped):
+        for key, count in dropped.items():
+            if count:
+                self.counts[key] = self.counts.get(key, 0) + count
+        now = time.monotonic()
+        if now - self.start >= self.period:
+            if self.counts:
+                log.info(f"FIX updates coalesced in the last {now - self.start:.0f}s: {self.counts}")
+            self.counts = dict()
+            self.start = now
+
+
+def report_coalesced(period):
+    global coalesced_period
+    coalesced_period = period
+    if mailbox is not None:
+        mailbox.report = CoalescedLog(period) if period else None
+
+
+class Mailbox(QObject):
+    wake = pyqtSignal()
+
+    def __init__(self):
+        super(Mailbox, self).__init__()
+        self.lock = threading.Lock()
+        # Latest arguments by (subscription, event)
+        self.pending = dict()
+        # Number of changes received by key since the last drain
+        self.received = dict()
+        # Total changes dropped for a newer one, by key
+        self.coalesced = dict()
+        # Called with {key: changes dropped} after each drain
+        self.report = None
+        self.wake.connect(self.drain, Qt.ConnectionType.QueuedConnection)
+
+    # Called from the client thread
+    def post(self, sub, event, args):
+        key = sub.item.key
+        with self.lock:
+            wake = not self.pending
+            self.pending[(sub, event)] = args
+            self.received[key] = self.received.get(key, 0) + 1
+        if wake:
+            self.wake.emit()
+
+    def drain(self):
+        with self.lock:
+            pending, self.pending = self.pending, dict()
+            received, self.received = self.received, dict()
+        # A consumer that raises mustn't cost the other keys their latest
+        # values, so deliver everything before passing the error on
+        error = None
+        for (sub, event), args in pending.items():
+            received[sub.item.key] -= 1
+            try:
+                sub.deliver(event, *args)
+            except Exception as e:
+                if error is None:
+                    error = e
+        for key, dropped in received.items():
+            self.coalesced[key] = self.coalesced.get(key, 0) + dropped
+        if self.report is not None and received:
+            self.report(received)
+        if error is not None:
+            raise error
+
+
+class Subscription(QObject):
+    def __init__(self, item):
+        super(Subscription, self).__init__()
+        self.item = item
+        self.consumers = {event: list() for event in EVENTS}
+        self.gui_thread = self.thread()
+        # Direct connections so the slots run in the thread that made the
+        # change, post() decides whether that needs the mailbox.
+        # The dtype of an item can change with a new report so take all
+        # of the overloads, only the one for the current dtype is emitted
+        direct = Qt.ConnectionType.DirectConnection
+        for dtype in (float, int, bool, str):
+            item.valueChanged[dtype].connect(self.valueChanged, direct)
+        item.oldChanged.connect(self.oldChanged, direct)
+        item.badChanged.connect(self.badChanged, direct)
+        item.failChanged.connect(self.failChanged, direct)
+        item.annunciateChanged.connect(self.annunciateChanged, direct)
+        item.auxChanged.connect(self.auxChanged, direct)
+        item.reportReceived.connect(self.reportReceived, direct)
+
+    def add(self, event, callback):
+        if event not in self.consumers:
+            raise ValueError(f"Unknown FIX event '{event}'")
+        if self.find(event, callback) is None:
+            if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+                ref = weakref.WeakMethod(callback)
+            else:
+                ref = lambda callback=callback: callback
+            self.consumers[event].append(ref)
+
+    def remove(self, event, callback):
+        ref = self.find(event, callback)
+        if ref is not None:
+            self.consumers[event].remove(ref)
+
+    def find(self, event, callback):
+        for ref in self.consumers[event]:
+            if ref() == callback:
+                return ref
+        return None
+
+    def count(self):
+        return sum(len(refs) for refs in self.consumers.values())
+
+    def dispatch(self, event, *args):
+        refs = self.consumers[event]
+        for ref in list(refs):
+            callback = ref()
+            if callback is None:
+                refs.remove(ref)
+                continue
+            try:
+                callback(*args)
+            except RuntimeError as e:
+                # The widget behind the callback has been deleted
+                if "has been deleted" not in str(e):
+                    raise
+                refs.remove(ref)
+
+    def post(self, event, *args):
+        if QThread.currentThread() == self.gui_thread:
+            self.deliver(event, *args)
+        else:
+            mailbox.post(self, event, args)
+
+    def deliver(self, event, *args):
+        self.dispatch(event, *args)
+        if event in QUALITY_FLAGS:
+            self.dispatch("quality", event, *args)
+        if event != "report":
+            self.dispatch("changed", self.item.key, event)
+
+    def valueChanged(self, value):
+        self.post("value", value)
+
+    def oldChanged(self, state):
+        self.post("old", state)
+
+    def badChanged(self, state):
+        self.post("bad", state)
+
+    def failChanged(self, state):
+        self.post("fail", state)
+
+    def annunciateChanged(self, state):
+        self.post("annunciate", state)
+
+    def auxChanged(self, aux):
+        self.post("aux", aux)
+
+    # The signal has no arguments
+    def reportReceived(self, *args):
+        self.post("report")
+
+
+def subscription(key):
+    global mailbox
+    if mailbox is None:
+        mailbox = Mailbox()
+        if coalesced_period:
+            mailbox.report = CoalescedLog(coalesced_period)
+    item = fix.db.get_item(key)
+    sub = subscriptions.get(key)
+    # A new database means new items
+    if sub is None or sub.item is not item:
+        sub = Subscription(item)
+        subscriptions[key] = sub
+    return sub
+
+
+# Subscribe callback to event on the FIX item key and return the item
+def subscribe(key, event, callback):
+    sub = subscription(key)
+    sub.add(event, callback)
+    return sub.item
+
+
+def unsubscribe(key, event, callback):
+    sub = subscriptions.get(key)
+    if sub is not None:
+        sub.remove(event, callback)
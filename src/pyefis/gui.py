@@ -15,7 +15,7 @@
 #  Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
 
 from PyQt6.QtGui import QColor
-from PyQt6.QtCore import QObject, pyqtSignal, QEvent, QCoreApplication
+from PyQt6.QtCore import QObject, pyqtSignal, QEvent, QCoreApplication, QTimer, Qt
 from PyQt6.QtWidgets import QMainWindow, QApplication, QWidget
 
 import time
@@ -23,10 +23,55 @@ import importlib
 import logging
 import sys
 from pyefis import hmi
+from pyefis import fixhub
 import pyavtools.fix as fix
 import pyavtools.scheduler as scheduler
 
 screens = []
+render_scheduler = None
+
+
+# Collects instrument redraws that are requested between display frames and
+# runs each of them once when the frame timer fires.  Callbacks are keyed on
+# the callable itself so repeated requests from the same instrument collapse
+# into one, and the arguments from the most recent request are the ones used.
+# Because the flush always happens after the last request the final value is
+# never dropped, only the intermediate ones.
+class RenderScheduler(QObject):
+    def __init__(self, max_fps, parent=None):
+        super(RenderScheduler, self).__init__(parent)
+        self.max_fps = max_fps
+        self.pending = dict()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(max(1, round(1000 / max_fps)))
+        self.timer.timeout.connect(self.flush)
+
+    def schedule(self, callback, *args):
+        self.pending[callback] = args
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        pending = self.pending
+        self.pending = dict()
+        for callback, args in pending.items():
+            try:
+                callback(*args)
+            except RuntimeError as e:
+                # The widget was deleted while the redraw was pending
+                if "has been deleted" not in str(e):
+                    raise
+
+
+def scheduleRender(callback, *args):
+    # Without a scheduler (max_fps not configured) redraw right away
+    if render_scheduler is None:
+        callback(*args)
+    else:
+        render_scheduler.schedule(callback, *args)
+
 
 # This class is just a structure to hold information about a single
 # screen that will be loaded.
@@ -46,12 +91,18 @@ class Screen(QObject):
         self.object = None
         self.default = False
 
+    # Screens that have suspend() and resume() are told when they are
+    # hidden so their instruments can skip work until they are shown again
     def show(self):
+        if callable(getattr(self.object, 'resume', None)):
+            self.object.resume()
         self.object.show()
         self.screenShow.emit()
 
     def hide(self):
         self.object.hide()
+        if callable(getattr(self.object, 'suspend', None)):
+            self.object.suspend()
         self.screenHide.emit()
 
 
@@ -91,25 +142,104 @@ class Main(QMainWindow):
             w.setAutoFillBackground(True)
         # Init the variable to prvent exception in getRunningScreen()
         self.running_screen = None
+        # With lazy_screens only the default screen is built before the
+        # window is shown.  The rest are built one at a time whenever the
+        # event loop is idle, or when they are first shown, whichever
+        # comes first.
+        self.lazy_screens = bool(config["main"].get("lazy_screens", False))
+        self.prebuild_screens = bool(config["main"].get("prebuild_screens", True))
+        self.prebuild_neighbours = bool(config["main"].get("prebuild_neighbours", False))
+        # Indexes of the screens waiting to be built in the background
+        self.prebuild = []
+        self.prebuild_timer = QTimer(self)
+        self.prebuild_timer.setInterval(0)
+        self.prebuild_timer.timeout.connect(self.prebuildNext)
+        # Keep at most this many screens built, the least recently shown
+        # are torn down and built again from their config when next shown
+        self.max_resident_screens = int(config["main"].get("max_resident_screens", 0))
+        # Indexes of the built screens, least recently shown first
+        self.resident = []
         for idx, scr in enumerate(screens):
-
-            scr.object = scr.module.Screen(self)
-            setattr(scr.object, 'screenName', scr.name)
-            log.debug("Loading Screen {0}".format(scr.name))
-            # TODO Figure out how to have different size screens
-            scr.object.resize(self.width(), self.height())
-            scr.object.move(0, 0)
-            if scr.default:
-                scr.show()
-                self.running_screen = idx
-            else:
-                scr.hide()
-                # This is to force screen builder to parse its configs now
-                # instead of waiting to do so just before it is first shown.
-                # Without this the user will often see a delay when navigating
-                # to a screen for the first time
-                if callable(getattr(scr.object, 'initScreen', None)):
-                    scr.object.initScreen()
+            if scr.default or not (self.lazy_screens or self.residentFull()):
+                self.buildScreen(idx)
+            elif self.prebuild_screens:
+                self.prebuild.append(idx)
+        self.trimScreens()
+        if self.prebuild_neighbours and self.running_screen is not None:
+            self.queueNeighbours(self.running_screen)
+        elif self.prebuild:
+            self.prebuild_timer.start()
+
+    def buildScreen(self, idx):
+        scr = screens[idx]
+        if scr.object is not None:
+            return scr.object
+        scr.object = scr.module.Screen(self)
+        setattr(scr.object, 'screenName', scr.name)
+        log.debug("Loading Screen {0}".format(scr.name))
+        # TODO Figure out how to have different size screens
+        scr.object.resize(self.width(), self.height())
+        scr.object.move(0, 0)
+        self.resident.append(idx)
+        if scr.default and self.running_screen is None:
+            scr.show()
+            self.running_screen = idx
+        else:
+            scr.hide()
+            # This is to force screen builder to parse its configs now
+            # instead of waiting to do so just before it is first shown.
+            # Without this the user will often see a delay when navigating
+            # to a screen for the first time
+            if callable(getattr(scr.object, 'initScreen', None)):
+                scr.object.initScreen()
+        return scr.object
+
+    def teardownScreen(self, idx):
+        scr = screens[idx]
+        if scr.object is None:
+            return
+        log.debug("Unloading Screen {0}".format(scr.name))
+        obj = scr.object
+        scr.object = None
+        self.resident.remove(idx)
+        # Closing stops the instruments and disconnects the screen from the
+        # FIX database and scheduler, deleting it takes the children with it
+        obj.close()
+        obj.deleteLater()
+
+    def residentFull(self):
+        return bool(self.max_resident_screens) and \
+            len(self.resident) >= self.max_resident_screens
+
+    def trimScreens(self):
+        for idx in list(self.resident):
+            if not self.max_resident_screens or \
+                    len(self.resident) <= self.max_resident_screens:
+                break
+            if idx != self.running_screen:
+                self.teardownScreen(idx)
+
+    # Build one of the queued screens, the timer keeps calling this
+    # while the event loop is idle until the queue is empty.  Prebuilding
+    # only fills free resident slots, it never tears a screen down.
+    def prebuildNext(self):
+        while self.prebuild and not self.residentFull():
+            idx = self.prebuild.pop(0)
+            if screens[idx].object is None:
+                self.buildScreen(idx)
+                break
+        if not self.prebuild or self.residentFull():
+            self.prebuild_timer.stop()
+
+    def queueNeighbours(self, idx):
+        count = len(screens)
+        for n in ((idx + 1) % count, (idx - 1) % count):
+            if screens[n].object is None:
+                if n in self.prebuild:
+                    self.prebuild.remove(n)
+                self.prebuild.insert(0, n)
+        if self.prebuild:
+            self.prebuild_timer.start()
 
     def showScreen(self, scr):
         found = None
@@ -123,9 +253,15 @@ class Main(QMainWindow):
                     break
         if found is not None:
             if found != self.running_screen:  # Make sure it's different.
+                self.buildScreen(found)
                 screens[found].show()
                 screens[self.running_screen].hide()
                 self.running_screen = found
+                self.resident.remove(found)
+                self.resident.append(found)
+                self.trimScreens()
+                if self.prebuild_neighbours:
+                    self.queueNeighbours(found)
         else:
             raise KeyError("Screen {0} Not Found".format(scr))
 
@@ -151,7 +287,8 @@ class Main(QMainWindow):
         # Ensure external processes are terminated before exiting
         # For example waydroid/weston if they are in use
         for s in screens:
-            s.object.close()
+            if s.object is not None:
+                s.object.close()
         # Close down fix connections
         # This needs done before the main event loop is stopped below
         fix.stop()
@@ -209,8 +346,15 @@ def setDefaultScreen(s):
 def initialize(config, config_path, preferences):
     global mainWindow
     global log
+    global render_scheduler
     log = logging.getLogger(__name__)
     log.info("Initializing Graphics")
+    max_fps = config["main"].get("max_fps", None)
+    if max_fps:
+        render_scheduler = RenderScheduler(max_fps)
+    else:
+        render_scheduler = None
+    fixhub.report_coalesced(config["main"].get("report_coalesced", None))
     # Load the Screens
     for each in config['screens']:
         module = config['screens'][each]["module"]
@@ -18,6 +18,8 @@ from PyQt6.QtGui import *
 from PyQt6.QtCore import *
 from PyQt6.QtWidgets import *
 
+from pyefis.instruments import helpers
+
 
 class NumericalDisplay(QGraphicsView):
     def __init__(
@@ -50,27 +52,13 @@ class NumericalDisplay(QGraphicsView):
         self.w = self.width()
         self.h = self.height()
 
+        # Largest size that fits total_decimals digits across
+        self.font_size = qRound(helpers.fit_to_width(self.w - 0.1, "9" * self.total_decimals, self.font_family))
+        self.f = QFont(self.font_family, self.font_size)
         t = QGraphicsSimpleTextItem("9")
         t.setFont(self.f)
         font_width = t.boundingRect().width()
         font_height = t.boundingRect().height()
-        while font_width * (self.total_decimals) >= self.w - 0.1:
-            self.font_size -= 0.1
-            self.f.setPointSizeF(self.font_size)
-            t.setFont(self.f)
-            rect = t.boundingRect()
-            font_width = rect.width()
-            font_height = rect.height()
-
-        while font_width * (self.total_decimals) <= self.w - 0.1:
-            self.font_size += 0.1
-            self.f.setPointSizeF(self.font_size)
-            t.setFont(self.f)
-            rect = t.boundingRect()
-            font_width = rect.width()
-            font_height = rect.height()
-        self.font_size = qRound(self.font_size)
-        self.f = QFont(self.font_family, self.font_size)
 
         self.scene = QGraphicsScene(0, 0, self.w, self.h)
         border_width = 1
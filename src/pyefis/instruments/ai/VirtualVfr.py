@@ -31,6 +31,7 @@ import logging
 import pyavtools.fix as fix
 
 from pyefis.instruments.ai import AI
+from pyefis.instruments import helpers
 import pyavtools.Spatial as Spatial
 import pyavtools.CIFPObjects as CIFPObjects
 
@@ -45,6 +46,131 @@ FEET_METER = 1.0 / METERS_FOOT
 EARTH_RADIUS_M=6356752.0
 EARTH_RADIUS=EARTH_RADIUS_M * FEET_METER
 
+# Parts of a chart object that each get their own scene item
+RUNWAY = 0
+CENTERLINE = 1
+EXTENDED_CENTERLINE = 2
+RUNWAY_LABEL = 3
+RECIPROCAL_LABEL = 4
+PAPI = 5    # Four lights, PAPI to PAPI + 3
+AIRPORT_LABEL = 9
+NAVAID_LABEL = 10
+NAVAID_ICON = 11
+RUNWAY_PARTS = (RUNWAY, CENTERLINE, EXTENDED_CENTERLINE, RUNWAY_LABEL,
+                RECIPROCAL_LABEL, PAPI, PAPI + 1, PAPI + 2, PAPI + 3)
+
+class ScenePool:
+    """ Owns the scene items used to draw chart objects. Items are looked up
+        by the object's key, such as the airport id, and the part. Items of
+        objects that go out of view are hidden and kept for reuse rather than
+        removed from the scene, so flying past airports doesn't keep adding
+        and removing items. Nothing is kept for an object once all of its
+        items are released.
+    """
+    def __init__(self, scene):
+        self.scene = scene
+        self.items = dict()
+        self.spare = dict()
+        # Sizes of labels whose text never changes, by key
+        self.rects = dict()
+
+    def item(self, key, part):
+        return self.items.get((key, part))
+
+    def acquire(self, key, part, item_type):
+        """ Returns the item for this part of the object and whether it is
+            fresh, that is new or reused from another object and needing its
+            pen, brush, text etc set up
+        """
+        item = self.items.get((key, part))
+        if item is not None:
+            return item, False
+        spare = self.spare.get(item_type)
+        if spare:
+            item = spare.pop()
+            item.show()
+        else:
+            item = item_type()
+            item.setZValue(0)
+            self.scene.addItem(item)
+        self.items[(key, part)] = item
+        return item, True
+
+    def release(self, key, part):
+        item = self.items.pop((key, part), None)
+        if item is not None:
+            item.hide()
+            self.spare.setdefault(type(item), list()).append(item)
+            if part == AIRPORT_LABEL:
+                self.rects.pop(key, None)
+
+    def release_object(self, key, parts):
+        for part in parts:
+            self.release(key, part)
+
+    def release_all(self):
+        for key, part in list(self.items.keys()):
+            self.release(key, part)
+
+    def __len__(self):
+        return len(self.items)
+
+class LabelGrid:
+    """ Screen space taken by the labels placed so far this frame, bucketed
+        in a uniform grid so a new label is only checked against the labels
+        in the cells it covers. limit caps how many labels are looked at in
+        a frame, the rest are left off.
+    """
+    def __init__(self, cell_size=64, limit=None):
+        self.cell_size = cell_size
+        self.limit = limit
+        self.cells = dict()
+        self.rects = list()
+        self.evaluated = 0
+
+    def clear(self):
+        # Keep the cell lists, the same cells get used frame after frame
+        for rects in self.cells.values():
+            rects.clear()
+        self.rects.clear()
+        self.evaluated = 0
+
+    def covered_cells(self, rect):
+        cs = self.cell_size
+        for cx in range(math.floor(rect.left() / cs), math.floor(rect.right() / cs) + 1):
+            for cy in range(math.floor(rect.top() / cs), math.floor(rect.bottom() / cs) + 1):
+                yield (cx, cy)
+
+    def admit(self):
+        if self.limit is not None and self.evaluated >= self.limit:
+            return False
+        self.evaluated += 1
+        return True
+
+    def intersects(self, rect):
+        for cell in self.covered_cells(rect):
+            rects = self.cells.get(cell)
+            if rects:
+                for s in rects:
+                    if s.intersects(rect):
+                        return True
+        return False
+
+    def add(self, rect):
+        self.rects.append(rect)
+        for cell in self.covered_cells(rect):
+            rects = self.cells.get(cell)
+            if rects is None:
+                self.cells[cell] = [rect]
+            else:
+                rects.append(rect)
+
+    def __iter__(self):
+        return iter(self.rects)
+
+    def __len__(self):
+        return len(self.rects)
+
 class VirtualVfr(AI):
     CENTERLINE_WIDTH = 3
     MIN_FONT_SIZE=7
@@ -54,7 +180,7 @@ class VirtualVfr(AI):
     VORTAC_ICON_PATH="vortac.png"
     def __init__(self, parent=None, font_percent=None, font_family="DejaVu Sans Condensed"):
         super(VirtualVfr, self).__init__(parent, font_percent=font_percent)
-        self.display_objects = dict()
+        self.scene_items = None
         time.sleep(.6)      # Pause to let DB load
         self.font_family = font_family
         self.gsi = False
@@ -72,6 +198,11 @@ class VirtualVfr(AI):
         self.head_item = fix.db.get_item("COURSE")
         self.alt_item = fix.db.get_item("ALT")
         self.gsi_item = fix.db.get_item("GSI")
+        try:
+            self.gs_item = fix.db.get_item("GS")
+        except KeyError:
+            # Ground speed is only used to load chart data ahead of time
+            self.gs_item = None
         self._VFROld['LONG'] = self.lng_item.old
         self._VFRBad['LONG'] = self.lng_item.bad
         self._VFRFail['LONG'] = self.lng_item.fail
@@ -117,12 +248,28 @@ class VirtualVfr(AI):
 
     def resizeEvent(self, event):
         super(VirtualVfr, self).resizeEvent(event)
+        # The items of the old scene went with it
+        self.scene_items = ScenePool(self.scene)
         VirtualVfr.CENTERLINE_WIDTH = int(self.width() * 0.005)
         VirtualVfr.MIN_FONT_SIZE=int(self.height() * 0.023)
         VirtualVfr.AIRPORT_FONT_SIZE=int(self.height() * 0.03)
         VirtualVfr.PAPI_YOFFSET = int(self.width() * 0.03)
         VirtualVfr.PAPI_LIGHT_SPACING = int(self.width() * 0.02)
 
+        if self.pov is None:
+            self.open_chart_data()
+        else:
+            # Only the size changed, keep the loaded tiles and connections
+            self.pov.start_loader()
+            self.pov.resize(self.scene.width())
+
+        if not self.rendering_prohibited():
+            self.pov.render(self)
+
+    def open_chart_data(self):
+        """ Opens the CIFP data and connects the position inputs, done once
+            on the first resize
+        """
         dbpath = os.path.expanduser(self.myparent.get_config_item('dbpath'))
         indexpath = os.path.expanduser(self.myparent.get_config_item('indexpath'))
 
@@ -163,6 +310,14 @@ class VirtualVfr(AI):
         self.pov = PointOfView(dbpath,
                                indexpath,
                                self.myparent.get_config_item('refresh_period'))
+        self.pov.redraw = self.redrawView
+        if self.myparent.get_config_item('tile_cache_size'):
+            self.pov.tile_cache_size = self.myparent.get_config_item('tile_cache_size')
+        if self.myparent.get_config_item('max_labels'):
+            self.pov.label_grid.limit = self.myparent.get_config_item('max_labels')
+        self.pov.start_loader()
+        if self.gs_item is not None:
+            self.pov.update_groundspeed(self.gs_item.value)
         self.pov.initialize(["Runway", "Airport"], self.scene.width(),
                     self.lng, self.lat, self.altitude, self.true_heading)
 
@@ -185,9 +340,8 @@ class VirtualVfr(AI):
         self.alt_item.badChanged[bool].connect(self.setAltBad)
         self.alt_item.oldChanged[bool].connect(self.setAltOld)
         self.alt_item.failChanged[bool].connect(self.setAltFail)
-
-        if not self.rendering_prohibited():
-            self.pov.render(self)
+        if self.gs_item is not None:
+            self.gs_item.valueChanged[float].connect(self.setGroundSpeed)
 
     def get_largest_font_size(self, width):
         max_size = self.height() * 0.08 #25
@@ -253,24 +407,20 @@ class VirtualVfr(AI):
                 left_bottom = p22
             label = rwlabels[1]
 
+        pool = self.scene_items
         key = name+airport_id
-        if key in self.display_objects:
-            # print ("update existing runway polygon %s"%key)
-            poly = QPolygonF([QPointF(*p11), QPointF(*p12), QPointF(*p21), QPointF(*p22)])
-            rw = self.display_objects[key]
-            rw.setPolygon(poly)
-        else:
-            # print ("make new runway polygon %s"%key)
-            poly = QPolygonF([QPointF(*p11), QPointF(*p12), QPointF(*p21), QPointF(*p22)])
+        poly = QPolygonF([QPointF(*p11), QPointF(*p12), QPointF(*p21), QPointF(*p22)])
+        rw, fresh = pool.acquire(key, RUNWAY, QGraphicsPolygonItem)
+        rw.setPolygon(poly)
+        if fresh:
             pen = QPen(QColor(Qt.GlobalColor.white))
             brush = QBrush(QColor(Qt.GlobalColor.black))
             if label[-1] == "W":
                 brush = QBrush(QColor("#000070"))
-            rw = self.scene.addPolygon(poly, pen, brush)
+            rw.setPen(pen)
+            rw.setBrush(brush)
             rw.setX(self.scene.width()/2)
             rw.setY(self.scene.height()/2)
-            rw.setZValue(0)
-            self.display_objects[key] = rw
 
         # Add the runway centerline, if appropriate
         xdiff = p11[0] - p12[0]
@@ -283,7 +433,6 @@ class VirtualVfr(AI):
                    ,((p21[0] + p22[0]) / 2.0, (p21[1] + p22[1]) / 2.0)]
         centerline = None
         centerline_function = get_line(clpoints, FOFY)
-        clkey = key + "_c"
         if dist1 > 3 * VirtualVfr.CENTERLINE_WIDTH and dist2 > 3*VirtualVfr.CENTERLINE_WIDTH and \
                 abs(clpoints[0][1]-clpoints[1][1]) > 5*VirtualVfr.CENTERLINE_WIDTH:
             # Runway polygon large enough to add a centerline
@@ -299,63 +448,38 @@ class VirtualVfr(AI):
             topy = clpoints[topi][1]+2*VirtualVfr.CENTERLINE_WIDTH
             clpoints[topi] = (F(topy, cline_function), topy)
             cline = QLineF(QPointF(*clpoints[0]), QPointF(*clpoints[1]))
-            if clkey in self.display_objects:
-                 centerline = self.display_objects[clkey]
-                 centerline.setLine(cline)
-            else:
+            centerline, fresh = pool.acquire(key, CENTERLINE, QGraphicsLineItem)
+            centerline.setLine(cline)
+            if fresh:
                 clpen = QPen(QBrush(QColor(Qt.GlobalColor.white)), VirtualVfr.CENTERLINE_WIDTH, Qt.PenStyle.DashLine)
                 clpen.setWidth(VirtualVfr.CENTERLINE_WIDTH)
-                centerline = self.scene.addLine (cline, clpen)
+                centerline.setPen(clpen)
                 centerline.setX(self.scene.width()/2)
                 centerline.setY(self.scene.height()/2)
-                centerline.setZValue(0)
-                self.display_objects[clkey] = centerline
-                #print ("%s centerline because(%f,%f) %s->%s"%(key, dist1, dist2, clpoints[0], clpoints[1]))
             # Add a runway label, if appropriate
-            lkey = key + label
+            part = RUNWAY_LABEL if label == rwlabels[0] else RECIPROCAL_LABEL
+            pool.release(key, RECIPROCAL_LABEL if part == RUNWAY_LABEL else RUNWAY_LABEL)
             if draw_width > self.min_font_width*1.5:
                 #print ("Runway label will fit underneath runway polygon. font size is %d"%font_size)
                 font_size = self.get_largest_font_size(draw_width)
                 font = QFont(self.font_family, qRound(font_size), QFont.Weight.Bold)
-                label = label[0] + " " + label[1:]
-                if lkey in self.display_objects:
-                    # Update label position
-                    qlabel = self.display_objects[lkey]
-                    qlabel.setFont(font)
-                    qlabel.setX(self.scene.width()/2 + left_bottom[0])
-                    qlabel.setY(self.scene.height()/2 + left_bottom[1])
-                else:
-                    # Create new label
-                    qlabel = self.scene.addSimpleText(label, font)
+                qlabel, fresh = pool.acquire(key, part, QGraphicsSimpleTextItem)
+                if fresh:
+                    qlabel.setText(label[0] + " " + label[1:])
                     qlabel.setPen(QPen(QColor(Qt.GlobalColor.black)))
                     qlabel.setBrush(QBrush(QColor(Qt.GlobalColor.white)))
-                    qlabel.setX(self.scene.width()/2 + left_bottom[0])
-                    qlabel.setY(self.scene.height()/2 + left_bottom[1])
-                    qlabel.setZValue(0)
-                    self.display_objects[lkey] = qlabel
-
-            elif lkey in self.display_objects:
-                #print ("remove runway label")
-                self.scene.removeItem (self.display_objects[lkey])
-                del self.display_objects[lkey]
-            #print ("make or update runway label finished")
-
+                qlabel.setFont(font)
+                qlabel.setX(self.scene.width()/2 + left_bottom[0])
+                qlabel.setY(self.scene.height()/2 + left_bottom[1])
+            else:
+                pool.release(key, part)
         else:
-            if clkey in self.display_objects:
-                self.scene.removeItem (self.display_objects[clkey])
-                del self.display_objects[clkey]
-            rwlabels = self.get_runway_labels (name)
-            for label in rwlabels:
-                lkey = key + label
-                if lkey in self.display_objects:
-                    self.scene.removeItem (self.display_objects[lkey])
-                    del self.display_objects[lkey]
-
+            pool.release(key, CENTERLINE)
+            pool.release(key, RUNWAY_LABEL)
+            pool.release(key, RECIPROCAL_LABEL)
 
         # Add an extended centerline, if appropriate
         bottom_intercept = F(self.scene.height()/2, centerline_function)
-        elkey = key + "_e"
-        pkey = key + "_p"
         if abs(bottom_intercept) < self.scene.width():
             if clpoints[0][1] > clpoints[1][1]:
                 touchdown_point = QPointF (*clpoints[0])
@@ -363,17 +487,12 @@ class VirtualVfr(AI):
                 touchdown_point = QPointF (*clpoints[1])
             extended_point = QPointF(bottom_intercept, self.scene.height()/2)
             eline = QLineF(touchdown_point, extended_point)
-            if elkey in self.display_objects:
-                 extendedline = self.display_objects[elkey]
-                 extendedline.setLine(eline)
-            else:
-                extendedline = self.scene.addLine (eline,
-                    QPen(QColor(Qt.GlobalColor.white), int(self.width() * 0.003), Qt.PenStyle.DashLine))
+            extendedline, fresh = pool.acquire(key, EXTENDED_CENTERLINE, QGraphicsLineItem)
+            extendedline.setLine(eline)
+            if fresh:
+                extendedline.setPen(QPen(QColor(Qt.GlobalColor.white), int(self.width() * 0.003), Qt.PenStyle.DashLine))
                 extendedline.setX(self.scene.width()/2)
                 extendedline.setY(self.scene.height()/2)
-                extendedline.setZValue(0)
-                self.display_objects[elkey] = extendedline
-                #print ("%s extendedline %s->%s"%(key, touchdown_point, extended_point))
 
             # Draw PAPI lights
             height_touchdown = self.altitude - elevation
@@ -405,114 +524,72 @@ class VirtualVfr(AI):
             y = left_bottom[1] - VirtualVfr.PAPI_YOFFSET
             x += self.scene.width()/2
             y += self.scene.height()/2
-            wpen = QPen(QColor(Qt.GlobalColor.white))
-            rpen = QPen(QColor(Qt.GlobalColor.red))
-            wbsh = QBrush(QColor(Qt.GlobalColor.white))
-            rbsh = QBrush(QColor(Qt.GlobalColor.red))
-            if pkey in self.display_objects:
-                lights = self.display_objects[pkey]
-            else:
-                lights = list()
+            pls = int(self.width() * 0.008)
+            rect = QRectF (QPointF(- pls,- pls), QPointF(pls,pls))
             for i in range(4):
-                pls = int(self.width() * 0.008)
-                rect = QRectF (QPointF(- pls,- pls), QPointF(pls,pls))
-                pen,bsh = (rpen,rbsh) if papi_redcount > 0 else (wpen,wbsh)
-                light = self.scene.addEllipse (rect, pen, bsh)
+                light, fresh = pool.acquire(key, PAPI + i, QGraphicsEllipseItem)
+                light.setRect(rect)
+                color = Qt.GlobalColor.red if papi_redcount > 0 else Qt.GlobalColor.white
+                if fresh or light.brush().color() != QColor(color):
+                    light.setPen(QPen(QColor(color)))
+                    light.setBrush(QBrush(QColor(color)))
                 light.setX(x)
                 light.setY(y)
-                if len(lights) < i+1:
-                    lights.append(light)
-                else:
-                    self.scene.removeItem (lights[i])
-                    lights[i] = light
                 x += VirtualVfr.PAPI_LIGHT_SPACING
                 papi_redcount -= 1
-                self.display_objects[pkey] = lights
         else:
-            if elkey in self.display_objects:
-                self.scene.removeItem (self.display_objects[elkey])
-                del self.display_objects[elkey]
-            if pkey in self.display_objects:
-                for l in self.display_objects[pkey]:
-                    self.scene.removeItem (l)
-                del self.display_objects[pkey]
+            pool.release(key, EXTENDED_CENTERLINE)
+            for i in range(4):
+                pool.release(key, PAPI + i)
 
 
     def eliminate_runway (self, name, airport_id):
-        key = name+airport_id
-        if key in self.display_objects:
-            self.scene.removeItem (self.display_objects[key])
-            del self.display_objects[key]
-            clkey = key + "_c"
-            if clkey in self.display_objects:
-                self.scene.removeItem (self.display_objects[clkey])
-                del self.display_objects[clkey]
-            elkey = key + "_e"
-            if elkey in self.display_objects:
-                self.scene.removeItem (self.display_objects[elkey])
-                del self.display_objects[elkey]
-            elkey = key + "_e"
-            if elkey in self.display_objects:
-                self.scene.removeItem (self.display_objects[elkey])
-                del self.display_objects[elkey]
-            rwlabels = self.get_runway_labels (name)
-            for l in rwlabels:
-                rwlkey = key + l
-                if rwlkey in self.display_objects:
-                    self.scene.removeItem (self.display_objects[rwlkey])
-                    del self.display_objects[rwlkey]
-            pkey = key + "_p"
-            if pkey in self.display_objects:
-                for l in self.display_objects[pkey]:
-                    self.scene.removeItem (l)
-                del self.display_objects[pkey]
-
+        self.scene_items.release_object(name+airport_id, RUNWAY_PARTS)
 
     def render_airport(self, point, name, airport_id, zoom, space_occupied):
-        akey = airport_id
-        if akey in self.display_objects:
-            ap = self.display_objects[akey]
-        else:
+        grid = isinstance(space_occupied, LabelGrid)
+        if grid and not space_occupied.admit():
+            # Over the label budget for this frame
+            self.eliminate_airport(airport_id)
+            return None
+        ap, fresh = self.scene_items.acquire(airport_id, AIRPORT_LABEL, QGraphicsSimpleTextItem)
+        if fresh:
             font = QFont(self.font_family, VirtualVfr.AIRPORT_FONT_SIZE, QFont.Weight.Bold)
-            ap = self.scene.addSimpleText(airport_id, font)
+            ap.setText(airport_id)
+            ap.setFont(font)
             ap.setPen(QPen(QColor(Qt.GlobalColor.blue)))
             ap.setBrush(QBrush(QColor(Qt.GlobalColor.white)))
-            ap.setZValue(0)
-            self.display_objects[akey] = ap
-        rect = ap.boundingRect()
+            # The text never changes so neither does the size of the label
+            self.scene_items.rects[airport_id] = ap.boundingRect()
+        rect = QRectF(self.scene_items.rects[airport_id])
         xoff = self.scene.width()/2 + point[0] - rect.width()/2
-        ap.setX(xoff)
         yoff = self.scene.height()/2 + point[1] - rect.height()/2
-        ap.setY(yoff)
+        ap.setPos(xoff, yoff)
         rect.translate(xoff,yoff)
-        for s in space_occupied:
-            if s.intersects(rect):
-                self.eliminate_airport(airport_id)
-                return None
+        if grid:
+            blocked = space_occupied.intersects(rect)
+        else:
+            blocked = any(s.intersects(rect) for s in space_occupied)
+        if blocked:
+            self.eliminate_airport(airport_id)
+            return None
         return rect
 
     def eliminate_airport(self, airport_id):
-        akey = airport_id
-        if akey in self.display_objects:
-            ap = self.display_objects[akey]
-            self.scene.removeItem(ap)
-            del self.display_objects[akey]
+        self.scene_items.release(airport_id, AIRPORT_LABEL)
 
     def render_navaid(self, point, navaid_id):
-        vkey = navaid_id
-        vlkey = navaid_id + "_l"
-        if vkey in self.display_objects:
-            vtlabel = self.display_objects[vlkey]
-            vticon = self.display_objects[vkey]
-        else:
+        pool = self.scene_items
+        vtlabel, fresh = pool.acquire(navaid_id, NAVAID_LABEL, QGraphicsSimpleTextItem)
+        if fresh:
             font = QFont(self.font_family, VirtualVfr.AIRPORT_FONT_SIZE-2, QFont.Weight.Bold)
-            vtlabel = self.scene.addSimpleText(navaid_id, font)
+            vtlabel.setText(navaid_id)
+            vtlabel.setFont(font)
             vtlabel.setPen(QPen(QColor(Qt.GlobalColor.blue)))
             vtlabel.setBrush(QBrush(QColor(Qt.GlobalColor.white)))
-            vtlabel.setZValue(0)
-            vticon = self.scene.addPixmap (QPixmap (VirtualVfr.VORTAC_ICON_PATH))
-            self.display_objects[vlkey] = vtlabel
-            self.display_objects[vkey] = vticon
+        vticon, fresh = pool.acquire(navaid_id, NAVAID_ICON, QGraphicsPixmapItem)
+        if fresh:
+            vticon.setPixmap(QPixmap (VirtualVfr.VORTAC_ICON_PATH))
         rect = vtlabel.boundingRect()
         xoff = self.scene.width()/2 + point[0] - rect.width()/2
         vtlabel.setX(xoff)
@@ -526,17 +603,13 @@ class VirtualVfr(AI):
         vticon.setY(yoff)
 
     def eliminate_navaid(self, navaid_id):
-        vkey = navaid_id
-        vlkey = navaid_id + "_l"
-        if vkey in self.display_objects:
-            self.scene.removeItem (self.display_objects[vkey])
-            self.scene.removeItem (self.display_objects[vlkey])
-            del self.display_objects[vkey]
-            del self.display_objects[vlkey]
+        self.scene_items.release_object(navaid_id, (NAVAID_LABEL, NAVAID_ICON))
 
     def setLatitude(self, lat):
         self.lat = lat
         self.missing_lat = False
+        if self.suspended:
+            return
         #print ("New latitude %f"%self.lat)
         self.pov.update_position (self.lat, self.lng)
         if not self.rendering_prohibited():
@@ -546,6 +619,8 @@ class VirtualVfr(AI):
     def setLongitude(self, lng):
         self.lng = lng
         self.missing_lng = False
+        if self.suspended:
+            return
         #print ("New longitude %f"%self.lng)
         self.pov.update_position (self.lat, self.lng)
         if not self.rendering_prohibited():
@@ -554,12 +629,20 @@ class VirtualVfr(AI):
 
     def setAltitude(self, alt):
         self.altitude = alt
+        if self.suspended:
+            return
         self.pov.update_altitude (alt)
         self.pov.update_position (self.lat, self.lng)
         if not self.rendering_prohibited():
             self.pov.render(self)
             self.update()
+    def setGroundSpeed(self, gs):
+        self.pov.update_groundspeed(gs)
+
     def setHeading(self, heading):
+        self.true_heading = heading
+        if self.suspended:
+            return
         self.pov.update_heading (heading)
         if not self.rendering_prohibited():
             #log.debug("Rendering")
@@ -672,19 +755,126 @@ class VirtualVfr(AI):
     def rendering_prohibited(self):
         return self.getVfrFail() or self.getVfrBad() or self.getVfrOld()
 
+    def closeEvent(self, event):
+        if self.pov is not None:
+            self.pov.stop_loader()
+        super(VirtualVfr, self).closeEvent(event)
+
+    # Position, altitude and heading updates are only recorded while
+    # suspended, the view is brought up to date with them on resume
+    def resume(self):
+        super(VirtualVfr, self).resume()
+        if self.pov is None:
+            return
+        self.pov.update_altitude (self.altitude)
+        self.pov.update_heading (self.true_heading)
+        self.pov.update_position (self.lat, self.lng)
+        self.redrawView()
+
+    def redrawView(self):
+        if not self.rendering_prohibited():
+            self.pov.render(self)
+            self.update()
+
     def setBlank(self, b):
-        if self.rendering_prohibited() and len(self.display_objects) > 0:
-            for key in self.display_objects.keys():
-                # The lights seem to be stored in a list 
-                if isinstance(self.display_objects[key],list):
-                    for delobj in self.display_objects[key]:
-                        self.scene.removeItem(delobj)
-                else:
-                    self.scene.removeItem(self.display_objects[key])
-            self.display_objects = dict()
+        if self.rendering_prohibited() and self.scene_items is not None:
+            self.scene_items.release_all()
 
 VIEWPORT_ANGLE100 = 35.0 / 2.0 * RAD_DEG
 
+# How far ahead on the current track blocks of CIFP objects are loaded
+PREFETCH_SECONDS = 300
+
+def pair_runways(runways):
+    """ Pair up the two ends of each runway in a list of (block, runway)
+        tuples. Returns the second ends of the pairs that were found and
+        the runways that could not be paired.
+    """
+    runways = list(runways)
+    partners = list()
+    unmatched = list()
+    while runways:
+        block, rwsearch = runways.pop(0)
+        for i,(other_block, o) in enumerate(runways):
+            try:
+                # Try is hack to prevent exception
+                # Sometimes the runway is empty string
+                # pyavtools/CIFPObjects.py", line 258, in match
+                #  rwnum = int(label)
+                # ValueError: invalid literal for int() with base 10: ''
+                if rwsearch.match(o):
+                    partners.append((other_block, o))
+                    del runways[i]
+                    break
+            except:
+                pass
+        else:
+            unmatched.append((block, rwsearch))
+    return partners, unmatched
+
+def remove_object(olist, obj):
+    for i, o in enumerate(olist):
+        if o is obj:
+            del olist[i]
+            return
+
+class TileWorker(QObject):
+    loaded = pyqtSignal(object, object)
+
+    def __init__(self, dbpath, index_path):
+        super(TileWorker, self).__init__()
+        self.dbpath = dbpath
+        self.index_path = index_path
+
+    def load(self, block):
+        objects = CIFPObjects.find_objects(self.dbpath, self.index_path, block[0], block[1])
+        # Runways with both ends in this block can be paired here, the
+        # ones left over are paired against the other blocks in the GUI thread
+        runways = [(block, o) for o in objects
+                   if isinstance(o, CIFPObjects.Runway) and not o.matched()]
+        partners, unmatched = pair_runways(runways)
+        for b, o in partners:
+            remove_object(objects, o)
+        self.loaded.emit(block, objects)
+
+class TileLoader(QObject):
+    """ Loads blocks of CIFP objects in a background thread so the disk reads
+        don't hold up the GUI. Finished blocks come back to the GUI thread
+        through the queued loaded signal.
+    """
+    requested = pyqtSignal(object)
+
+    def __init__(self, dbpath, index_path, callback):
+        super(TileLoader, self).__init__()
+        self.callback = callback
+        self.pending = set()
+        self.thread = QThread()
+        self.worker = TileWorker(dbpath, index_path)
+        self.worker.moveToThread(self.thread)
+        self.requested.connect(self.worker.load)
+        self.worker.loaded.connect(self.tileLoaded)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+        self.thread.start()
+
+    def request(self, block):
+        if block not in self.pending:
+            self.pending.add(block)
+            self.requested.emit(block)
+
+    def tileLoaded(self, block, objects):
+        self.pending.discard(block)
+        self.callback(block, objects)
+
+    def busy(self):
+        return len(self.pending) > 0
+
+    def stop(self):
+        if self.thread.isRunning():
+            self.thread.quit()
+            self.thread.wait()
+
 class PointOfView:
     sorted_object_types = ["Airport", "Fix"]
     def __init__(self, dbpath, index_path, refresh_period):
@@ -703,11 +893,37 @@ class PointOfView:
 
         # Computed State
         self.view_screen = None
+        self.view_matrix = None
+        self.projected = None
+        # Blocks of objects by (lat, lng) degree in least recently used order
         self.object_cache = dict()
+        self.tile_cache_size = 9
+        # Placed labels, reused from frame to frame
+        self.label_grid = LabelGrid()
         self.elevation = 0
         self.last_time = None
         self.last_cache_time = None
         self.do_render = False
+        # Updates skipped by the refresh periods are caught up once the
+        # period runs out, then redraw() lets the display render them
+        self.redraw = None
+        self.screen_throttle = helpers.Throttle(self.deferred_update)
+        self.cache_throttle = helpers.Throttle(self.deferred_update)
+        # Background loading, blocks are held in loaded_tiles until all
+        # requested ones are in so runways can be paired across blocks
+        self.loader = None
+        self.loaded_tiles = dict()
+        self.groundspeed = 0
+        self.prefetch_blocks = set()
+
+    def start_loader(self):
+        if self.loader is None:
+            self.loader = TileLoader(self.dbpath, self.index_path, self.tile_loaded)
+
+    def stop_loader(self):
+        if self.loader is not None:
+            self.loader.stop()
+            self.loader = None
 
     def initialize(self, show_what, display_width, lng, lat, alt, head):
         self.display_width = display_width
@@ -723,6 +939,13 @@ class PointOfView:
         self.elevation = self.approximate_elevation()
         self.update_screen()
 
+    def resize(self, display_width):
+        # The view screen distance depends on the width so build it again
+        # now rather than waiting for the refresh period
+        self.display_width = display_width
+        self.last_time = None
+        self.update_screen()
+
     def dont_show(self, what):
         if isinstance(what,list) or isinstance(what,set):
             self.show_object_types.difference_update(what)
@@ -739,13 +962,20 @@ class PointOfView:
     def update_altitude(self, alt):
         self.altitude = alt
 
+    def update_groundspeed(self, gs):
+        self.groundspeed = gs
+
     def update_heading(self, true_heading):
         self.true_heading = true_heading
         self.update_screen()
 
+    def deferred_update(self):
+        self.update_position(self.gps_lat, self.gps_lng)
+        if self.do_render and self.redraw is not None:
+            self.redraw()
+
     def update_screen(self):
-        if self.last_time is not None and \
-                (time.time() - self.last_time < self.refresh_period):
+        if not self.screen_throttle.allow(self.last_time, self.refresh_period):
             return
         earth_radius = EARTH_RADIUS + self.elevation
         pov_radius = EARTH_RADIUS + self.altitude
@@ -807,85 +1037,102 @@ class PointOfView:
         xvec.div(xvec.norm())
         yvec = view_vector.cross_product(xvec)
         self.view_screen = Spatial.Screen(viewplane, self.pov_position, xvec=xvec, yvec=yvec)
+        self.build_view_matrix()
         self.last_time = time.time()
         self.do_render = True
         #print ("new view screen %s"%str(self.view_screen))
 
-    def update_cache(self):
-        if self.last_cache_time is not None and \
-                (time.time() - self.last_cache_time < self.cache_refresh_period):
-            return
-        center_lat = int(self.gps_lat)
-        center_lng = int(self.gps_lng)
+    def cache_window(self, lat=None, lng=None):
+        # The 1 degree blocks around the aircraft, the cache is a grid index
+        # keyed on these so only nearby objects need to be looked at
+        center_lat = int(self.gps_lat if lat is None else lat)
+        center_lng = int(self.gps_lng if lng is None else lng)
         for lat_inc in range(-1,2,1):
             for lng_inc in range(-1,2,1):
-                block = (center_lat + lat_inc, center_lng + lng_inc)
-                if not block in self.object_cache:
-                    self.object_cache[block] = CIFPObjects.find_objects(
-                                    self.dbpath, self.index_path, block[0], block[1])
-                    #print ("New cache block has %d objects at %f,%f"%(len(self.object_cache[block]), self.gps_lat, self.gps_lng))
-        # Match runways
-        self.last_cache_time = time.time()
-        while True:
-            rwsearch = None
-            rwsearchblock = None
-            rwsearchnum = -1
-            rwdelete = -1
-            rwdeleteblock = None
-            for block,olist in self.object_cache.items():
-                for i,o in enumerate(olist):
-                    if isinstance(o, CIFPObjects.Runway) and (not o.matched()):
-                        if rwsearch is None:
-                            rwsearch = o
-                            rwsearchblock = block
-                            rwsearchnum = i
-                            #print ("Search match for %s"%str(o))
-                        else:
-                            try:
-                                # Try is hack to prevent exception
-                                # Sometimes the runway is empty string
-                                # pyavtools/CIFPObjects.py", line 258, in match
-                                #  rwnum = int(label)
-                                # ValueError: invalid literal for int() with base 10: ''                          
-
-                                if rwsearch.match(o):
-                                    rwdelete = i
-                                    rwdeleteblock = block
-                                    rwsearch = None
-                                    break
-                                else:
-                                    #print ("Mis match for %s"%str(o))
-                                    pass
-                            except:
-                              #log.debug("runway empty catch")
-                              pass
-                if rwdeleteblock is not None:
-                    break
-            if rwdeleteblock is not None:
-                del self.object_cache[rwdeleteblock][rwdelete]
+                yield (center_lat + lat_inc, center_lng + lng_inc)
+
+    def visible_objects(self):
+        for block in self.cache_window():
+            olist = self.object_cache.get(block)
+            if olist:
+                yield from olist
+
+    def update_cache(self):
+        if not self.cache_throttle.allow(self.last_cache_time, self.cache_refresh_period):
+            return
+        loaded = False
+        for block in self.cache_window():
+            if block in self.object_cache:
+                # Most recently used blocks go to the end of the cache
+                self.object_cache[block] = self.object_cache.pop(block)
+            elif self.loader is not None:
+                self.loader.request(block)
             else:
-                if rwsearch is None:
-                    break
-                else:
-                    log.debug ("Unable to find match for %s"%str(rwsearch))
-                    del self.object_cache[rwsearchblock][rwsearchnum]
+                self.object_cache[block] = CIFPObjects.find_objects(
+                                self.dbpath, self.index_path, block[0], block[1])
+                loaded = True
+        self.last_cache_time = time.time()
+        self.prefetch()
+        # Blocks already in the cache have had their runways paired, so this
+        # only needs doing when new blocks come in
+        if loaded:
+            self.match_runways()
         self.garbage_collect_cache()
 
+    def prefetch(self):
+        # Load the blocks around where the aircraft will be in
+        # PREFETCH_SECONDS on the current track so they are ready in time
+        self.prefetch_blocks = set()
+        if self.loader is None or not self.groundspeed or self.groundspeed <= 0:
+            return
+        distance = self.groundspeed * PREFETCH_SECONDS / 3600.0 / 60.0
+        track = self.true_heading * RAD_DEG
+        lat = self.gps_lat + distance * math.cos(track)
+        if abs(lat) >= 90:
+            return
+        lng = self.gps_lng + distance * math.sin(track) / GetRelLng(lat * RAD_DEG)
+        self.prefetch_blocks = set(self.cache_window(lat, lng))
+        for block in self.prefetch_blocks:
+            if block not in self.object_cache and block not in self.loaded_tiles:
+                self.loader.request(block)
+
+    def tile_loaded(self, block, objects):
+        self.loaded_tiles[block] = objects
+        if self.loader is not None and self.loader.busy():
+            return
+        self.object_cache.update(self.loaded_tiles)
+        self.loaded_tiles = dict()
+        self.match_runways()
+        self.garbage_collect_cache()
+        self.elevation = self.approximate_elevation()
+        self.do_render = True
+        if self.redraw is not None:
+            self.redraw()
+
+    def match_runways(self):
+        # Pair up the two ends of each runway. The second end of a pair and
+        # any runway that has no partner are removed from the cache.
+        unmatched = list()
+        for block,olist in self.object_cache.items():
+            for o in olist:
+                if isinstance(o, CIFPObjects.Runway) and (not o.matched()):
+                    unmatched.append((block, o))
+        partners, unmatched = pair_runways(unmatched)
+        for block, o in unmatched:
+            log.debug ("Unable to find match for %s"%str(o))
+        for block, o in partners + unmatched:
+            remove_object(self.object_cache[block], o)
 
     def garbage_collect_cache(self):
-        center_lat = int(self.gps_lat)
-        center_lng = int(self.gps_lng)
-        keeplist = list()
-        for lat_inc in range(-1,2,1):
-            for lng_inc in range(-1,2,1):
-                block = (center_lat + lat_inc, center_lng + lng_inc)
-                keeplist.append(block)
-        purge_list = list()
-        for cacheline in self.object_cache.keys():
-            if not cacheline in keeplist:
-                purge_list.append(cacheline)
-        for p in purge_list:
-            del self.object_cache[p]
+        # Drop the least recently used blocks, never the ones in view or
+        # the ones just loaded ahead of the aircraft
+        keep = set(self.cache_window()) | self.prefetch_blocks
+        capacity = max(self.tile_cache_size, len(keep))
+        for block in list(self.object_cache.keys()):
+            if len(self.object_cache) <= capacity:
+                break
+            if block not in keep:
+                del self.object_cache[block]
 
     def approximate_elevation(self):
         """ Find the approximate elevation of the land beneath the aircraft by
@@ -896,46 +1143,117 @@ class PointOfView:
         elevation = 0
         rel_lng = 0
         curpos = (self.gps_lng,self.gps_lat)
-        for object_list in self.object_cache.values():
-            for obj in object_list:
-                if isinstance(obj, CIFPObjects.Runway):
-                    course = [curpos, (obj.lng,obj.lat)]
-                    distance, rel_lng = \
-                            Distance(course, rel_lng=rel_lng)
-                    if distance < min_distance:
-                        min_distance = distance
-                        elevation = obj.elevation
+        for obj in self.visible_objects():
+            if isinstance(obj, CIFPObjects.Runway):
+                course = [curpos, (obj.lng,obj.lat)]
+                distance, rel_lng = \
+                        Distance(course, rel_lng=rel_lng)
+                if distance < min_distance:
+                    min_distance = distance
+                    elevation = obj.elevation
         return elevation
 
     def render(self, display_object):
         if not self.do_render:
             return
+        # Project the reference point of everything in view in one pass,
+        # point2D() looks the results up while the objects render
+        self.projected = self.project_objects(self.visible_objects())
         sorted_objects = list()
-        for oblist in self.object_cache.values():
-            for ob in oblist:
-                if ob.typestr() in self.show_object_types:
-                    if ob.typestr() in self.sorted_object_types:
-                        sorted_objects.append (ob)
-                    else:
-                        ob.render (self, display_object, self.display_width,
-                                    (self.gps_lng, self.gps_lat))
+        for ob in self.visible_objects():
+            if ob.typestr() in self.show_object_types:
+                if ob.typestr() in self.sorted_object_types:
+                    sorted_objects.append (ob)
+                else:
+                    ob.render (self, display_object, self.display_width,
+                                (self.gps_lng, self.gps_lat))
         rel_lng = GetRelLng(self.gps_lat)
         sorted_objects = [(Distance( [(self.gps_lng, self.gps_lat), (so.lng,so.lat)],
                                     rel_lng)[0], so) for so in sorted_objects]
-        sorted_objects.sort()
-        space_occupied = list()
+        sorted_objects.sort(key=lambda dso: dso[0])
+        space_occupied = self.label_grid
+        space_occupied.clear()
         for d,so in sorted_objects:
             rect = so.render (self, display_object, self.display_width,
                                     (self.gps_lng, self.gps_lat), space_occupied)
             if rect is not None:
-                space_occupied.append(rect)
+                space_occupied.add(rect)
 
+        self.projected = None
         self.do_render = False
 
+    def build_view_matrix(self):
+        # Reduce the view screen to plain numbers so points can be projected
+        # without building Spatial objects for each one. The screen is kept
+        # with it so the matrix is only used for the screen it came from.
+        vs = self.view_screen
+        pov = self.pov_position
+        normal = vs.plane.normal
+        xdir = vs.x.dir
+        ydir = vs.y.dir
+        offset = Spatial.Vector(ref=pov)
+        offset.sub(vs.x.org)
+        self.view_matrix = (vs,
+            (pov.x, pov.y, pov.z),
+            (normal.x, normal.y, normal.z),
+            (xdir.x, xdir.y, xdir.z),
+            (ydir.x, ydir.y, ydir.z),
+            vs.plane.c - normal.dot_product(pov),
+            offset.dot_product(xdir),
+            offset.dot_product(ydir))
+
+    def project(self, points):
+        """ Project a list of (lat, lng) points on to the view screen. Returns
+            a list of (x, y) screen points, None for the ones that can't be seen.
+        """
+        (vs, (ox, oy, oz), (nx, ny, nz), (xx, xy, xz), (yx, yy, yz),
+            k, ax, ay) = self.view_matrix
+        point_radius = EARTH_RADIUS + self.elevation
+        ret = list()
+        for lat, lng in points:
+            phi = lat * RAD_DEG
+            theta = lng * RAD_DEG
+            rcos_phi = point_radius * math.cos(phi)
+            vx = rcos_phi * math.cos(theta) - ox
+            vy = rcos_phi * math.sin(theta) - oy
+            vz = point_radius * math.sin(phi) - oz
+            # The ray from the pilot to the point meets the screen at
+            # pov + t * v, t has to be positive for the point to be in front
+            vn = vx * nx + vy * ny + vz * nz
+            if vn == 0 or (vx == 0 and vy == 0 and vz == 0):
+                ret.append(None)
+                continue
+            t = k / vn
+            if t < 0:
+                ret.append(None)
+                continue
+            ret.append((ax + t * (vx * xx + vy * xy + vz * xz),
+                        ay + t * (vx * yx + vy * yy + vz * yz)))
+        return ret
+
+    def project_objects(self, objects):
+        if self.view_matrix is None or self.view_matrix[0] is not self.view_screen:
+            return None
+        points = list()
+        for ob in objects:
+            points.append((ob.lat, ob.lng))
+            other_end = getattr(ob, 'opposing_rw', None)
+            if other_end is not None:
+                points.append((other_end.lat, other_end.lng))
+        return dict(zip(points, self.project(points)))
+
     def point2D (self, lat, lng, debug=False):
         """ Find the projected point on the view screen given a latitude and longitude
             of the point.
         """
+        if self.view_matrix is not None and self.view_matrix[0] is self.view_screen:
+            if self.projected is not None and (lat, lng) in self.projected:
+                p = self.projected[(lat, lng)]
+            else:
+                p = self.project([(lat, lng)])[0]
+            if debug:
+                log.debug ("point2D %f,%f ==> %s"%(lat, lng, str(p)))
+            return p
         point_radius = EARTH_RADIUS + self.elevation
         point_polar = Spatial.Polar (lng * RAD_DEG, lat * RAD_DEG, point_radius)
         point_position = point_polar.to3()
@@ -18,12 +18,15 @@ from PyQt6.QtGui import *
 from PyQt6.QtCore import *
 from PyQt6.QtWidgets import *
 
+import bisect
 import math
 import time
 import logging
 
 import pyavtools.fix as fix
+from pyefis import fixhub
 from pyefis import common
+from pyefis import gui
 
 log = logging.getLogger(__name__)
 
@@ -39,6 +42,8 @@ class AI(QGraphicsView):
     def __init__(self, parent=None,font_percent=None, font_family="DejaVu Sans Condensed"):
         super(AI, self).__init__(parent)
         self.myparent = parent
+        # Set while the screen is hidden
+        self.suspended = False
         self.font_family = font_family
         # The following information is meant to be configurable from the screen
         # definition file
@@ -80,8 +85,7 @@ class AI(QGraphicsView):
             self._AIOld[p] = True
             self._AIBad[p] = True
             self._AIFail[p] = True
-        pitch = fix.db.get_item("PITCH")
-        pitch.valueChanged[float].connect(self.setPitchAngle)
+        pitch = fixhub.subscribe("PITCH", 'value', self.setPitchAngle)
         pitch.oldChanged[bool].connect(self.setAIOldPitch)
         pitch.badChanged[bool].connect(self.setAIBadPitch)
         pitch.failChanged[bool].connect(self.setAIFailPitch)
@@ -89,8 +93,7 @@ class AI(QGraphicsView):
         self._AIBad['PITCH'] = pitch.bad
         self._AIFail['PITCH'] = pitch.fail
         self._pitchAngle = pitch.value
-        roll = fix.db.get_item("ROLL")
-        roll.valueChanged[float].connect(self.setRollAngle)
+        roll = fixhub.subscribe("ROLL", 'value', self.setRollAngle)
         roll.oldChanged[bool].connect(self.setAIOldRoll)
         roll.badChanged[bool].connect(self.setAIBadRoll)
         roll.failChanged[bool].connect(self.setAIFailRoll)
@@ -98,8 +101,7 @@ class AI(QGraphicsView):
         self._AIOld['ROLL'] = roll.old
         self._AIBad['ROLL'] = roll.bad
         self._AIFail['ROLL'] = roll.fail
-        alat = fix.db.get_item("ALAT")
-        alat.valueChanged[float].connect(self.setLateralAcceleration)
+        alat = fixhub.subscribe("ALAT", 'value', self.setLateralAcceleration)
         alat.oldChanged[bool].connect(self.setAIOldLAcc)
         alat.badChanged[bool].connect(self.setAIBadLAcc)
         alat.failChanged[bool].connect(self.setAIFailLAcc)
@@ -107,8 +109,7 @@ class AI(QGraphicsView):
         self._AIBad['ALAT'] = alat.bad
         self._AIFail['ALAT'] = alat.fail
         self._latAccel = alat.value
-        tas = fix.db.get_item("TAS")
-        tas.valueChanged[float].connect(self.setTrueAirspeed)
+        tas = fixhub.subscribe("TAS", 'value', self.setTrueAirspeed)
         tas.oldChanged[bool].connect(self.setAIOldTAS)
         tas.badChanged[bool].connect(self.setAIBadTAS)
         tas.failChanged[bool].connect(self.setAIFailTAS)
@@ -121,9 +122,12 @@ class AI(QGraphicsView):
         # We store all the pitch tick marks and text in a list so that
         # we can adjust the opacity of the items.
         self.pitchItems = []
+        self.pitchAngles = []
+        self.pitchShown = None
 
     def resizeEvent(self, event):
         self.pitchItems = []
+        self.pitchShown = None
         if self.font_percent:
             self.fontSize = qRound(self.width() * self.font_percent)
             self.minorDivWidth = qRound(self.fontSize * 0.3)
@@ -243,6 +247,8 @@ class AI(QGraphicsView):
                 l = self.scene.addLine(left, y, right, y, pen)
                 l.setZValue(1)
                 self.pitchItems.append((i, l))
+        # The items went in from -90 up so the angles are already sorted
+        self.pitchAngles = [each[0] for each in self.pitchItems]
         self.setPitchItems()
 
         # Draws the static overlay stuff to a pixmap
@@ -278,13 +284,26 @@ class AI(QGraphicsView):
     # the pitchItems list contains a tuple that represents all of the tick marks
     # and text of the Pitch graducations.  The first item of the tuple is the angle
     # and the second is the item reference.  We use this to make the tick marks
-    # disappear when they are a certain distance from the current pitch angle
+    # disappear when they are a certain distance from the current pitch angle.
+    # The list is sorted by angle so the visible marks are the slice between
+    # pitchShown, and only the marks moving in or out of it are touched.
     def setPitchItems(self):
-        for each in self.pitchItems:
-            if abs(each[0] - self._pitchAngle) < self.visiblePitchAngle:
-                each[1].setOpacity(self.pitchOpacity)
-            else:
+        low = bisect.bisect_right(self.pitchAngles, self._pitchAngle - self.visiblePitchAngle)
+        high = bisect.bisect_left(self.pitchAngles, self._pitchAngle + self.visiblePitchAngle)
+        if self.pitchShown is None:
+            # New items, set them all
+            for each in self.pitchItems:
                 each[1].setOpacity(0)
+            old_low, old_high = low, low
+        else:
+            old_low, old_high = self.pitchShown
+        for i in range(old_low, old_high):
+            if i < low or i >= high:
+                self.pitchItems[i][1].setOpacity(0)
+        for i in range(low, high):
+            if i < old_low or i >= old_high:
+                self.pitchItems[i][1].setOpacity(self.pitchOpacity)
+        self.pitchShown = (low, high)
 
     def redraw(self):
         self.resetTransform()
@@ -369,11 +388,20 @@ class AI(QGraphicsView):
     def showEvent(self, event):
         self.redraw()
 
+    # The angles are still recorded while suspended, resume catches the
+    # pitch ladder up with them
+    def suspend(self):
+        self.suspended = True
+
+    def resume(self):
+        self.suspended = False
+        self.setPitchItems()
+
     def setRollAngle(self, angle):
         if angle != self._rollAngle and not self.getAIFail():
             self._rollAngle = common.bounds(-180, 180, angle)
             if self.isVisible():
-                self.redraw()
+                gui.scheduleRender(self.redraw)
 
     def getRollAngle(self):
         return self._rollAngle
@@ -398,9 +426,10 @@ class AI(QGraphicsView):
     def setPitchAngle(self, angle):
         if angle != self._pitchAngle and not self.getAIFail():
             self._pitchAngle = common.bounds(-90, 90, angle)
-            self.setPitchItems()
+            if not self.suspended:
+                self.setPitchItems()
             if self.isVisible():
-                self.redraw()
+                gui.scheduleRender(self.redraw)
 
     pitchAngle = property(getPitchAngle, setPitchAngle)
 
@@ -540,6 +569,9 @@ class FDTarget(QGraphicsView):
         self.centerOn (self.w, self.w)
 
     def update(self, fdpitch, fdroll):
+        gui.scheduleRender(self.moveTarget, fdpitch, fdroll)
+
+    def moveTarget(self, fdpitch, fdroll):
         self.move (qRound(self.aicenter.x()), qRound(self.aicenter.y() - fdpitch * self.pixelsPerDeg))
         roll = fdroll * math.pi / 180
         sinroll = math.sin(roll)
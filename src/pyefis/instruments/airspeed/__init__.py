@@ -14,6 +14,7 @@
 #  along with this program; if not, write to the Free Software
 #  Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
 
+import math
 import sys
 import time
 
@@ -22,8 +23,10 @@ from PyQt6.QtCore import *
 from PyQt6.QtWidgets import *
 
 import pyavtools.fix as fix
+from pyefis import fixhub
 import pyefis.hmi as hmi
 from pyefis.instruments.NumericalDisplay import NumericalDisplay
+from pyefis.instruments.tape import TapeScale
 from pyefis.instruments import helpers
 
 
@@ -46,7 +49,7 @@ class Airspeed(QWidget):
         self._airspeed = 0
         self.item = fix.db.get_item("IAS")
         self._airspeed = self.item.value
-        self.item.valueChanged[float].connect(self.setAirspeed)
+        fixhub.subscribe(self.item.key, 'value', self.setAirspeed)
         self.item.oldChanged[bool].connect(self.repaint)
         self.item.badChanged[bool].connect(self.repaint)
         self.item.failChanged[bool].connect(self.repaint)
@@ -68,17 +71,22 @@ class Airspeed(QWidget):
         if self.Vfe is None:
             self.Vfe = 0
 
+        # Pre-rendered dial face, see drawFace()
+        self.face = None
+        self.face_key = None
+
     def getRatio(self):
         # Return X for 1:x specifying the ratio for this instrument
         return 1
 
-    def paintEvent(self, event):
+    def drawFace(self, dial):
+        # Draws the ticks, numbers and V speed arcs.  This is only done when
+        # the size or V speeds change, paintEvent() just draws the result.
         w = self.width()
         h = self.height()
         s = w
         if w > h:
             s = h
-        dial = QPainter(self)
         dial.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw the Black Background
@@ -93,8 +101,6 @@ class Airspeed(QWidget):
         dialPen = QPen(QColor(Qt.GlobalColor.white))
         dialPen.setWidthF(s * 0.01)
 
-        needleBrush = QBrush(QColor(Qt.GlobalColor.white))
-
         vnePen = QPen(QColor(Qt.GlobalColor.red))
         vnePen.setWidthF(s * 0.025)
 
@@ -136,7 +142,6 @@ class Airspeed(QWidget):
         dial.drawArc(inner_rect, qRound(Vs0_angle), qRound(-(Vs0_angle - Vfe_angle)))
         dial.setPen(yellowPen)
         dial.drawArc(dial_rect, qRound(Vno_angle), qRound(-(Vno_angle - Vne_angle)))
-        dial.save()
         dial.setPen(dialPen)
         dial.setFont(f)
         dial.translate(center_x, center_y)
@@ -162,14 +167,24 @@ class Airspeed(QWidget):
             dial.rotate(0.5)
             count += 0.5
 
+    def paintEvent(self, event):
+        w = self.width()
+        h = self.height()
+        key = (w, h, self.devicePixelRatioF(), self.bg_color, self.font_family,
+               self.font_percent, self.Vs, self.Vs0, self.Vno, self.Vne, self.Vfe)
+        if self.face is None or key != self.face_key:
+            self.face = helpers.render_pixmap(w, h, self.drawFace, self.devicePixelRatioF())
+            self.face_key = key
+        dial = QPainter(self)
+        dial.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dial.drawPixmap(0, 0, self.face)
+
         if self.item.fail:
             warn_font = QFont(self.font_family, 30, QFont.Weight.Bold)
-            dial.resetTransform()
             dial.setPen(QPen(QColor(Qt.GlobalColor.red)))
             dial.setBrush(QBrush(QColor(Qt.GlobalColor.red)))
             dial.setFont(warn_font)
             dial.drawText(0, 0, w, h, Qt.AlignmentFlag.AlignCenter, "XXX")
-            dial.restore()
             return
 
         if self.item.old or self.item.bad:
@@ -180,6 +195,7 @@ class Airspeed(QWidget):
             dial.setPen(QPen(QColor(Qt.GlobalColor.white)))
             dial.setBrush(QBrush(QColor(Qt.GlobalColor.white)))
         # Needle Movement
+        radius = int(round(min(w, h) * 0.45))
         needle = QPolygon(
             [QPoint(5, 0), QPoint(0, +5), QPoint(-5, 0), QPoint(0, -(radius - 15))]
         )
@@ -189,6 +205,7 @@ class Airspeed(QWidget):
         else:  # Airspeeds above 30 Knots
             needle_angle = (self._airspeed - 30) * 2.5 + 25
 
+        dial.translate(w / 2, h / 2)
         dial.rotate(needle_angle)
         dial.drawPolygon(needle)
 
@@ -207,8 +224,6 @@ class Airspeed(QWidget):
             dial.drawText (0,0,w,h, Qt.AlignmentFlag.AlignCenter, "OLD")
         """
 
-        dial.restore()
-
     def getAirspeed(self):
         return self._airspeed
 
@@ -273,6 +288,8 @@ class Airspeed_Tape(QGraphicsView):
         self.fontsize = 15
         self.majorDiv = 10
         self.minorDiv = 5
+        # Made on the first resize, later ones only move it
+        self.numerical_display = None
 
     def resizeEvent(self, event):
         if self.font_percent:
@@ -328,33 +345,16 @@ class Airspeed_Tape(QGraphicsView):
         x = self.scene.addRect(r, QPen(Qt.GlobalColor.yellow), QBrush(Qt.GlobalColor.yellow))
         x.setOpacity(self.foregroundOpacity)
 
-        # Draw the little white lines and the text
-        for i in range(self.max, -1, -1):
-            if i % self.majorDiv == 0:
-                l = self.scene.addLine(
-                    0,
-                    (-i * self.pph) + tape_start,
-                    w / 2,
-                    (-i * self.pph) + tape_start,
-                    dialPen,
-                )
-                l.setOpacity(self.foregroundOpacity)
-                t = self.scene.addText(str(i))
-                t.setFont(f)
-                self.scene.setFont(f)
-                t.setDefaultTextColor(QColor(Qt.GlobalColor.white))
-                t.setX(w - t.boundingRect().width())
-                t.setY(((-i * self.pph) + tape_start) - t.boundingRect().height() / 2)
-                t.setOpacity(self.foregroundOpacity)
-            elif i % self.minorDiv == 0:
-                l = self.scene.addLine(
-                    0,
-                    (-i * self.pph) + tape_start,
-                    w / 3,
-                    (-i * self.pph) + tape_start,
-                    dialPen,
-                )
-                l.setOpacity(self.foregroundOpacity)
+        # Draw the little white lines and the text, pph shows 100 knots of
+        # the tape and only the ticks around the airspeed are drawn
+        self.scene.setFont(f)
+        self.tick_font = f
+        self.tick_pen = dialPen
+        step = math.gcd(self.majorDiv, self.minorDiv)
+        self.tape = TapeScale(
+            self.scene, self.max - self.max % step, 0, -step, self.draw_tick, 100
+        )
+        self.tape.scroll(self._airspeed)
         # Red Line
         vnePen = QPen(QColor(Qt.GlobalColor.red))
         vnePen.setWidth(4)
@@ -366,8 +366,15 @@ class Airspeed_Tape(QGraphicsView):
             vnePen,
         )
         l.setOpacity(self.foregroundOpacity)
-
-        self.numerical_display = NumericalDisplay(self)
+        # Keep it over the ticks, they are added as the tape scrolls
+        l.setZValue(1)
+
+        if self.numerical_display is None:
+            self.numerical_display = NumericalDisplay(self)
+            fixhub.subscribe(self.item.key, 'value', self.setAirspeed)
+            fixhub.subscribe(self.item.key, 'old', self.setAsOld)
+            fixhub.subscribe(self.item.key, 'bad', self.setAsBad)
+            fixhub.subscribe(self.item.key, 'fail', self.setAsFail)
         nbh = w / 2
         self.numerical_display.resize(qRound(w / 2), qRound(nbh))
         self.numeric_box_pos = QPoint(qRound(w - w / 2), qRound(h / 2 - nbh / 2))
@@ -381,16 +388,26 @@ class Airspeed_Tape(QGraphicsView):
 
         self.setScene(self.scene)
         self.centerOn(self.scene.width() / 2, -self._airspeed * self.pph + tape_start)
-        self.item.valueChanged[float].connect(self.setAirspeed)
-        self.item.oldChanged[bool].connect(self.setAsOld)
-        self.item.badChanged[bool].connect(self.setAsBad)
-        self.item.failChanged[bool].connect(self.setAsFail)
+
+    def draw_tick(self, tape, i):
+        w = self.width()
+        y = -i * self.pph + self.max * self.pph + self.height() / 2
+        if i % self.majorDiv == 0:
+            tape.line(0, y, w / 2, y, self.tick_pen, self.foregroundOpacity)
+            t = tape.text(
+                str(i), self.tick_font, QColor(Qt.GlobalColor.white), self.foregroundOpacity
+            )
+            t.setX(w - t.boundingRect().width())
+            t.setY(y - t.boundingRect().height() / 2)
+        elif i % self.minorDiv == 0:
+            tape.line(0, y, w / 3, y, self.tick_pen, self.foregroundOpacity)
 
     def redraw(self):
         if not self.isVisible():
             return
         tape_start = self.max * self.pph + self.height() / 2
 
+        self.tape.scroll(self._airspeed)
         self.resetTransform()
         self.centerOn(self.scene.width() / 2, -self._airspeed * self.pph + tape_start)
         self.numerical_display.value = self._airspeed
@@ -21,9 +21,12 @@ from PyQt6.QtCore import *
 from PyQt6.QtWidgets import *
 
 import pyavtools.fix as fix
+from pyefis import fixhub
 
 from pyefis.instruments.NumericalDisplay import NumericalDisplay
+from pyefis.instruments.tape import TapeScale
 import pyefis.hmi as hmi
+from pyefis import gui
 from pyefis.instruments import helpers
 
 
@@ -40,7 +43,7 @@ class Altimeter(QWidget):
         self._altimeter = 0
         self.bg_color = bg_color
         self.item = fix.db.get_item("ALT")
-        self.item.valueChanged[float].connect(self.setAltimeter)
+        fixhub.subscribe(self.item.key, 'value', self.setAltimeter)
         self.item.oldChanged[bool].connect(self.repaint)
         self.item.badChanged[bool].connect(self.repaint)
         self.item.failChanged[bool].connect(self.repaint)
@@ -49,16 +52,19 @@ class Altimeter(QWidget):
         self.conversionFunction2 = lambda x: x
         self.conversionFunction = lambda x: x
 
+        # Pre-rendered dial face, see drawFace()
+        self.face = None
+        self.face_key = None
+
     def getRatio(self):
         # Return X for 1:x specifying the ratio for this instrument
         return 1
 
-    # TODO We continuously draw things that don't change.  Should draw the
-    # background save to pixmap or something and then blit it and draw arrows.
-    def paintEvent(self, event):
+    def drawFace(self, dial):
+        # Draws the ring, ticks and numbers.  This is only done when the size
+        # or data quality changes, paintEvent() just draws the result.
         w = self.width()
         h = self.height()
-        dial = QPainter(self)
         dial.setRenderHint(QPainter.RenderHint.Antialiasing)
         radius = int(round(min(w, h) * 0.45))
         diameter = radius * 2
@@ -70,7 +76,6 @@ class Altimeter(QWidget):
         dialPen = QPen()
         # Setup Pens
         if self.item.old or self.item.bad:
-            warn_font = QFont(self.font_family, 30, QFont.Weight.Bold)
             dialPen.setColor(QColor(Qt.GlobalColor.gray))
             dialBrush = QBrush(QColor(Qt.GlobalColor.gray))
         else:
@@ -113,16 +118,42 @@ class Altimeter(QWidget):
             dial.rotate(7.2)
             count += 7.2
 
+    def paintEvent(self, event):
+        w = self.width()
+        h = self.height()
+        key = (w, h, self.devicePixelRatioF(), self.bg_color, self.font_family,
+               self.item.old or self.item.bad)
+        if self.face is None or key != self.face_key:
+            self.face = helpers.render_pixmap(w, h, self.drawFace, self.devicePixelRatioF())
+            self.face_key = key
+        dial = QPainter(self)
+        dial.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dial.drawPixmap(0, 0, self.face)
+        radius = int(round(min(w, h) * 0.45))
+
         if self.item.fail:
             warn_font = QFont(self.font_family, 30, QFont.Weight.Bold)
-            dial.resetTransform()
             dial.setPen(QPen(QColor(Qt.GlobalColor.red)))
             dial.setBrush(QBrush(QColor(Qt.GlobalColor.red)))
             dial.setFont(warn_font)
             dial.drawText(0, 0, w, h, Qt.AlignmentFlag.AlignCenter, "XXX")
             return
 
+        dialPen = QPen()
+        if self.item.old or self.item.bad:
+            warn_font = QFont(self.font_family, 30, QFont.Weight.Bold)
+            dialPen.setColor(QColor(Qt.GlobalColor.gray))
+            dialBrush = QBrush(QColor(Qt.GlobalColor.gray))
+        else:
+            dialPen.setColor(QColor(Qt.GlobalColor.white))
+            dialBrush = QBrush(QColor(Qt.GlobalColor.white))
+        dialPen.setWidth(2)
+        dial.setPen(dialPen)
         dial.setBrush(dialBrush)
+        dial.translate(w / 2, h / 2)
+        # The minor tick loop in drawFace() ends one tick past 360 degrees,
+        # the needle angles below have always been offset for that.
+        dial.rotate(7.2)
         # Needle Movement
         sm_dial = QPolygonF(
             [QPointF(5, 0), QPointF(0, +5), QPointF(-5, 0), QPointF(0, -(radius - 15))]
@@ -252,13 +283,14 @@ class Altimeter_Tape(QGraphicsView):
         self.conversionFunction1 = lambda x: x
         self.conversionFunction2 = lambda x: x
         self.conversionFunction = lambda x: x
+        # Made on the first resize, later ones only move it
+        self.numerical_display = None
 
     def resizeEvent(self, event):
         if self.font_percent:
             self.fontsize = qRound(self.width() * self.font_percent)
         self.pph = self.height() / 1000
         w = self.width()
-        w_2 = w / 2
         h = self.height()
         f = QFont(self.font_family)
         if self.font_mask:
@@ -287,28 +319,26 @@ class Altimeter_Tape(QGraphicsView):
             QBrush(QColor(32, 32, 32)),
         )
         x.setOpacity(self.backgroundOpacity)
-
-        for i in range(self.maxalt * 2, -1, -self.minorDiv):
-            y = self.y_offset(i)
-            if (i - self.maxalt) % self.majorDiv == 0:
-                l = self.scene.addLine(w_2 + 15, y, w, y, dialPen)
-                l.setOpacity(self.foregroundOpacity)
-                t = self.scene.addText(str(i - self.maxalt))
-                t.setFont(f)
-                self.scene.setFont(f)
-                t.setDefaultTextColor(QColor(Qt.GlobalColor.white))
-                t.setX(0)
-                t.setY(y - t.boundingRect().height() / 2)
-                t.setOpacity(self.foregroundOpacity)
-
-            else:
-                l = self.scene.addLine(w_2 + 30, y, w, y, dialPen)
-                l.setOpacity(self.foregroundOpacity)
+        self.scene.setFont(f)
+
+        # pph shows 1000 ft of the tape, only the ticks around the
+        # altitude are drawn
+        self.tick_font = f
+        self.tick_pen = dialPen
+        self.tape = TapeScale(
+            self.scene, self.maxalt * 2, 0, -self.minorDiv, self.draw_tick, 1000
+        )
+        self.tape.scroll(self._altimeter + self.maxalt)
         self.setScene(self.scene)
 
-        self.numerical_display = NumericalDisplay(
-            self, total_decimals=self.total_decimals, scroll_decimal=2
-        )
+        if self.numerical_display is None:
+            self.numerical_display = NumericalDisplay(
+                self, total_decimals=self.total_decimals, scroll_decimal=2
+            )
+            fixhub.subscribe(self.item.key, 'value', self.setAltimeter)
+            fixhub.subscribe(self.item.key, 'old', self.setAltOld)
+            fixhub.subscribe(self.item.key, 'bad', self.setAltBad)
+            fixhub.subscribe(self.item.key, 'fail', self.setAltFail)
         nbh = w / 1.20
         self.numerical_display.resize(qRound(w / 1.20), qRound(nbh / 1.45))
         self.numeric_box_pos = QPoint(0, qRound(h / 2 - (nbh / 1.45) / 2))
@@ -327,17 +357,30 @@ class Altimeter_Tape(QGraphicsView):
         self.setAltOld(self.item.old)
         self.setAltBad(self.item.bad)
         self.setAltFail(self.item.fail)
-        self.item.valueChanged[float].connect(self.setAltimeter)
-        self.item.oldChanged[bool].connect(self.setAltOld)
-        self.item.badChanged[bool].connect(self.setAltBad)
-        self.item.failChanged[bool].connect(self.setAltFail)
 
     def y_offset(self, alt):
         return self.height_pixel - (alt * self.pph) - self.height()
 
+    def draw_tick(self, tape, i):
+        w = self.width()
+        y = self.y_offset(i)
+        if (i - self.maxalt) % self.majorDiv == 0:
+            tape.line(w / 2 + 15, y, w, y, self.tick_pen, self.foregroundOpacity)
+            t = tape.text(
+                str(i - self.maxalt),
+                self.tick_font,
+                QColor(Qt.GlobalColor.white),
+                self.foregroundOpacity,
+            )
+            t.setX(0)
+            t.setY(y - t.boundingRect().height() / 2)
+        else:
+            tape.line(w / 2 + 30, y, w, y, self.tick_pen, self.foregroundOpacity)
+
     def redraw(self):
         if not self.isVisible():
             return
+        self.tape.scroll(self._altimeter + self.maxalt)
         self.resetTransform()
         self.centerOn(
             self.scene.width() / 2, self.y_offset(self._altimeter + self.maxalt)
@@ -401,7 +444,7 @@ class Altimeter_Tape(QGraphicsView):
         cvalue = self.conversionFunction(altimeter)
         if cvalue != self._altimeter:
             self._altimeter = cvalue
-            self.redraw()
+            gui.scheduleRender(self.redraw)
 
     altimeter = property(getAltimeter, setAltimeter)
 
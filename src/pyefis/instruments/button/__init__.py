@@ -29,24 +29,32 @@ import logging
 import pyavtools.fix as fix
 logger=logging.getLogger(__name__)
 
-import yaml
 import os
 import pathlib
 import re
+from pyefis import cfg
 from pyefis import hmi
+from pyefis import fixhub
 import time
 from pyefis.instruments import helpers
 
 class Button(QWidget):
+    # Condition data that is set on every call to processConditions()
+    VOLATILE_DATA = {'SCREEN', 'CLICKED', 'DBKEY', 'PREVIOUS_CONDITION'}
+    # Style sheets shared by all buttons, by (bg, fg, transparent, border size)
+    style_sheets = dict()
+
     def __init__(self, parent=None, config_file=None, font_family="DejaVu Sans Condensed"):
         super(Button, self).__init__(parent)
 
         self.parent = parent
         self.font_family = font_family
+        # Set while the screen is hidden, conditions are evaluated on resume
+        self.suspended = False
+        self._deferred = False
         self.font_mask = None
         self.font_size = None
-        with open(config_file) as f:
-          config = yaml.load(f, Loader=yaml.SafeLoader)
+        config = cfg.load_yaml(config_file)
         self._conditions = config.get('conditions', [])
         self.config = config
         self._button = QPushButton(self) #self.config['text'], self)
@@ -54,6 +62,10 @@ class Button(QWidget):
         self._style['bg'] = QColor(self.config.get('bg_color',"lightgray"))
         self._style['fg'] = QColor(self.config.get('fg_color',"black"))
         self._style['transparent'] = self.config.get('transparent',False)
+        # What is currently applied to the button, setting a style sheet
+        # or font makes Qt re-polish the button so only do it on changes
+        self._style_key = None
+        self._font_key = None
         self._buttonhide = self.config.get("hover_show", False)
         self._title = ""
         self._toggle = False
@@ -95,6 +107,7 @@ class Button(QWidget):
         self._db_data = dict() #All the fix db data for use in pycond
         self.condition_keys = self.config.get('condition_keys', [])
         self.initDB()
+        self.compileConditions()
         self.setStyle('set text', self.config['text'])
         # On startup set button back to proper state
         self._button.setChecked(self._dbkey.value)
@@ -113,18 +126,8 @@ class Button(QWidget):
         
         # init self._db and connect to signals
         for key in self.condition_keys:
-            self._db[key] = fix.db.get_item(key)
             # Setup connections first
-            self._db[key].valueChanged[bool].connect(lambda valueChanged, key=key, signal='value': self.dataChanged(key=key,signal=signal))
-            self._db[key].valueChanged[int].connect(lambda valueChanged, key=key, signal='value': self.dataChanged(key=key,signal=signal))
-            self._db[key].valueChanged[str].connect(lambda valueChanged, key=key, signal='value': self.dataChanged(key=key,signal=signal))
-            self._db[key].valueChanged[float].connect(lambda valueChanged, key=key, signal='value': self.dataChanged(key=key,signal=signal))
-
-            self._db[key].oldChanged.connect(lambda oldChanged, key=key, signal='old': self.dataChanged(key=key,signal=signal))
-            self._db[key].badChanged.connect(lambda badChanged, key=key, signal='bad': self.dataChanged(key=key,signal=signal))
-            self._db[key].failChanged.connect(lambda failChanged, key=key, signal='fail': self.dataChanged(key=key,signal=signal))
-            self._db[key].annunciateChanged.connect(lambda annunciateChanged, key=key, signal='annunciate': self.dataChanged(key=key,signal=signal))
-            self._db[key].auxChanged.connect(lambda auxChanged, key=key, signal='aux': self.dataChanged(key=key,signal=signal))
+            self._db[key] = fixhub.subscribe(key, 'changed', self.dataChanged)
 
             self._db_data[key] = self._db[key].value
             self._db_data[f"{key}.old"] = self._db[key].old
@@ -153,8 +156,27 @@ class Button(QWidget):
                 self._db_data[f"{key}.aux.{aux}"] = self._db[key].aux[aux]
         else:
             pass
+        if self._compiled_conditions is self._conditions:
+            affected = self._condition_index.get(key)
+            if affected is None:
+                # Nothing uses this key
+                return
+            for i in affected:
+                self._results[i] = None
+        if self.suspended:
+            self._deferred = True
+            return
         self.processConditions()
 
+    def suspend(self):
+        self.suspended = True
+
+    def resume(self):
+        self.suspended = False
+        if self._deferred:
+            self._deferred = False
+            self.processConditions()
+
     def resizeEvent(self,event):
         self._button.resize(self.width(), self.height())
         self.font_size = None
@@ -235,17 +257,49 @@ class Button(QWidget):
         if self._toggle: 
             self._button.setChecked(self._dbkey.value)
 
+    def compileConditions(self):
+        # Parse the conditions once. _condition_index maps each key to the
+        # conditions that use it, in the when expression or in {key} in the
+        # action arguments, so dataChanged() only has to re-evaluate those.
+        # _results holds the last result of each string condition, None
+        # when it needs evaluating.
+        self._compiled = list()
+        self._volatile = list()
+        self._condition_index = dict()
+        # Invalid conditions raise here, so when the button is built
+        for i,cond in enumerate(self._conditions):
+            keys = set()
+            check = None
+            if type(cond.get('when')) == str:
+                tokens = pc.tokenize(cond['when'], sep=' ', brkts='[]')
+                # to_struct() consumes the token list
+                keys.update(t.split('.')[0] for t in tokens)
+                check = pc.pycond(pc.to_struct(tokens))
+            self._compiled.append(check)
+            self._volatile.append(bool(keys & Button.VOLATILE_DATA) or self._dbkey.key in keys)
+            for act in cond.get('actions', []):
+                for args in act.values():
+                    if isinstance(args, str):
+                        keys.update(k.split('.')[0] for k in re.findall(r"{([^}]*)}", args))
+            for key in keys:
+                self._condition_index.setdefault(key, set()).add(i)
+        self._results = [None] * len(self._conditions)
+        self._compiled_conditions = self._conditions
+
     def processConditions(self,clicked=False):
+        if self._compiled_conditions is not self._conditions:
+            self.compileConditions()
         self._db_data['SCREEN'] = self.parent.screenName
         self._db_data['CLICKED'] = clicked
         self._db_data['DBKEY'] = self._dbkey.value 
         self._db_data["PREVIOUS_CONDITION"] = False
         logger.debug(f"{self._dbkey.key}:{self._dbkey.value}")
-        for cond in self._conditions:
+        for i,cond in enumerate(self._conditions):
             if 'when' in cond:
                 if type(cond['when']) == str:
-                    expr = pc.to_struct(pc.tokenize(cond['when'], sep=' ', brkts='[]'))
-                    if pc.pycond(expr)(state=self._db_data) == True:
+                    if self._results[i] is None or self._volatile[i]:
+                        self._results[i] = self._compiled[i](state=self._db_data) == True
+                    if self._results[i]:
                         self._db_data["PREVIOUS_CONDITION"] = True
                         logger.debug(f"{self.parent.parent.getRunningScreen()}:{self._dbkey.key}:{cond['when']} = True")
                         self.processActions(cond['actions'])
@@ -320,12 +374,25 @@ class Button(QWidget):
         else:
             self.font.setPixelSize(qRound(self.height() * 38/100))
         bg_color = self._style.get('bg_override', None) or self._style['bg']
+        style_key = (bg_color.rgba(), self._style['fg'].rgba(), self._style['transparent'], self._style['border_size'])
+        if style_key != self._style_key:
+            self._button.setStyleSheet(self.buildStyleSheet(style_key, bg_color))
+            self._style_key = style_key
+        font_key = (self.font.pointSizeF(), self.font.pixelSize())
+        if font_key != self._font_key:
+            self._button.setFont(self.font)
+            self._font_key = font_key
+
+    def buildStyleSheet(self, style_key, bg_color):
+        sheet = Button.style_sheets.get(style_key)
+        if sheet is not None:
+            return sheet
         if self._style['transparent']:
-            self._button.setStyleSheet(f"QPushButton {{border: 1px solid {bg_color.name()}; background: transparent;border-radius: 6px}}")# border-style: outset; border-width: {self._style['border_size']}px;color:{self._style['fg'].name()}}} QPushButton:pressed {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {self._style['bg'].name()}, stop: 1 {self._style['bg'].lighter(110).name()});border-style:inset}} QPushButton:checked {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {self._style['bg'].name()}, stop: 1 {self._style['bg'].lighter(110).name()});border-style:inset}}")
+            sheet = f"QPushButton {{border: 1px solid {bg_color.name()}; background: transparent;border-radius: 6px}}"# border-style: outset; border-width: {self._style['border_size']}px;color:{self._style['fg'].name()}}} QPushButton:pressed {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {self._style['bg'].name()}, stop: 1 {self._style['bg'].lighter(110).name()});border-style:inset}} QPushButton:checked {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {self._style['bg'].name()}, stop: 1 {self._style['bg'].lighter(110).name()});border-style:inset}}")
         else:
-            self._button.setStyleSheet(f"QPushButton {{border: 2px solid {bg_color.darker(150).name()};border-radius: 10%; background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {bg_color.lighter(130).name()}, stop: 1 {bg_color.name()});border-style: outset; border-width: {self._style['border_size']}px;color:{self._style['fg'].name()}}} QPushButton:pressed {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {bg_color.name()}, stop: 1 {bg_color.lighter(190).name()});border-style:inset}} QPushButton:checked {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {bg_color.name()}, stop: 1 {bg_color.lighter(190).name()});border-style:inset}}")
-
-        self._button.setFont(self.font)
+            sheet = f"QPushButton {{border: 2px solid {bg_color.darker(150).name()};border-radius: 10%; background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {bg_color.lighter(130).name()}, stop: 1 {bg_color.name()});border-style: outset; border-width: {self._style['border_size']}px;color:{self._style['fg'].name()}}} QPushButton:pressed {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {bg_color.name()}, stop: 1 {bg_color.lighter(190).name()});border-style:inset}} QPushButton:checked {{background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {bg_color.name()}, stop: 1 {bg_color.lighter(190).name()});border-style:inset}}"
+        Button.style_sheets[style_key] = sheet
+        return sheet
 
     # This instrument is selectable
     def enc_selectable(self):
@@ -21,6 +21,8 @@ from PyQt6.QtWidgets import *
 import pyavtools.fix as fix
 import pyefis.hmi as hmi
 from pyefis import common
+from pyefis import fixhub
+from pyefis.instruments import helpers
 
 def drawCircle(p, x, y, r, start, end):
     rect = QRectF(x - r, y - r, r * 2, r * 2)
@@ -126,6 +128,13 @@ class AbstractGauge(QWidget):
         self.unitsOverride = None
         self.conversionFunction = lambda x: x
 
+        # The parts of the gauge that do not move with the value (range
+        # bands, segments, labels) are drawn once into this pixmap and
+        # only redrawn when staticKey() changes.
+        self.cache_static = True
+        self._static_pixmap = None
+        self._static_key = None
+
     def interpolate(self, value, range_):
         h = float(range_)
         l = float(self.lowRange)
@@ -197,13 +206,9 @@ class AbstractGauge(QWidget):
         return self._dbkey
 
     def setDbkey(self, key):
-        item = fix.db.get_item(key)
-        item.auxChanged.connect(self.setAuxData)
-        item.reportReceived.connect(self.setupGauge)
-        item.annunciateChanged.connect(self.annunciateFlag)
-        item.oldChanged.connect(self.oldFlag)
-        item.badChanged.connect(self.badFlag)
-        item.failChanged.connect(self.failFlag)
+        fixhub.subscribe(key, 'aux', self.setAuxData)
+        fixhub.subscribe(key, 'report', self.setupGauge)
+        fixhub.subscribe(key, 'quality', self.qualityChanged)
 
         self._dbkey = key
         if not self.encoder_set_key:
@@ -346,6 +351,38 @@ class AbstractGauge(QWidget):
 
         self.update()
 
+    def staticKey(self):
+        """Returns a tuple of everything drawStatic() depends on.  Subclasses
+           extend this with their own layout properties"""
+        return (self.width(), self.height(), self.devicePixelRatioF(),
+                self.lowRange, self.highRange, self.lowWarn, self.lowAlarm,
+                self.highWarn, self.highAlarm, self.name, self.units,
+                self.font_family, self.font_ghost_alpha,
+                self.safeColor.rgba(), self.warnColor.rgba(),
+                self.alarmColor.rgba(), self.textColor.rgba())
+
+    def drawStatic(self, p):
+        """Draws the parts of the gauge that do not depend on the value"""
+        pass
+
+    def invalidateStatic(self):
+        self._static_pixmap = None
+        self._static_key = None
+
+    def paintStatic(self, p):
+        # Draw the static layer, rebuilding the cached pixmap if needed
+        if not self.cache_static:
+            self.drawStatic(p)
+            return
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        key = self.staticKey()
+        if self._static_pixmap is None or key != self._static_key:
+            self._static_pixmap = helpers.render_pixmap(self.width(), self.height(),
+                self.drawStatic, self.devicePixelRatioF())
+            self._static_key = key
+        p.drawPixmap(0, 0, self._static_pixmap)
+
     def annunciateFlag(self, flag):
         self.annunciate = flag
         self.setColors()
@@ -366,6 +403,10 @@ class AbstractGauge(QWidget):
         self.old = flag
         self.setColors()
 
+    def qualityChanged(self, flag, state):
+        # flag is one of old, bad, fail or annunciate
+        getattr(self, flag + "Flag")(state)
+
     def resetPeak(self):
         self.peakValue = self.value
         self.update()
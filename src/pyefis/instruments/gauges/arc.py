@@ -36,6 +36,7 @@ class ArcGauge(AbstractGauge):
         self.segments = 0
         self.segment_gap_percent = 0.01
         self.segment_alpha = 180
+        self._fonts = dict()
 
     def get_height(self, width):
         return width/ 2
@@ -48,6 +49,7 @@ class ArcGauge(AbstractGauge):
         return 2
 
     def resizeEvent(self, event):
+        self._fonts.clear()
         #Properly pick a center and arc that will fit the area defined
         if self.width() < self.height():
             self.r_height = self.get_height(self.width())
@@ -94,7 +96,26 @@ class ArcGauge(AbstractGauge):
                 # Should we throw exception or log error here?
                 pass 
         
-    def paintEvent(self, e):
+    def staticKey(self):
+        return super(ArcGauge, self).staticKey() + (
+            self.startAngle, self.sweepAngle, self.name_location,
+            self.segments, self.segment_gap_percent, self.nameFontSize,
+            self.name_font_mask, self.name_font_ghost_mask)
+
+    def getFont(self, size, points):
+        # QFont and QFontMetrics are expensive to build so we keep the few
+        # sizes used by this gauge around until the next resize
+        key = (self.font_family, size, points)
+        if key not in self._fonts:
+            f = QFont(self.font_family)
+            if points:
+                f.setPointSizeF(size)
+            else:
+                f.setPixelSize(int(size))
+            self._fonts[key] = (f, QFontMetrics(f))
+        return self._fonts[key]
+
+    def drawStatic(self, p):
         start = self.startAngle
         sweep = self.sweepAngle
         r = self.arcRadius
@@ -119,9 +140,6 @@ class ArcGauge(AbstractGauge):
             if highAlarmAngle > sweep: highAlarmAngle = sweep
         else:
             highAlarmAngle = sweep
-        centerX = self.arcCenter.x()
-        centerY = self.arcCenter.y()
-        p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         pen = QPen()
         pen.setWidth(qRound(self.r_height * 0.18))
@@ -160,42 +178,14 @@ class ArcGauge(AbstractGauge):
                 ds = start + ((segment + 1) * segment_size) + (segment * segment_gap)
                 drawCircle(p, self.arcCenter.x(), self.arcCenter.y(), r,
                 ds, segment_gap)
-        # Now we draw the line pointer
-        valAngle = 90 + self.interpolate(self._value, sweep)
-        t = QTransform()
-        t.translate(self.arcCenter.x(), self.arcCenter.y())
-        t.rotate(valAngle)
-        arrow = t.map(self.arrow)
-        #if not self.segments > 0:
-        if self.segments > 0:
-            pen.setWidth(qRound(self.r_height * 0.2))
-            pen.setCapStyle(Qt.PenCapStyle.FlatCap)
-            pen.setColor(QColor(0, 0, 0, self.segment_alpha))
-            p.setPen(pen)
-            p.setBrush(QColor(0, 0, 0, self.segment_alpha))
-            drawCircle(p, self.arcCenter.x(), self.arcCenter.y(), r,
-            180+90-valAngle,-(180+90-valAngle-45+1))
-
-
-        brush = QBrush(self.penColor)
-        pen.setColor(QColor(Qt.GlobalColor.black))
-        pen.setWidth(1)
-        p.setPen(pen)
-        p.setBrush(brush)
-        p.drawPolygon(arrow)
 
         # Draw Text
         pen.setColor(self.textColor)
         pen.setWidth(1)
         p.setPen(pen)
-        f = QFont(self.font_family)
         #f.setPixelSize(qRound(self.r_height / 2))
         y = self.r_height / 2
-        if self.name_font_mask:
-            f.setPointSizeF(self.nameFontSize)
-        else:
-            f.setPixelSize(int(self.nameFontSize))
-        fm = QFontMetrics(f)
+        f, fm = self.getFont(self.nameFontSize, bool(self.name_font_mask))
         if self.name_font_mask:
             if self.name_font_ghost_mask:
                 x = fm.horizontalAdvance(self.name_font_ghost_mask)
@@ -246,6 +236,40 @@ class ArcGauge(AbstractGauge):
         else:
             # Should we throw exception or log error here?
             pass
+
+    def paintEvent(self, e):
+        sweep = self.sweepAngle
+        r = self.arcRadius
+        p = QPainter(self)
+        # Range arcs, segments and the name come from the cached layer
+        self.paintStatic(p)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen()
+        pen.setCapStyle(Qt.PenCapStyle.FlatCap)
+
+        # Now we draw the line pointer
+        valAngle = 90 + self.interpolate(self._value, sweep)
+        t = QTransform()
+        t.translate(self.arcCenter.x(), self.arcCenter.y())
+        t.rotate(valAngle)
+        arrow = t.map(self.arrow)
+        #if not self.segments > 0:
+        if self.segments > 0:
+            pen.setWidth(qRound(self.r_height * 0.2))
+            pen.setColor(QColor(0, 0, 0, self.segment_alpha))
+            p.setPen(pen)
+            p.setBrush(QColor(0, 0, 0, self.segment_alpha))
+            drawCircle(p, self.arcCenter.x(), self.arcCenter.y(), r,
+            180+90-valAngle,-(180+90-valAngle-45+1))
+
+
+        brush = QBrush(self.penColor)
+        pen.setColor(QColor(Qt.GlobalColor.black))
+        pen.setWidth(1)
+        p.setPen(pen)
+        p.setBrush(brush)
+        p.drawPolygon(arrow)
+
         # Main value text
         if self.font_mask:
             opt = QTextOption(Qt.AlignmentFlag.AlignRight)
@@ -260,14 +284,10 @@ class ArcGauge(AbstractGauge):
 
         #f.setPixelSize(qRound(self.r_height / 2.6))
         if self.font_mask:
-            f.setPointSizeF(self.valueFontSize)
-        else:
-            f.setPixelSize(qRound(self.r_height / 2))
-
-        fm = QFontMetrics(f)
-        if self.font_mask:
+            f, fm = self.getFont(self.valueFontSize, True)
             x = fm.horizontalAdvance(self.font_mask)
         else:
+            f, fm = self.getFont(qRound(self.r_height / 2), False)
             x = fm.horizontalAdvance(self.valueText)
         ux = 0
         if self.show_units:
@@ -275,16 +295,18 @@ class ArcGauge(AbstractGauge):
             #f.setPointSizeF(self.valueFontSize/2)
             #fmu = QFontMetrics(f)
             if self.units_font_mask:
-                f.setPointSizeF(self.unitsFontSize)
-                fmu = QFontMetrics(f)
+                f, fmu = self.getFont(self.unitsFontSize, True)
                 ux = fmu.horizontalAdvance(self.units_font_mask)
             else:
                 #f.setPointSizeF(self.valueFontSize/2)
-                f.setPixelSize(qRound(self.height() / 4))
-                fmu = QFontMetrics(f)
+                f, fmu = self.getFont(qRound(self.height() / 4), False)
                 ux = fmu.horizontalAdvance(self.units)
             uy = fmu.ascent() - fmu.descent()
             #path.addText(QPointF( self.lrcx - ux, self.lrcy - uy),f, self.units)
+            # The units are measured in their own font but drawn in the
+            # name font the painter was left with before the static layer
+            # was cached
+            p.setFont(self.getFont(self.nameFontSize, bool(self.name_font_mask))[0])
             if self.units_font_ghost_mask:
                 alpha = self.valueColor.alpha()
                 self.valueColor.setAlpha(self.font_ghost_alpha)
@@ -298,9 +320,9 @@ class ArcGauge(AbstractGauge):
             p.drawText(QPointF( self.lrcx - ux, self.lrcy - uy), self.units)
 
         if self.font_mask:
-            f.setPointSizeF(self.valueFontSize)
+            f, fm = self.getFont(self.valueFontSize, True)
         else:
-            f.setPixelSize(qRound(self.height() / 2))
+            f, fm = self.getFont(qRound(self.height() / 2), False)
         #f.setPointSizeF(self.valueFontSize)
         #f.setPointSizeF(self.valueFontSize)
         p.setFont(f)
@@ -60,8 +60,14 @@ class HorizontalBar(AbstractGauge):
         self.valueTextRect = QRectF(1, self.section_size * 8,
                                     self.width()-5, self.section_size * 4)
 
-    def paintEvent(self, event):
-        p = QPainter(self)
+    def staticKey(self):
+        return super(HorizontalBar, self).staticKey() + (
+            self.show_name, self.show_units, self.segments,
+            self.segment_gap_percent, self.bar_divisor,
+            self.name_font_ghost_mask, self.units_font_ghost_mask,
+            self.smallFont.key(), self.unitsFont.key())
+
+    def drawStatic(self, p):
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         pen = QPen()
         pen.setWidth(1)
@@ -97,23 +103,6 @@ class HorizontalBar(AbstractGauge):
             p.setPen(pen)
             p.drawText(self.valueTextRect, self.units, opt)
 
-        # Main Value
-        p.setFont(self.bigFont)
-        #pen.setColor(self.valueColor)
-        #p.setPen(pen)
-        opt = QTextOption(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom)
-        if self.show_value: 
-            if self.font_ghost_mask:
-                alpha = self.valueColor.alpha()
-                self.valueColor.setAlpha(self.font_ghost_alpha)
-                pen.setColor(self.valueColor)
-                p.setPen(pen)
-                p.drawText(self.valueTextRect, self.font_ghost_mask, opt)
-                self.valueColor.setAlpha(alpha)
-            pen.setColor(self.valueColor)
-            p.setPen(pen)
-            p.drawText(self.valueTextRect, self.valueText, opt)
-
         # Draws the bar
         p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         pen.setColor(self.safeColor)
@@ -159,7 +148,34 @@ class HorizontalBar(AbstractGauge):
                 seg_left = ((segment + 1) * segment_size) + (segment * segment_gap)
                 p.drawRect(QRectF(seg_left, self.barTop, segment_gap, self.barHeight))
 
+    def paintEvent(self, event):
+        p = QPainter(self)
+        # Name, units, range bands and segments come from the cached layer
+        self.paintStatic(p)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen()
+        pen.setWidth(1)
+        pen.setCapStyle(Qt.PenCapStyle.FlatCap)
+
+        # Main Value
+        p.setFont(self.bigFont)
+        #pen.setColor(self.valueColor)
+        #p.setPen(pen)
+        opt = QTextOption(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom)
+        if self.show_value: 
+            if self.font_ghost_mask:
+                alpha = self.valueColor.alpha()
+                self.valueColor.setAlpha(self.font_ghost_alpha)
+                pen.setColor(self.valueColor)
+                p.setPen(pen)
+                p.drawText(self.valueTextRect, self.font_ghost_mask, opt)
+                self.valueColor.setAlpha(alpha)
+            pen.setColor(self.valueColor)
+            p.setPen(pen)
+            p.drawText(self.valueTextRect, self.valueText, opt)
+
         # Indicator Line
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         pen.setColor(QColor(Qt.GlobalColor.darkGray))
         brush = QBrush(self.penColor)
         pen.setWidth(1)
@@ -160,14 +160,14 @@ class VerticalBar(AbstractGauge):
         p.setPen(pen)
         p.drawText(self.valueTextRect, self.valueText, QTextOption(value_align))
 
-    def paintEvent(self, event):
-        if self.highlight_key:
-            if self._highlightValue == self._rawValue:
-                self.highlight = True
-            else:
-                self.highlight = False
-
-        p = QPainter(self)
+    def staticKey(self):
+        return super(VerticalBar, self).staticKey() + (
+            self.show_name, self.show_value, self.show_units, self.segments,
+            self.segment_gap_percent, self.name_font_ghost_mask,
+            self.units_font_mask, self.units_font_ghost_mask,
+            self.smallFont.key(), self.unitsFont.key())
+
+    def drawStatic(self, p):
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         pen = QPen()
@@ -190,20 +190,6 @@ class VerticalBar(AbstractGauge):
             p.setPen(pen)
             p.setFont(self.smallFont)
             p.drawText(self.nameTextRect, self.name, opt)
-        if self.show_value:
-            if self.peakMode:
-                dv = self.value - self.peakValue
-                if dv <= -10:
-                    pen.setColor(self.peakColor)
-                    p.setFont(self.bigFont)
-                    p.setPen(pen)
-                    p.drawText(self.valueTextRect, str(round(dv)), opt)
-                else:
-                    self.drawValue(p, pen)
-            else:
-                # Draw Value
-                self.drawValue(p, pen)
-
         opt = QTextOption(Qt.AlignmentFlag.AlignCenter)
         pen.setColor(self.textColor)
         p.setPen(pen)
@@ -275,6 +261,39 @@ class VerticalBar(AbstractGauge):
             for segment in range(self.segments - 1):
                 seg_top = self.barTop + ((segment + 1) * segment_size) + (segment * segment_gap)
                 p.drawRect(QRectF(self.barLeft, seg_top, self.barWidth, segment_gap))
+
+    def paintEvent(self, event):
+        if self.highlight_key:
+            if self._highlightValue == self._rawValue:
+                self.highlight = True
+            else:
+                self.highlight = False
+
+        p = QPainter(self)
+        # Name, units, range bands and segments come from the cached layer
+        self.paintStatic(p)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        pen = QPen()
+        pen.setWidth(1)
+        pen.setCapStyle(Qt.PenCapStyle.FlatCap)
+        p.setPen(pen)
+        opt = QTextOption(Qt.AlignmentFlag.AlignCenter)
+        if self.show_value:
+            if self.peakMode:
+                dv = self.value - self.peakValue
+                if dv <= -10:
+                    pen.setColor(self.peakColor)
+                    p.setFont(self.bigFont)
+                    p.setPen(pen)
+                    p.drawText(self.valueTextRect, str(round(dv)), opt)
+                else:
+                    self.drawValue(p, pen)
+            else:
+                # Draw Value
+                self.drawValue(p, pen)
+
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         # Highlight Ball
         if self.highlight:
             pen.setColor(Qt.GlobalColor.black)
@@ -1,47 +1,107 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
+from PyQt6.QtCore import *
+
+import math
+import time
+
+def render_pixmap(width, height, draw, dpr=1.0):
+    # Returns a transparent pixmap of the given logical size with draw(painter)
+    # called to fill it.  Used to cache the parts of an instrument that do not
+    # change with every value update.
+    pixmap = QPixmap(qRound(width * dpr), qRound(height * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pixmap)
+    draw(p)
+    p.end()
+    return pixmap
+
+
+class Throttle(QObject):
+    # Trailing edge for the update_period style throttles.  An update that
+    # arrives inside the period is skipped as before, but callback is run
+    # once the period has run out so the last value is always drawn.
+    def __init__(self, callback, parent=None):
+        super(Throttle, self).__init__(parent)
+        self.callback = callback
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.fire)
+
+    def allow(self, last_time, period):
+        # Returns True if an update may be done now, otherwise arranges for
+        # callback to be called when the period since last_time is over
+        if last_time is None or not period:
+            self.timer.stop()
+            return True
+        remaining = period - (time.time() - last_time)
+        if remaining <= 0:
+            self.timer.stop()
+            return True
+        if not self.timer.isActive():
+            self.timer.start(max(1, math.ceil(remaining * 1000)))
+        return False
+
+    def pending(self):
+        return self.timer.isActive()
+
+    def cancel(self):
+        self.timer.stop()
+
+    def fire(self):
+        self.callback()
+
+# Text measured at this point size, sizes are then scaled from it
+FIT_POINT_SIZE = 100
+# Fitted font sizes by the arguments that produced them, least recently
+# used first.  Instruments are resized often but only to a few sizes.
+font_fit_cache = dict()
+font_fit_cache_size = 1024
+# Shared QFontMetricsF by (family, point size)
+font_metrics_cache = dict()
+
+def font_metrics(family, size=FIT_POINT_SIZE):
+    fm = font_metrics_cache.get((family, size))
+    if fm is None:
+        font = QFont(family)
+        font.setPointSizeF(size)
+        fm = QFontMetricsF(font)
+        font_metrics_cache[(family, size)] = fm
+    return fm
+
+def cached_fit(key, fit):
+    size = font_fit_cache.pop(key, None)
+    if size is None:
+        size = fit()
+        if len(font_fit_cache) >= font_fit_cache_size:
+            del font_fit_cache[next(iter(font_fit_cache))]
+    font_fit_cache[key] = size
+    return size
 
 def fit_to_mask(width,height,mask,font,units_mask=None, units_ratio=0.8, numeric=False):
-    font_size = 100
-    error = 100
-    minerror = 100
-    goal = 0.02
-    count = 0
-    while ( error > goal):
-        count += 1
-        text_font = QFont(font)
-        text_font.setPointSizeF(font_size)
-        fm = QFontMetricsF(text_font)
+    # Text size is proportional to the point size so the size that fits
+    # comes straight from one measurement at FIT_POINT_SIZE
+    def fit():
+        fm = font_metrics(font)
         text_width = fm.horizontalAdvance(mask)
         if numeric:
             text_height = fm.tightBoundingRect(mask).height()
         else:
             text_height = fm.boundingRect(mask).height()
         units_width = 0
-        units_height = 0
         if units_mask:
-            units_font = QFont(font)
-            units_font.setPointSizeF(font_size * units_ratio)
-            fmu = QFontMetricsF(units_font)
-            units_width = fmu.horizontalAdvance(units_mask)
-        hfactor = height / text_height
-        wfactor = width / ( text_width + units_width)
-        if hfactor < 1 and wfactor < 1:
-            factor = min(hfactor, wfactor)
-        elif hfactor > 1 and wfactor > 1:
-            factor = max(hfactor,wfactor)
-        elif hfactor < 1 and wfactor > 1:
-            factor = hfactor
-        else:
-            factor = wfactor
-        error = abs(factor - 1)
-        if factor > 1:
-            if error < minerror:
-                minerror = error
-            else:
-                break
-        font_size = font_size * factor
-    return font_size * 0.98
+            units_width = font_metrics(font, FIT_POINT_SIZE * units_ratio).horizontalAdvance(units_mask)
+        factor = min(height / text_height, width / (text_width + units_width))
+        return FIT_POINT_SIZE * factor * 0.98
+    return cached_fit((width, height, mask, font, units_mask, units_ratio, numeric), fit)
+
+def fit_to_width(width, mask, font):
+    # Point size at which mask is width wide
+    def fit():
+        return FIT_POINT_SIZE * width / font_metrics(font).horizontalAdvance(mask)
+    return cached_fit((width, mask, font), fit)
 
 
 
@@ -26,6 +26,8 @@ from pyefis import common
 import pyavtools.fix as fix
 from pyefis import common
 from pyefis.instruments import helpers
+from pyefis.instruments.tape import TapeScale
+from pyefis import gui
 
 # TODO: Add CDI and Glide Slope indicators and tick marks but make them
 #       configurable.
@@ -114,6 +116,7 @@ class HSI(QGraphicsView):
 
         self.head = fix.db.get_item("HEAD")
         self._heading = self.head.value
+        self._drawnHeading = self._heading
         self.head.valueChanged[float].connect(self.setHeading)
         self.head.oldChanged[bool].connect(self.setHeadOld)
         self.head.badChanged[bool].connect(self.setHeadBad)
@@ -130,16 +133,24 @@ class HSI(QGraphicsView):
         self.heading_bug = None
         self.myparent = parent
         self.update_period = None
+        self.last_update_time = None
+        self.throttle = helpers.Throttle(self.headingChanged, self)
 
     def getRatio(self):
         # Return X for 1:x specifying the ratio for this instrument
         return 1
 
     def resizeEvent(self, event):
+        # A key of its own so screens that throttle other instruments with
+        # update_period don't throttle the HSI as well
+        if self.update_period is None and self.myparent is not None:
+            self.update_period = self.myparent.get_config_item('hsi_update_period')
         if self.font_percent:
             self.fontSize = qRound(self.font_percent * self.width())
         self.tickSize = self.fontSize * 0.7
         self.scene = QGraphicsScene(0, 0, self.width(), self.height())
+        # Labels of the old card went with the old scene
+        self.labels = list()
         self.cx = self.width() / 2.0
         self.cy = self.height() / 2.0
         self.r = self.height() / 2.0 - 5.0
@@ -203,8 +214,13 @@ class HSI(QGraphicsView):
         triangle = self.heading_bug_polygon()
         self.heading_bug = self.scene.addPolygon(triangle, headingPen, headingBrush)
 
+        self.changeFail()
+
         self.setScene(self.scene)
+        # Start from no rotation, the view kept the old card's
+        self.resetTransform()
         self.rotate(-self._heading)
+        self._drawnHeading = self._heading
 
         # Draws the static overlay stuff to a pixmap
         self.map = QPixmap(self.width(), self.height())
@@ -302,16 +318,25 @@ class HSI(QGraphicsView):
 
     def setHeading(self, heading):
         if heading != self._heading:
-            now = time.time()
-            newheading = common.bounds(0, 360, heading)
-            diff = newheading - self._heading
-            if diff > 180:
-                diff -= 360
-            elif diff < -180:
-                diff += 360
-            self._heading = newheading
+            self._heading = common.bounds(0, 360, heading)
+            self.headingChanged()
+
+    def headingChanged(self):
+        if self.throttle.allow(self.last_update_time, self.update_period):
+            self.last_update_time = time.time()
+            gui.scheduleRender(self.rotateHeading)
+
+    def rotateHeading(self):
+        # Rotate the card from the heading it was last drawn at to the
+        # current one, so coalesced updates still add up to the right angle
+        diff = self._heading - self._drawnHeading
+        if diff > 180:
+            diff -= 360
+        elif diff < -180:
+            diff += 360
+        self._drawnHeading = self._heading
+        if diff:
             self.rotate(-diff)
-            self.last_update_time = now
 
     def setHeadOld(self,old):
         self._HeadOld = old
@@ -548,6 +573,7 @@ class DG_Tape(QGraphicsView):
 
         # TODO Seems the heading tape does not have bad/fail/old
         self.dpp = 10
+        self.tape = None
     def resizeEvent(self, event):
         w = self.width()
         h = self.height()
@@ -567,45 +593,38 @@ class DG_Tape(QGraphicsView):
 
         self.setScene(self.scene)
 
-        for i in range(-50, 410, 5):
-            if i % 10 == 0:
-                self.scene.addLine((i * 10) + w / 2, 0, (i * 10) + w / 2, h / 2,
-                                   compassPen)
-                if i > 360:
-                    t = self.scene.addText(str(i - 360))
-                    t.setFont(f)
-                    self.scene.setFont(f)
-                    t.setDefaultTextColor(QColor(Qt.GlobalColor.white))
-                    t.setX(((i * 10) + w / 2) - t.boundingRect().width() / 2)
-                    t.setY(h - t.boundingRect().height())
-                elif i < 1:
-                    t = self.scene.addText(str(i + 360))
-                    t.setFont(f)
-                    self.scene.setFont(f)
-                    t.setDefaultTextColor(QColor(Qt.GlobalColor.white))
-                    t.setX(((i * 10) + w / 2) - t.boundingRect().width() / 2)
-                    t.setY(h - t.boundingRect().height())
-                else:
-                    if i % 90 == 0:
-                        t = self.scene.addText(self.cardinal[int(i / 90)])
-                        t.setFont(f)
-                        self.scene.setFont(f)
-                        t.setDefaultTextColor(QColor(Qt.GlobalColor.cyan))
-                        t.setX(((i * 10) + w / 2) - t.boundingRect().width() / 2)
-                        t.setY(h - t.boundingRect().height())
-                    else:
-                        t = self.scene.addText(str(i))
-                        t.setFont(f)
-                        self.scene.setFont(f)
-                        t.setDefaultTextColor(QColor(Qt.GlobalColor.white))
-                        t.setX(((i * 10) + w / 2) - t.boundingRect().width() / 2)
-                        t.setY(h - t.boundingRect().height())
+        # Only the ticks around the heading are drawn
+        self.tick_font = f
+        self.tick_pen = compassPen
+        self.scene.setFont(f)
+        self.tape = TapeScale(self.scene, -50, 405, 5, self.draw_tick, w / self.dpp)
+        self.tape.scroll(self._heading)
+
+    def draw_tick(self, tape, i):
+        w = self.width()
+        h = self.height()
+        x = i * self.dpp + w / 2
+        if i % 10 == 0:
+            tape.line(x, 0, x, h / 2, self.tick_pen)
+            color = QColor(Qt.GlobalColor.white)
+            if i > 360:
+                label = str(i - 360)
+            elif i < 1:
+                label = str(i + 360)
+            elif i % 90 == 0:
+                label = self.cardinal[int(i / 90)]
+                color = QColor(Qt.GlobalColor.cyan)
             else:
-                self.scene.addLine((i * 10) + w / 2, 0,
-                                   (i * 10) + w / 2, h / 2 - 20,
-                                    compassPen)
+                label = str(i)
+            t = tape.text(label, self.tick_font, color)
+            t.setX(x - t.boundingRect().width() / 2)
+            t.setY(h - t.boundingRect().height())
+        else:
+            tape.line(x, 0, x, h / 2 - 20, self.tick_pen)
 
     def redraw(self):
+        if self.tape is not None:
+            self.tape.scroll(self._heading)
         self.resetTransform()
         self.centerOn(self._heading * self.dpp + self.width() / 2,
                       self.height() / 2)
@@ -616,7 +635,7 @@ class DG_Tape(QGraphicsView):
     def setHeading(self, heading):
         if heading != self._heading:
             self._heading = heading
-            self.redraw()
+            gui.scheduleRender(self.redraw)
 
     heading = property(getHeading, setHeading)
 
@@ -10,9 +10,10 @@ import logging
 import pyavtools.fix as fix
 logger=logging.getLogger(__name__)
 
-import yaml
 import os
 import operator
+from pyefis import cfg
+from pyefis.screens import screenbuilder_config
 from pyefis.instruments import misc
 import geopy.distance
 
@@ -24,13 +25,8 @@ class ListBox(QGraphicsView):
         self.tlists = dict()
         for l in lists:
             config_path = os.path.join(self.parent.parent.config_path,l['file'])
-            with open(config_path, 'r') as f:
-              self.tlists[l["name"]] = yaml.load(f, Loader=yaml.SafeLoader)
-        list_str = yaml.dump(self.tlists)
-        if replace:
-            for rep in replace:
-                list_str = list_str.replace(rep,str(replace[rep]))
-        self.tlists = yaml.load(list_str, Loader=yaml.SafeLoader)
+            self.tlists[l["name"]] = cfg.load_yaml(config_path, shared=True)
+        self.tlists = screenbuilder_config.substitute(self.tlists, replace or {})
 
         self.active_list = list(self.tlists.keys())[0]
         self.header = misc.StaticText(text=self.active_list, color=QColor(Qt.GlobalColor.white), parent=self)
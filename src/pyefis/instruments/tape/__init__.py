@@ -0,0 +1,108 @@
+#  Copyright (c) 2026 Eric Blevins
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+
+# The ticks and labels of the scrolling tapes.  A tape's scene still spans
+# its whole range so the instrument can centerOn() the value as before, but
+# only the ticks within a window around the value have items in it.  When
+# the value moves far enough the ticks that dropped out of the window give
+# their items back and the new ones take them, so the number of items and
+# the time to build the tape don't grow with the range.
+#
+# Ticks are at first, first + step, first + 2 * step ... up to last, step
+# may be negative.  draw_tick(tape, value) is called for each tick as it
+# comes into the window and puts it in place with line() and text().
+
+import math
+
+from PyQt6.QtGui import *
+from PyQt6.QtCore import *
+from PyQt6.QtWidgets import *
+
+
+class TapeScale:
+    def __init__(self, scene, first, last, step, draw_tick, span, margin=None):
+        self.scene = scene
+        self.first = first
+        self.step = step
+        self.count = max(0, math.floor((last - first) / step)) + 1
+        self.draw_tick = draw_tick
+        # Range of the tape shown at once and how much is drawn beyond
+        # each end of it, both in the tape's units
+        self.span = span
+        self.margin = span if margin is None else margin
+        # Items by tick number and the spare ones by item type
+        self.ticks = dict()
+        self.spare = dict()
+        self.center = None
+        self.drawing = None
+
+    def value(self, tick):
+        return self.first + tick * self.step
+
+    def scroll(self, value):
+        # Nothing to do until the value is half a margin from where the
+        # window was last drawn
+        if self.center is not None and abs(value - self.center) < self.margin / 2:
+            return
+        self.center = value
+        reach = self.span / 2 + self.margin
+        ends = ((value - reach - self.first) / self.step,
+                (value + reach - self.first) / self.step)
+        low = max(0, math.ceil(min(ends)))
+        high = min(self.count - 1, math.floor(max(ends)))
+        for tick in [t for t in self.ticks if t < low or t > high]:
+            self.release(tick)
+        for tick in range(low, high + 1):
+            if tick not in self.ticks:
+                self.drawing = list()
+                self.draw_tick(self, self.value(tick))
+                self.ticks[tick] = self.drawing
+        self.drawing = None
+
+    def release(self, tick):
+        for item in self.ticks.pop(tick):
+            item.hide()
+            self.spare.setdefault(type(item), list()).append(item)
+
+    def acquire(self, item_type):
+        spare = self.spare.get(item_type)
+        if spare:
+            item = spare.pop()
+            item.show()
+        else:
+            item = item_type()
+            self.scene.addItem(item)
+        self.drawing.append(item)
+        return item
+
+    def line(self, x1, y1, x2, y2, pen, opacity=1.0):
+        l = self.acquire(QGraphicsLineItem)
+        l.setLine(x1, y1, x2, y2)
+        l.setPen(pen)
+        l.setOpacity(opacity)
+        return l
+
+    def text(self, text, font, color, opacity=1.0):
+        # The caller places the text once it knows its size
+        t = self.acquire(QGraphicsTextItem)
+        t.setPlainText(text)
+        t.setFont(font)
+        t.setDefaultTextColor(color)
+        t.setOpacity(opacity)
+        return t
+
+    def __len__(self):
+        return len(self.ticks)
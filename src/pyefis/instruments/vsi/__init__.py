@@ -22,7 +22,10 @@ from PyQt6.QtWidgets import *
 
 
 import pyavtools.fix as fix
+from pyefis import fixhub
+from pyefis import trends
 from pyefis.instruments import helpers
+from pyefis.instruments.tape import TapeScale
 
 class VSI_Dial(QWidget):
     FULL_WIDTH = 300
@@ -40,25 +43,30 @@ class VSI_Dial(QWidget):
         self.item.oldChanged[bool].connect(self.repaint)
         self.item.badChanged[bool].connect(self.repaint)
         self.item.failChanged[bool].connect(self.repaint)
+        # Pre-rendered dial face, see drawFace()
+        self.background = None
+        self.background_key = None
 
     def getRatio(self):
         # Return X for 1:x specifying the ratio for this instrument
         return 1
 
     def resizeEvent(self, event):
-        self.background = QPixmap(self.width(), self.height())
         self.r = int(round(min(self.width(), self.height()) *.45))
+        self.center = QPointF(self.width() / 2, self.height() / 2)
+
+    def drawFace(self, p):
+        # Draws the ring, ticks and numbers.  This is only done when the size
+        # or range changes, paintEvent() just draws the result.
         f = QFont(self.font_family)
         fs = int(round(self.fontSize * self.width() / self.FULL_WIDTH))
         f.setPixelSize(fs)
         fm = QFontMetrics(f)
-        p = QPainter(self.background)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         p.setFont(f)
         pen = QPen(QColor(Qt.GlobalColor.white))
         pen.setWidth(2)
         p.setPen(pen)
-        self.center = QPointF(p.device().width() / 2, p.device().height() / 2)
 
         p.fillRect(0, 0, self.width(), self.height(), Qt.GlobalColor.black)
         p.drawEllipse(self.center, self.r, self.r)
@@ -79,8 +87,7 @@ class VSI_Dial(QWidget):
         p.rotate(-90)
         p.drawLine(longLine)
         transform = QTransform()
-        transform.translate(p.device().width() / 2,
-                            p.device().height() / 2)
+        transform.translate(self.center.x(), self.center.y())
         transform.translate(- self.r + self.fontSize + 5,
                             - pixelsHigh / 2)
         p.setTransform(transform)
@@ -89,8 +96,7 @@ class VSI_Dial(QWidget):
 
         pixelsWide = fm.horizontalAdvance("2.0")
         transform = QTransform()
-        transform.translate(p.device().width() / 2,
-                            p.device().height() / 2)
+        transform.translate(self.center.x(), self.center.y())
         transform.translate(self.r - self.fontSize - pixelsWide,
                             - pixelsHigh / 2)
         p.setTransform(transform)
@@ -125,19 +131,17 @@ class VSI_Dial(QWidget):
     def paintEvent(self, event):
         w = self.width()
         h = self.height()
+        key = (w, h, self.devicePixelRatioF(), self.font_family,
+               self.fontSize, self.maxRange, self.maxAngle)
+        if self.background is None or key != self.background_key:
+            self.background = helpers.render_pixmap(w, h, self.drawFace, self.devicePixelRatioF())
+            self.background_key = key
         dial = QPainter(self)
         dial.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Draw the Black Background
-        dial.fillRect(0, 0, w, h, Qt.GlobalColor.black)
-
         # Insert Background
         dial.drawPixmap(0, 0, self.background)
 
-        # Setup Pens
-        f = QFont(self.font_family)
-        f.setPixelSize(self.fontSize)
-
         if self.item.old or self.item.bad:
             warn_font = QFont(self.font_family, 30, QFont.Weight.Bold)
             dialPen = QPen(QColor(Qt.GlobalColor.gray))
@@ -147,7 +151,6 @@ class VSI_Dial(QWidget):
             dialBrush = QBrush(QColor(Qt.GlobalColor.white))
         dialPen.setWidth(2)
         dial.setPen(dialPen)
-        dial.setFont(f)
         dial.setBrush(dialBrush)
 
         if self.item.fail:
@@ -314,10 +317,13 @@ class AS_Trend_Tape(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self._airspeed = 0
         self._airspeed_diff = 0
-        self._airspeed_trend = []
         self.freq = 10
+        self.suspended = False
+        self.indicator = None
+        # The trend is worked out once for every display of it, from freq
+        # readings a second over the last second
+        self.trend = trends.subscribe("IAS", self.setTrend, self.freq, self.freq)
 
     def resizeEvent(self, event):
         w = self.width()
@@ -335,46 +341,40 @@ class AS_Trend_Tape(QGraphicsView):
                            w, h / 2,
                            self.zeroPen)
 
+        # Only resized from here on
+        self.indicator = self.scene.addRect(w / 2, h / 2, w / 2 + 5, 0,
+                                            QPen(QColor(Qt.GlobalColor.white)),
+                                            QBrush(QColor(Qt.GlobalColor.white)))
+
         self.setScene(self.scene)
+        self.redraw()
 
     def redraw(self):
-        self.scene.clear()
-        self.scene.addRect(0, 0, self.width(), self.height(),
-                           QPen(QColor(Qt.GlobalColor.black)), QBrush(QColor(Qt.GlobalColor.black)))
-
-        self.scene.addLine(0, self.height() / 2,
-                           self.width(), self.height() / 2,
-                           self.zeroPen)
-
-        self.centerOn(self.scene.width() / 2,
-                      self.height() / 2)
-
-        self._airspeed_diff = (sum(self._airspeed_trend) / len(
-                               self._airspeed_trend)) * 60
-
-        self.scene.addRect(self.width() / 2, self.height() / 2,
-                           self.width() / 2 + 5,
-                           self._airspeed_diff * -self.pph,
-                           QPen(QColor(Qt.GlobalColor.white)), QBrush(QColor(Qt.GlobalColor.white)))
+        if self.indicator is None:
+            return
+        self.indicator.setRect(self.width() / 2, self.height() / 2,
+                               self.width() / 2 + 5,
+                               self._airspeed_diff * -self.pph)
 
-        self.setScene(self.scene)
+    def setTrend(self, trend):
+        self._airspeed_diff = trend
+        if not self.suspended:
+            self.redraw()
 
+    # Feeds the shared trend, which passes the result back to setTrend
     def setAS_Trend(self, airspeed):
-        if airspeed != self._airspeed:
-            if len(self._airspeed_trend) == self.freq:
-                del self._airspeed_trend[0]
-            self._airspeed_trend.append(airspeed - self._airspeed)
-            self._airspeed = airspeed
-            self.redraw()
-        elif airspeed == self._airspeed:
-            if len(self._airspeed_trend) == self.freq:
-                del self._airspeed_trend[0]
-            self._airspeed_trend.append(airspeed - self._airspeed)
-            self._airspeed = airspeed
-            self.redraw()
+        self.trend.sample(airspeed)
 
     altimeter = property(setAS_Trend)
 
+    # The trend is still sampled while suspended, only the drawing waits
+    def suspend(self):
+        self.suspended = True
+
+    def resume(self):
+        self.suspended = False
+        self.redraw()
+
 
 class Alt_Trend_Tape(QGraphicsView):
     RIGHT_MARGIN = 5
@@ -399,6 +399,7 @@ class Alt_Trend_Tape(QGraphicsView):
         self._fail = self.item.fail
         self.myparent = parent
         self.update_period = None
+        self.throttle = helpers.Throttle(self.redraw, self)
 
     def resizeEvent(self, event):
         if self.update_period is None:
@@ -407,7 +408,6 @@ class Alt_Trend_Tape(QGraphicsView):
                 self.update_period = .1
             self.last_update_time = 0
         w = self.width() - self.RIGHT_MARGIN
-        w_2 = w / 2
         h = self.height()
 
         f = QFont(self.font_family)
@@ -417,6 +417,8 @@ class Alt_Trend_Tape(QGraphicsView):
         bf.setBold(True)
 
         self.scene = QGraphicsScene(0, 0, w, h)
+        # The old indicator went with the old scene
+        self.indicator_line = None
         self.scene.setFont(f)
         self.scene.addRect(0, 0, self.width(), h,
                            QPen(QColor(Qt.GlobalColor.black)), QBrush(QColor(Qt.GlobalColor.black)))
@@ -439,35 +441,42 @@ class Alt_Trend_Tape(QGraphicsView):
 
         self.pph = float(remaining_height) / (self.maxvs * 2)
 
-        tapePen = QPen(QColor(Qt.GlobalColor.white))
-        for i in range(self.maxvs, -self.maxvs - 1, -100):
-            y = self.y_offset(i)
-            if i % 200 == 0:
-                self.scene.addLine(w_2 + 5, y, w, y, tapePen)
-                t = self.scene.addText(str(int(i / 100)))
-                t.setFont(f)
-                t.setDefaultTextColor(QColor(Qt.GlobalColor.white))
-                t.setX(0)
-                t.setY(y - t.boundingRect().height() / 2)
-            else:
-                self.scene.addLine(w_2 + 10, y, w, y, tapePen)
+        # The whole scale is in view so the window covers all of it
+        self.tick_font = f
+        self.tick_pen = QPen(QColor(Qt.GlobalColor.white))
+        self.tape = TapeScale(
+            self.scene, self.maxvs, -self.maxvs, -100, self.draw_tick, self.maxvs * 2, 0
+        )
+        self.tape.scroll(0)
         self.setScene(self.scene)
-        self.item.valueChanged[float].connect(self.setVs)
-        self.item.oldChanged[bool].connect(self.setOld)
-        self.item.badChanged[bool].connect(self.setBad)
-        self.item.failChanged[bool].connect(self.setFail)
+        # The hub ignores a callback that is already subscribed so these
+        # stay single after any number of resizes
+        fixhub.subscribe(self.item.key, 'value', self.setVs)
+        fixhub.subscribe(self.item.key, 'old', self.setOld)
+        fixhub.subscribe(self.item.key, 'bad', self.setBad)
+        fixhub.subscribe(self.item.key, 'fail', self.setFail)
         self.redraw()
 
     def y_offset(self, vs):
         return self.zero_y - vs * self.pph
 
+    def draw_tick(self, tape, i):
+        w = self.width() - self.RIGHT_MARGIN
+        y = self.y_offset(i)
+        if i % 200 == 0:
+            tape.line(w / 2 + 5, y, w, y, self.tick_pen)
+            t = tape.text(str(int(i / 100)), self.tick_font, QColor(Qt.GlobalColor.white))
+            t.setX(0)
+            t.setY(y - t.boundingRect().height() / 2)
+        else:
+            tape.line(w / 2 + 10, y, w, y, self.tick_pen)
+
     def redraw(self):
         if not self.isVisible():
             return
-        now = time.time()
-        if now - self.last_update_time < self.update_period:
+        if not self.throttle.allow(self.last_update_time, self.update_period):
             return
-        self.last_update_time = now
+        self.last_update_time = time.time()
         y = self.y_offset(self._vs)
         w = self.width() - self.RIGHT_MARGIN
         x = w * 6 / 7
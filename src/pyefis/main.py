@@ -136,6 +136,10 @@ def main():
                         help='Alternate configuration file')
     parser.add_argument('--log-config', type=argparse.FileType('r'),
                         help='Alternate logger configuration file')
+    parser.add_argument('--compile-config', action='store_true',
+                        help='Parse the configuration into a snapshot for faster startup and exit')
+    parser.add_argument('--no-config-snapshot', action='store_true',
+                        help='Parse the configuration files without using or saving a snapshot')
 
     args = parser.parse_args()
 
@@ -163,17 +167,28 @@ def main():
         # Reset this stuff like we found it
         config_file = "{USER}/makerplane/pyefis/config/{FILE}".format(USER=user_home, FILE=config_filename)
     config_path = os.path.dirname(config_file)
+    # The snapshot holds the parsed config files from the last start so
+    # they don't need parsed again when none of them have changed
+    snapshot_file = os.path.join(config_path, cfg.SNAPSHOT_FILE)
+    use_snapshot = not args.no_config_snapshot
+    if use_snapshot and not args.compile_config:
+        cfg.load_snapshot(snapshot_file, config_path)
     preference_file = f"{config_path}/preferences.yaml"
-    with open(preference_file) as cf:
-       preferences = yaml.safe_load(cf)
+    preferences = cfg.load_yaml(preference_file)
     preference_file = preference_file + ".custom"
     # override preferecnes with customizations
     if os.path.exists(preference_file):
-        with open(preference_file) as cf:
-            custom = yaml.safe_load(cf)
+        custom = cfg.load_yaml(preference_file)
         merge_dict(preferences,custom)
 
-    config = cfg.from_yaml(config_file,preferences=preferences)
+    config = cfg.load_config(config_file,preferences=preferences)
+
+    if args.compile_config:
+        cfg.compile_files(config_path)
+        if not cfg.save_snapshot(snapshot_file, config_path):
+            sys.exit(1)
+        print(f"Configuration compiled to {snapshot_file}")
+        sys.exit(0)
 
     # If running under systemd
     if environ.get('INVOCATION_ID', False):
@@ -227,6 +242,8 @@ def main():
         fms.start(config["FMS"]["aircraft_config"])
 
     gui.initialize(config,config_path,preferences)
+    if use_snapshot and cfg.snapshot_dirty:
+        cfg.save_snapshot(snapshot_file, config_path)
 
     # Do this after the widgets subscribe to the item
     pyefis_ver.value = __version__
@@ -16,7 +16,7 @@
 #  Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
 
 from PyQt6.QtGui import QColor
-from PyQt6.QtCore import QTimer, qRound
+from PyQt6.QtCore import QRect, QTimer, qRound
 from PyQt6.QtWidgets import QWidget
 
 from pyefis.instruments import weston
@@ -63,8 +63,13 @@ class Screen(QWidget):
         self.setAutoFillBackground(True)
 
         self.init = False
+        self.suspended = False
         self.previous_width = self.width()
         self.previous_height = self.height()
+        self.layout_timer = QTimer(self)
+        self.layout_timer.setSingleShot(True)
+        self.layout_timer.setInterval(0)
+        self.layout_timer.timeout.connect(self.relayout)
 
         # list of dial types supported so far:
         # airspeed_dial
@@ -215,6 +220,8 @@ class Screen(QWidget):
 
         self.display_state_controller.register_callback(self.layout)
         self.encoder_controller.configure_inputs(fix)
+        if self.suspended:
+            self.suspend()
 
     def setup_instruments(self, count, i, ganged=False, replace=None, state=False):
         if not ganged:
@@ -256,74 +263,54 @@ class Screen(QWidget):
             row,
         )
 
+    def get_instrument_ratio(self, i, config):
+        # Ratio the instrument needs to keep, False if it fits any box
+        if not hasattr(self.instruments[i], "getRatio"):
+            return False
+        ratio = config.get("ratio", self.instruments[i].getRatio())
+        logger.debug(f"Instrument {config['type']} has ratio 1:{ratio}")
+        return ratio
+
     def grid_layout(self):
         self.previous_width = self.width()
         self.previous_height = self.height()
 
-        for i, c in self.instrument_config.items():
-            ratio = False
-            logger.debug(f"{c['type']} {'ganged' in c['type']}")
-            if "ganged" not in c["type"] and hasattr(self.instruments[i], "getRatio"):
-                # This instrument needs a specific ratio
-                ratio = self.instruments[i].getRatio()
-                ratio = c.get("ratio", ratio)
-                logger.debug(f"Instrument {c['type']} has ratio 1:{ratio}")
-
-            geometry = screenbuilder_layout.get_instrument_geometry(
-                self.layout,
-                self.width(),
-                self.height(),
-                c,
-                ratio,
-            )
-            x = geometry["x"]
-            y = geometry["y"]
-            width = geometry["width"]
-            height = geometry["height"]
-            r_width = geometry["render_width"]
-            r_height = geometry["render_height"]
-
-            if "ganged" in c["type"]:
-                ganged_ratio = False
-                if hasattr(self.instruments[i], "getRatio"):
-                    ganged_ratio = self.instruments[i].getRatio()
-                    ganged_ratio = c.get("ratio", ganged_ratio)
-                    logger.debug(
-                        f"Ganged Instrument {c['type']} has ratio 1:{ganged_ratio}"
-                    )
-
-                for gang_count, ganged_geometry in enumerate(
-                    screenbuilder_layout.get_ganged_geometries(
-                        c, x, y, width, height, ganged_ratio
-                    )
-                ):
-                    g_x, g_y, g_width, g_height = ganged_geometry
-                    self.move_resize_inst(
-                        i + gang_count,
-                        qRound(g_x),
-                        qRound(g_y),
-                        qRound(g_width),
-                        qRound(g_height),
-                    )
-                    try:
-                        self.instruments[i + gang_count].setupGauge()
-                    except:
-                        pass
-
-            else:
+        geometries = screenbuilder_layout.get_layout_geometries(
+            self.layout,
+            self.width(),
+            self.height(),
+            self.instrument_config,
+            self.get_instrument_ratio,
+        )
+        # Place everything with updates off so the screen is repainted once
+        # for the whole layout rather than for each instrument
+        self.setUpdatesEnabled(False)
+        try:
+            for i, (x, y, width, height) in geometries.items():
                 self.move_resize_inst(
-                    i, qRound(x), qRound(y), qRound(r_width), qRound(r_height)
+                    i, qRound(x), qRound(y), qRound(width), qRound(height)
                 )
+        finally:
+            self.setUpdatesEnabled(True)
 
+        if self.init:
+            return
+        for i in geometries:
             try:
-                # Gauges need this run to set them up
+                # Gauges need this run to set them up, it doesn't depend
+                # on the size so only the first layout does it
                 self.instruments[i].setupGauge()
             except:
                 pass
 
     def move_resize_inst(self, inst, x, y, width, height):
-        self.instruments[inst].move(x, y)
-        self.instruments[inst].resize(width, height)
+        geometry = QRect(x, y, width, height)
+        if self.instruments[inst].geometry() != geometry:
+            self.instruments[inst].setGeometry(geometry)
+
+    def relayout(self):
+        if self.previous_width != self.width() or self.previous_height != self.height():
+            self.grid_layout()
 
     def initScreen(self):
         if not self.init:
@@ -333,8 +320,25 @@ class Screen(QWidget):
         if not self.init:
             self.init_screen()
 
+        # Qt sends several resizes in a row at startup and when going full
+        # screen, the layout is done once for the last of them
         if self.previous_width != self.width() or self.previous_height != self.height():
-            self.grid_layout()
+            self.layout_timer.start()
+
+    # Instruments on a hidden screen that have suspend() and resume() stop
+    # doing work for FIX updates and catch up with the latest values when
+    # the screen is shown again
+    def suspend(self):
+        self.suspended = True
+        for inst in self.findChildren(QWidget):
+            if callable(getattr(inst, "suspend", None)):
+                inst.suspend()
+
+    def resume(self):
+        self.suspended = False
+        for inst in self.findChildren(QWidget):
+            if callable(getattr(inst, "resume", None)):
+                inst.resume()
 
     def get_config_item(self, key):
         return self.parent.get_config_item(self, key)
@@ -354,6 +358,10 @@ class Screen(QWidget):
                 self.encoder_timer.stop()
         except Exception:
             pass
+        self.layout_timer.stop()
+        # FIX items and scheduler timers outlive the screen
+        self.encoder_controller.disconnect_inputs()
+        self.display_state_controller.unregister_callback()
 
         if "instruments" not in self.__dict__:
             if event is not None:
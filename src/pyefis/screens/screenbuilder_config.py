@@ -15,7 +15,9 @@
 #  Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
 
 import os
-import yaml
+import re
+
+from pyefis import cfg
 
 
 def is_include(config):
@@ -47,20 +49,69 @@ def is_disabled(config, preferences):
 def load_include_config(config_path, preferences, config):
     name = include_name(config)
     include_path = os.path.join(config_path, name)
+    # The shared copy is fine, the instruments are only read until
+    # apply_replacements() makes new ones from them
     if os.path.exists(include_path):
-        with open(include_path) as include_file:
-            return yaml.load(include_file, Loader=yaml.SafeLoader)
+        return cfg.load_yaml(include_path, shared=True)
 
     preference_include = preferences["includes"][name]
     if preference_include:
-        with open(os.path.join(config_path, preference_include)) as include_file:
-            return yaml.load(include_file, Loader=yaml.SafeLoader)
+        return cfg.load_yaml(
+            os.path.join(config_path, preference_include), shared=True
+        )
 
     raise Exception(f"Include file '{name}' not found")
 
 
+# Compiled patterns matching any of a set of placeholders, by the placeholders
+placeholder_patterns = dict()
+
+
+def placeholder_pattern(placeholders):
+    pattern = placeholder_patterns.get(placeholders)
+    if pattern is None:
+        # Longest first so one placeholder can't match part of another
+        pattern = re.compile(
+            "|".join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True))
+        )
+        placeholder_patterns[placeholders] = pattern
+    return pattern
+
+
+# Return a copy of config with each placeholder in the replacements, such as
+# "{id}", replaced with its value in every string key and value
+def substitute(config, replacements):
+    values = {str(k): str(v) for k, v in replacements.items()}
+    if not values:
+        return copy_tree(config)
+    pattern = placeholder_pattern(tuple(values))
+
+    def lookup(match):
+        return values[match.group(0)]
+
+    def walk(node):
+        if isinstance(node, str):
+            if "{" in node:
+                return pattern.sub(lookup, node)
+            return node
+        if isinstance(node, dict):
+            return {walk(k): walk(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [walk(v) for v in node]
+        return node
+
+    return walk(config)
+
+
+def copy_tree(config):
+    if isinstance(config, dict):
+        return {k: copy_tree(v) for k, v in config.items()}
+    if isinstance(config, list):
+        return [copy_tree(v) for v in config]
+    return config
+
+
 def apply_replacements(instrument, replacements, parent=None):
-    instrument_str = yaml.dump(instrument)
     this_replacements = replacements
 
     if parent and "replace" in parent:
@@ -75,10 +126,7 @@ def apply_replacements(instrument, replacements, parent=None):
                 instrument["replace"][replacement]
             )
 
-    for replacement, value in this_replacements.items():
-        instrument_str = instrument_str.replace(replacement, str(value))
-
-    return yaml.load(instrument_str, Loader=yaml.SafeLoader), this_replacements
+    return substitute(instrument, this_replacements), this_replacements
 
 
 def apply_include_geometry(
@@ -47,6 +47,12 @@ class DisplayStateController:
         if layout.get("display_state", False):
             self.screen.timer.add_callback(self.screen.change_display_states)
 
+    def unregister_callback(self):
+        # The scheduler timers outlive the screen
+        callbacks = getattr(getattr(self.screen, "timer", None), "callbacks", None)
+        if callbacks and self.screen.change_display_states in callbacks:
+            callbacks.remove(self.screen.change_display_states)
+
     def change(self):
         if self.screen.display_states < 2:
             return
@@ -47,6 +47,22 @@ class EncoderController:
 
             self.screen.encoder_timer.timeout.connect(self.screen.encoderChanged)
 
+    def disconnect_inputs(self):
+        if self.screen.encoder_input is not None:
+            try:
+                self.screen.encoder_input.valueWrite[int].disconnect(
+                    self.screen.encoderChanged
+                )
+            except TypeError:
+                pass
+        if self.screen.encoder_button_input is not None:
+            try:
+                self.screen.encoder_button_input.valueChanged[bool].disconnect(
+                    self.screen.encoderButtonChanged
+                )
+            except TypeError:
+                pass
+
     def changed(self, value=0):
         curr_time = time.time_ns() // 1000000
         if value == 0:
@@ -214,3 +214,38 @@ def get_ganged_geometries(config, x, y, width, height, ratio=False):
             group_y += gap_size
 
     return geometries
+
+
+# The rectangle (x, y, width, height) of every instrument on the screen by
+# instrument number, ganged instruments get one for each member.
+# get_ratio(number, config) returns the ratio an instrument keeps or False.
+def get_layout_geometries(layout, screen_width, screen_height, instruments, get_ratio):
+    geometries = dict()
+    for i, config in instruments.items():
+        ratio = get_ratio(i, config)
+        if "ganged" in config["type"]:
+            geometry = get_instrument_geometry(
+                layout, screen_width, screen_height, config
+            )
+            for gang_count, ganged_geometry in enumerate(
+                get_ganged_geometries(
+                    config,
+                    geometry["x"],
+                    geometry["y"],
+                    geometry["width"],
+                    geometry["height"],
+                    ratio,
+                )
+            ):
+                geometries[i + gang_count] = ganged_geometry
+        else:
+            geometry = get_instrument_geometry(
+                layout, screen_width, screen_height, config, ratio
+            )
+            geometries[i] = (
+                geometry["x"],
+                geometry["y"],
+                geometry["render_width"],
+                geometry["render_height"],
+            )
+    return geometries
@@ -0,0 +1,152 @@
+#  Copyright (c) 2026 Eric Blevins
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+
+# Trends of FIX items shared by the displays that show them.  Each key and
+# sampling gets one Trend that reads the item rate times a second, keeps
+# the changes between readings in a ring buffer with a running sum and
+# passes the trend, the average change per minute, on to its consumers.
+# Sampling on a timer rather than on changes lets the trend fall back to
+# zero once the value holds steady.  Consumers are held weakly as in the
+# FIX hub and the timer only runs while there are any.
+
+import math
+import weakref
+
+from PyQt6.QtCore import QTimer
+
+import pyavtools.fix as fix
+
+# Trend by (FIX key, samples, rate)
+trends = dict()
+
+
+class RingBuffer:
+    # The last capacity samples and their sum
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.samples = [0.0] * capacity
+        self.count = 0
+        self.index = 0
+        self.total = 0.0
+
+    def append(self, sample):
+        if self.count == self.capacity:
+            self.total -= self.samples[self.index]
+        else:
+            self.count += 1
+        self.samples[self.index] = sample
+        self.total += sample
+        self.index = (self.index + 1) % self.capacity
+        if self.index == 0:
+            # Sum afresh once a lap so rounding errors don't build up
+            self.total = math.fsum(self.samples)
+
+    def mean(self):
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    def clear(self):
+        self.count = 0
+        self.index = 0
+        self.total = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        # Oldest first
+        start = (self.index - self.count) % self.capacity
+        for i in range(self.count):
+            yield self.samples[(start + i) % self.capacity]
+
+
+class Trend:
+    def __init__(self, key, samples, rate):
+        self.key = key
+        self.rate = rate
+        self.changes = RingBuffer(samples)
+        self.consumers = list()
+        self.item = fix.db.get_item(key)
+        self.last = self.item.value
+        self.value = 0.0
+        self.timer = QTimer()
+        self.timer.setInterval(round(1000 / rate))
+        self.timer.timeout.connect(self.tick)
+
+    def add(self, callback):
+        for ref in self.consumers:
+            if ref() == callback:
+                return
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            self.consumers.append(weakref.WeakMethod(callback))
+        else:
+            self.consumers.append(lambda callback=callback: callback)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def remove(self, callback):
+        self.consumers = [ref for ref in self.consumers if ref() != callback]
+        if not self.consumers:
+            self.timer.stop()
+
+    def tick(self):
+        self.sample(self.item.value)
+
+    def sample(self, value):
+        self.changes.append(value - self.last)
+        self.last = value
+        self.value = self.changes.mean() * self.rate * 60
+        for ref in list(self.consumers):
+            callback = ref()
+            if callback is None:
+                self.consumers.remove(ref)
+                continue
+            try:
+                callback(self.value)
+            except RuntimeError as e:
+                # The widget behind the callback has been deleted
+                if "has been deleted" not in str(e):
+                    raise
+                self.consumers.remove(ref)
+        if not self.consumers:
+            self.timer.stop()
+
+
+def trend(key, samples=10, rate=10):
+    t = trends.get((key, samples, rate))
+    # A new database means new items
+    if t is None or t.item is not fix.db.get_item(key):
+        if t is not None:
+            t.timer.stop()
+        t = Trend(key, samples, rate)
+        trends[(key, samples, rate)] = t
+    return t
+
+
+# Call callback(trend) after each of the rate readings a second of the FIX
+# item key and return the Trend.  The trend is over the last samples
+# readings.
+def subscribe(key, callback, samples=10, rate=10):
+    t = trend(key, samples, rate)
+    t.add(callback)
+    return t
+
+
+def unsubscribe(key, callback, samples=10, rate=10):
+    t = trends.get((key, samples, rate))
+    if t is not None:
+        t.remove(callback)
@@ -256,3 +256,49 @@ def test_fd_target_resize_and_update(qtbot):
     assert widget.x() == 60
     assert widget.y() == 85
     assert widget.poly.polygon().count() == 4
+
+
+def test_ai_suspended_pitch_ladder_catches_up_on_resume(fix, qtbot):
+    _reset_ai_items(fix)
+    widget = ai.AI()
+    qtbot.addWidget(widget)
+    widget.resize(240, 220)
+    widget.suspend()
+    widget.setPitchItems = mock.Mock(wraps=widget.setPitchItems)
+
+    widget.setPitchAngle(12)
+    widget.setPitchAngle(14)
+
+    assert widget.pitchAngle == 14
+    widget.setPitchItems.assert_not_called()
+
+    widget.resume()
+
+    widget.setPitchItems.assert_called_once_with()
+    visible = [angle for angle, item in widget.pitchItems if item.opacity() > 0]
+    assert all(abs(angle - 14) < widget.visiblePitchAngle for angle in visible)
+
+
+def test_ai_pitch_ladder_only_touches_marks_crossing_the_window(fix, qtbot):
+    _reset_ai_items(fix)
+    widget = ai.AI()
+    qtbot.addWidget(widget)
+    widget.resize(240, 220)
+    widget.resizeEvent(None)
+
+    for angle in (0, 3, 20, -45, -44.5, 90, -90, 7.2):
+        widget.setPitchAngle(angle)
+        for mark, item in widget.pitchItems:
+            shown = abs(mark - widget.pitchAngle) < widget.visiblePitchAngle
+            assert item.opacity() == pytest.approx(widget.pitchOpacity if shown else 0)
+
+    items = [mock.Mock() for each in widget.pitchItems]
+    widget.pitchItems = [(each[0], item) for each, item in zip(widget.pitchItems, items)]
+    widget.setPitchAngle(7.4)
+
+    assert sum(item.setOpacity.call_count for item in items) == 0
+
+    widget.setPitchAngle(10.5)
+
+    changed = [each[0] for each in widget.pitchItems if each[1].setOpacity.called]
+    assert changed == [-7, -6, -5, 23, 24, 25]
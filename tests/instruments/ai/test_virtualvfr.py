@@ -10,6 +10,15 @@ from PyQt6.QtWidgets import QApplication, QGraphicsView, QWidget
 
 vfr_module = importlib.import_module("pyefis.instruments.ai.VirtualVfr")
 VirtualVfr = vfr_module.VirtualVfr
+PAPI_PARTS = [vfr_module.PAPI + i for i in range(4)]
+
+
+def _item(widget, key, part):
+    return widget.scene_items.item(key, part)
+
+
+def _papi(widget, key):
+    return [_item(widget, key, part) for part in PAPI_PARTS]
 
 
 @pytest.fixture
@@ -45,7 +54,12 @@ class FakePointOfView:
         self.update_position = mock.Mock()
         self.update_altitude = mock.Mock()
         self.update_heading = mock.Mock()
+        self.update_groundspeed = mock.Mock()
+        self.label_grid = vfr_module.LabelGrid()
+        self.start_loader = mock.Mock()
+        self.stop_loader = mock.Mock()
         self.render = mock.Mock()
+        self.resize = mock.Mock()
         FakePointOfView.instances.append(self)
 
     def initialize(self, *args):
@@ -119,6 +133,28 @@ def test_virtualvfr_resize_initializes_pov_and_renders_when_data_is_good(
     assert widget.rendering_prohibited() is False
 
 
+def test_virtualvfr_resize_keeps_chart_data_and_connections(fix, fake_pov, qtbot):
+    widget, _parent, pov = _make_widget(fix, fake_pov, qtbot)
+    items = (widget.lat_item, widget.lng_item, widget.head_item, widget.alt_item)
+    receivers = [item.receivers(item.valueChanged[float]) for item in items]
+    pool = widget.scene_items
+
+    for width in (300, 340, 360):
+        widget.resize(width, 240)
+
+    assert fake_pov.instances == [pov]
+    assert len(pov.initialize_calls) == 1
+    pov.stop_loader.assert_not_called()
+    pov.resize.assert_called_with(widget.scene.width())
+    assert [item.receivers(item.valueChanged[float]) for item in items] == receivers
+    assert widget.scene_items is not pool
+    assert widget.scene_items.scene is widget.scene
+
+    with mock.patch.object(pov, "update_altitude") as update_altitude:
+        fix.db.set_value("ALT", 1500)
+    update_altitude.assert_called_once_with(1500)
+
+
 def test_virtualvfr_resize_uses_next_metadata_paths_when_current_is_expired(
     fix, fake_pov, qtbot, tmp_path
 ):
@@ -298,17 +334,16 @@ def test_virtualvfr_quality_flags_clear_vfr_objects_and_drive_blank_state(
     fix, fake_pov, qtbot
 ):
     widget, _parent, _pov = _make_widget(fix, fake_pov, qtbot)
-    runway = widget.scene.addRect(0, 0, 20, 20)
-    light = widget.scene.addEllipse(0, 0, 5, 5)
-    widget.display_objects = {"runway": runway, "papi": [light]}
+    runway, _ = widget.scene_items.acquire(0, vfr_module.RUNWAY, vfr_module.QGraphicsPolygonItem)
+    light, _ = widget.scene_items.acquire(0, vfr_module.PAPI, vfr_module.QGraphicsEllipseItem)
 
     widget.setLatBad(True)
 
     assert widget.getVfrBad() is True
     assert widget.rendering_prohibited() is True
-    assert widget.display_objects == {}
-    assert runway.scene() is None
-    assert light.scene() is None
+    assert len(widget.scene_items) == 0
+    assert not runway.isVisible()
+    assert not light.isVisible()
 
     widget.setLatBad(False)
     widget.setHeadOld(True)
@@ -459,19 +494,14 @@ def test_virtualvfr_runway_render_creates_updates_and_eliminates_scene_items(
         zoom=100,
     )
 
-    expected_keys = {
-        "RW09LKCMH",
-        "RW09LKCMH_c",
-        "RW09LKCMH_e",
-        "RW09LKCMH_p",
-        "RW09LKCMH09L",
-    }
-    assert expected_keys.issubset(widget.display_objects)
-    assert len(widget.display_objects["RW09LKCMH_p"]) == 4
+    for part in vfr_module.RUNWAY_PARTS:
+        if part != vfr_module.RECIPROCAL_LABEL:
+            assert _item(widget, "RW09LKCMH", part) is not None
     assert widget.gsi_item.value == pytest.approx(1.0)
     widget.gsi_item.output_value.assert_called_once_with()
 
-    runway_item = widget.display_objects["RW09LKCMH"]
+    runway_item = _item(widget, "RW09LKCMH", vfr_module.RUNWAY)
+    papi_lights = _papi(widget, "RW09LKCMH")
     old_polygon = runway_item.polygon()
     widget.render_runway(
         (-50, 90),
@@ -487,15 +517,54 @@ def test_virtualvfr_runway_render_creates_updates_and_eliminates_scene_items(
         zoom=100,
     )
 
-    assert widget.display_objects["RW09LKCMH"] is runway_item
+    assert _item(widget, "RW09LKCMH", vfr_module.RUNWAY) is runway_item
+    assert _papi(widget, "RW09LKCMH") == papi_lights
     assert runway_item.polygon() != old_polygon
 
-    papi_lights = widget.display_objects["RW09LKCMH_p"]
     widget.eliminate_runway("RW09L", "KCMH")
 
-    assert not any(key.startswith("RW09LKCMH") for key in widget.display_objects)
-    assert runway_item.scene() is None
-    assert all(light.scene() is None for light in papi_lights)
+    assert len(widget.scene_items) == 0
+    assert not runway_item.isVisible()
+    assert not any(light.isVisible() for light in papi_lights)
+    assert runway_item.scene() is widget.scene
+
+
+def test_virtualvfr_scene_items_are_reused_for_other_objects(fix, fake_pov, qtbot):
+    widget, _parent, _pov = _make_widget(fix, fake_pov, qtbot)
+    item_count = len(widget.scene.items())
+
+    widget.render_airport((0, 0), "Port Columbus", "KCMH", 100, [])
+    label = _item(widget, "KCMH", vfr_module.AIRPORT_LABEL)
+    widget.eliminate_airport("KCMH")
+    widget.render_airport((20, 20), "Bolton", "KTZR", 100, [])
+
+    assert _item(widget, "KTZR", vfr_module.AIRPORT_LABEL) is label
+    assert label.isVisible()
+    assert label.text() == "KTZR"
+    assert len(widget.scene.items()) == item_count + 1
+    assert widget.scene_items.item("KCMH", vfr_module.AIRPORT_LABEL) is None
+    assert list(widget.scene_items.rects) == ["KTZR"]
+
+
+def test_virtualvfr_scene_pool_keeps_nothing_for_released_objects(fix, fake_pov, qtbot):
+    widget, _parent, _pov = _make_widget(fix, fake_pov, qtbot)
+    pool = widget.scene_items
+
+    widget.eliminate_airport("KNEVER")
+    widget.eliminate_navaid("NEVER")
+    widget.eliminate_runway("RW01", "KNEVER")
+    assert pool.items == {}
+
+    for n in range(50):
+        widget.render_airport((0, 0), "Airport", f"K{n:03}", 100, [])
+        widget.eliminate_airport(f"K{n:03}")
+        widget.render_navaid((0, 0), f"V{n:02}")
+        widget.eliminate_navaid(f"V{n:02}")
+
+    assert pool.items == {}
+    assert pool.rects == {}
+    # The navaid labels reuse the airport label released before them
+    assert len(pool.spare[vfr_module.QGraphicsSimpleTextItem]) == 1
 
 
 def test_virtualvfr_runway_render_covers_hidden_water_and_reciprocal_branches(
@@ -518,7 +587,7 @@ def test_virtualvfr_runway_render_covers_hidden_water_and_reciprocal_branches(
         zoom=100,
     )
 
-    assert "RW18WKWTR" not in widget.display_objects
+    assert _item(widget, "RW18WKWTR", vfr_module.RUNWAY) is None
 
     widget.show()
     qtbot.waitExposed(widget)
@@ -536,9 +605,9 @@ def test_virtualvfr_runway_render_covers_hidden_water_and_reciprocal_branches(
         zoom=100,
     )
 
-    runway = widget.display_objects["RW18WKWTR"]
+    runway = _item(widget, "RW18WKWTR", vfr_module.RUNWAY)
     assert runway.brush().color() == QColor("#000070")
-    assert "RW18WKWTR36W" in widget.display_objects
+    assert _item(widget, "RW18WKWTR", vfr_module.RECIPROCAL_LABEL).text() == "3 6W"
 
 
 @pytest.mark.parametrize("altitude", [455, 577])
@@ -562,7 +631,7 @@ def test_virtualvfr_runway_render_covers_additional_papi_angles(
         zoom=100,
     )
 
-    assert f"RW09LKPAPI{altitude}_p" in widget.display_objects
+    assert None not in _papi(widget, f"RW09LKPAPI{altitude}")
 
 
 def test_virtualvfr_runway_render_removes_existing_centerline_label_and_papi(
@@ -583,10 +652,10 @@ def test_virtualvfr_runway_render_removes_existing_centerline_label_and_papi(
         airport_id="KDEL",
         zoom=100,
     )
-    assert "RW09LKDEL_c" in widget.display_objects
-    assert "RW09LKDEL09L" in widget.display_objects
-    assert "RW09LKDEL_e" in widget.display_objects
-    assert "RW09LKDEL_p" in widget.display_objects
+    assert _item(widget, "RW09LKDEL", vfr_module.CENTERLINE) is not None
+    assert _item(widget, "RW09LKDEL", vfr_module.RUNWAY_LABEL) is not None
+    assert _item(widget, "RW09LKDEL", vfr_module.EXTENDED_CENTERLINE) is not None
+    assert None not in _papi(widget, "RW09LKDEL")
 
     widget.render_runway(
         (-1, 0),
@@ -602,11 +671,11 @@ def test_virtualvfr_runway_render_removes_existing_centerline_label_and_papi(
         zoom=100,
     )
 
-    assert "RW09LKDEL_c" not in widget.display_objects
-    assert "RW09LKDEL09L" not in widget.display_objects
-    assert "RW09LKDEL27R" not in widget.display_objects
-    assert "RW09LKDEL_e" not in widget.display_objects
-    assert "RW09LKDEL_p" not in widget.display_objects
+    assert _item(widget, "RW09LKDEL", vfr_module.CENTERLINE) is None
+    assert _item(widget, "RW09LKDEL", vfr_module.RUNWAY_LABEL) is None
+    assert _item(widget, "RW09LKDEL", vfr_module.RECIPROCAL_LABEL) is None
+    assert _item(widget, "RW09LKDEL", vfr_module.EXTENDED_CENTERLINE) is None
+    assert _papi(widget, "RW09LKDEL") == [None] * 4
 
 
 def test_virtualvfr_runway_render_small_fresh_runway_and_narrow_label_noop(
@@ -627,7 +696,7 @@ def test_virtualvfr_runway_render_small_fresh_runway_and_narrow_label_noop(
         airport_id="KTINY",
         zoom=100,
     )
-    assert "RW09LKTINY_c" not in widget.display_objects
+    assert _item(widget, "RW09LKTINY", vfr_module.CENTERLINE) is None
 
     widget.min_font_width = 1000
     widget.render_runway(
@@ -643,8 +712,8 @@ def test_virtualvfr_runway_render_small_fresh_runway_and_narrow_label_noop(
         airport_id="KNOLABEL",
         zoom=100,
     )
-    assert "RW09LKNOLABEL_c" in widget.display_objects
-    assert "RW09LKNOLABEL09L" not in widget.display_objects
+    assert _item(widget, "RW09LKNOLABEL", vfr_module.CENTERLINE) is not None
+    assert _item(widget, "RW09LKNOLABEL", vfr_module.RUNWAY_LABEL) is None
 
 
 def test_virtualvfr_runway_render_removes_label_when_font_no_longer_fits(
@@ -665,7 +734,7 @@ def test_virtualvfr_runway_render_removes_label_when_font_no_longer_fits(
         airport_id="KLBL",
         zoom=100,
     )
-    assert "RW09LKLBL09L" in widget.display_objects
+    assert _item(widget, "RW09LKLBL", vfr_module.RUNWAY_LABEL) is not None
 
     widget.min_font_width = 100
     widget.render_runway(
@@ -682,8 +751,8 @@ def test_virtualvfr_runway_render_removes_label_when_font_no_longer_fits(
         zoom=100,
     )
 
-    assert "RW09LKLBL_c" in widget.display_objects
-    assert "RW09LKLBL09L" not in widget.display_objects
+    assert _item(widget, "RW09LKLBL", vfr_module.CENTERLINE) is not None
+    assert _item(widget, "RW09LKLBL", vfr_module.RUNWAY_LABEL) is None
 
 
 def test_virtualvfr_runway_render_removes_extended_line_and_papi_when_offscreen(
@@ -704,8 +773,8 @@ def test_virtualvfr_runway_render_removes_extended_line_and_papi_when_offscreen(
         airport_id="KOFF",
         zoom=100,
     )
-    assert "RW09LKOFF_e" in widget.display_objects
-    assert "RW09LKOFF_p" in widget.display_objects
+    assert _item(widget, "RW09LKOFF", vfr_module.EXTENDED_CENTERLINE) is not None
+    assert None not in _papi(widget, "RW09LKOFF")
 
     widget.render_runway(
         (1000, 80),
@@ -721,18 +790,11 @@ def test_virtualvfr_runway_render_removes_extended_line_and_papi_when_offscreen(
         zoom=100,
     )
 
-    assert "RW09LKOFF_e" not in widget.display_objects
-    assert "RW09LKOFF_p" not in widget.display_objects
-
-
-class NonDeletingDict(dict):
-    def __delitem__(self, key):
-        pass
+    assert _item(widget, "RW09LKOFF", vfr_module.EXTENDED_CENTERLINE) is None
+    assert _papi(widget, "RW09LKOFF") == [None] * 4
 
 
-def test_virtualvfr_eliminate_runway_covers_duplicate_extended_cleanup(
-    fix, fake_pov, qtbot
-):
+def test_virtualvfr_eliminate_runway_twice_is_noop(fix, fake_pov, qtbot):
     widget, _parent, _pov = _make_widget(fix, fake_pov, qtbot, width=360, height=260)
     widget.render_runway(
         (-40, 80),
@@ -747,10 +809,13 @@ def test_virtualvfr_eliminate_runway_covers_duplicate_extended_cleanup(
         airport_id="KDUP",
         zoom=100,
     )
-    widget.display_objects = NonDeletingDict(widget.display_objects)
 
     widget.eliminate_runway("RW09L", "KDUP")
-    widget.display_objects = {}
+    spare = sum(len(items) for items in widget.scene_items.spare.values())
+    widget.eliminate_runway("RW09L", "KDUP")
+
+    assert len(widget.scene_items) == 0
+    assert sum(len(items) for items in widget.scene_items.spare.values()) == spare
 
 
 def test_virtualvfr_eliminate_runway_covers_missing_and_minimal_items(
@@ -760,13 +825,12 @@ def test_virtualvfr_eliminate_runway_covers_missing_and_minimal_items(
 
     widget.eliminate_runway("RW01", "KNOPE")
 
-    runway = widget.scene.addRect(0, 0, 20, 20)
-    widget.display_objects = {"RW01KMIN": runway}
+    runway, _ = widget.scene_items.acquire("RW01KMIN", vfr_module.RUNWAY, vfr_module.QGraphicsPolygonItem)
 
     widget.eliminate_runway("RW01", "KMIN")
 
-    assert widget.display_objects == {}
-    assert runway.scene() is None
+    assert len(widget.scene_items) == 0
+    assert not runway.isVisible()
 
 
 @pytest.mark.parametrize(
@@ -810,8 +874,8 @@ def test_virtualvfr_airport_labels_respect_occupied_space(fix, fake_pov, qtbot):
 
     assert rect is not None
     assert blocked is None
-    assert "KCMH" in widget.display_objects
-    assert "KZZZ" not in widget.display_objects
+    assert _item(widget, "KCMH", vfr_module.AIRPORT_LABEL) is not None
+    assert _item(widget, "KZZZ", vfr_module.AIRPORT_LABEL) is None
 
 
 def test_virtualvfr_airport_update_nonintersecting_space_and_missing_eliminate(
@@ -835,26 +899,73 @@ def test_virtualvfr_airport_update_nonintersecting_space_and_missing_eliminate(
     assert blocked is None
 
 
+def test_label_grid_finds_overlaps_across_cells_and_clears():
+    grid = vfr_module.LabelGrid(cell_size=10)
+    wide = QRectF(-5, 0, 30, 4)
+    grid.add(wide)
+
+    assert grid.intersects(QRectF(18, 2, 3, 3))
+    assert grid.intersects(QRectF(-8, -2, 4, 4))
+    assert not grid.intersects(QRectF(18, 6, 3, 3))
+    assert not grid.intersects(QRectF(40, 0, 5, 5))
+    assert list(grid) == [wide]
+
+    grid.clear()
+
+    assert not grid.intersects(QRectF(18, 2, 3, 3))
+    assert len(grid) == 0
+
+
+def test_virtualvfr_airport_labels_use_grid_and_label_budget(fix, fake_pov, qtbot):
+    widget, _parent, _pov = _make_widget(fix, fake_pov, qtbot)
+    grid = vfr_module.LabelGrid(limit=2)
+
+    first = widget.render_airport((-100, 0), "Port Columbus", "KCMH", 100, grid)
+    grid.add(first)
+    blocked = widget.render_airport((-100, 0), "Nearby", "KZZZ", 100, grid)
+    over = widget.render_airport((100, 0), "Far away", "KFAR", 100, grid)
+
+    assert first is not None
+    assert blocked is None
+    assert over is None
+    assert _item(widget, "KZZZ", vfr_module.AIRPORT_LABEL) is None
+    assert _item(widget, "KFAR", vfr_module.AIRPORT_LABEL) is None
+
+    grid.clear()
+    assert widget.render_airport((100, 0), "Far away", "KFAR", 100, grid) is not None
+
+
+def test_virtualvfr_max_labels_sets_pov_label_budget(fix, fake_pov, qtbot):
+    _set_vfr_values(fix)
+    parent = ConfigParent()
+    parent.config["max_labels"] = 25
+    widget = VirtualVfr(font_percent=0.15)
+    widget.myparent = parent
+    _show_widget(qtbot, widget, 320, 240)
+
+    assert fake_pov.instances[-1].label_grid.limit == 25
+
+
 def test_virtualvfr_navaid_render_updates_and_eliminates_items(fix, fake_pov, qtbot):
     widget, _parent, _pov = _make_widget(fix, fake_pov, qtbot)
 
     widget.render_navaid((12, -8), "APE")
-    icon = widget.display_objects["APE"]
-    label = widget.display_objects["APE_l"]
+    icon = _item(widget, "APE", vfr_module.NAVAID_ICON)
+    label = _item(widget, "APE", vfr_module.NAVAID_LABEL)
     first_x = label.x()
 
     widget.render_navaid((32, 14), "APE")
 
-    assert widget.display_objects["APE"] is icon
-    assert widget.display_objects["APE_l"] is label
+    assert _item(widget, "APE", vfr_module.NAVAID_ICON) is icon
+    assert _item(widget, "APE", vfr_module.NAVAID_LABEL) is label
     assert label.x() != first_x
 
     widget.eliminate_navaid("APE")
 
-    assert "APE" not in widget.display_objects
-    assert "APE_l" not in widget.display_objects
-    assert icon.scene() is None
-    assert label.scene() is None
+    assert _item(widget, "APE", vfr_module.NAVAID_ICON) is None
+    assert _item(widget, "APE", vfr_module.NAVAID_LABEL) is None
+    assert not icon.isVisible()
+    assert not label.isVisible()
 
 
 def test_virtualvfr_eliminate_missing_navaid_is_noop(fix, fake_pov, qtbot):
@@ -862,7 +973,7 @@ def test_virtualvfr_eliminate_missing_navaid_is_noop(fix, fake_pov, qtbot):
 
     widget.eliminate_navaid("NOPE")
 
-    assert widget.display_objects == {}
+    assert len(widget.scene_items) == 0
 
 
 @pytest.mark.parametrize(
@@ -1015,6 +1126,148 @@ def test_pointofview_update_cache_matches_runways_and_purges_stale_blocks(monkey
     assert calls == []
 
 
+def test_pointofview_update_cache_keeps_recent_blocks_up_to_capacity(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        vfr_module.CIFPObjects,
+        "find_objects",
+        lambda _db, _idx, lat, lng: calls.append((lat, lng)) or [],
+    )
+    pov = vfr_module.PointOfView("/db", "/idx", 0.25)
+    pov.tile_cache_size = 12
+    pov.match_runways = mock.Mock()
+    pov.gps_lat = 40.5
+    pov.gps_lng = -83.5
+    pov.update_cache()
+    assert len(calls) == 9
+    pov.match_runways.assert_called_once_with()
+
+    # Crossing a degree boundary only loads the new column
+    calls.clear()
+    pov.last_cache_time = None
+    pov.gps_lng = -82.5
+    pov.update_cache()
+    assert sorted(calls) == [(39, -81), (40, -81), (41, -81)]
+    assert len(pov.object_cache) == 12
+    assert (40, -84) in pov.object_cache
+
+    # Flying back finds the old column still cached and nothing is matched
+    calls.clear()
+    pov.match_runways.reset_mock()
+    pov.last_cache_time = None
+    pov.gps_lng = -83.5
+    pov.update_cache()
+    assert calls == []
+    pov.match_runways.assert_not_called()
+
+    pov.tile_cache_size = 9
+    pov.last_cache_time = None
+    pov.update_cache()
+    assert len(pov.object_cache) == 9
+    assert (40, -81) not in pov.object_cache
+
+
+def test_tile_loader_loads_and_pairs_runways_in_background(qtbot, monkeypatch):
+    runway_09 = vfr_module.CIFPObjects.Runway()
+    runway_09.airport_id = "KCMH"
+    runway_09.name = "RW09L"
+    runway_27 = vfr_module.CIFPObjects.Runway()
+    runway_27.airport_id = "KCMH"
+    runway_27.name = "RW27R"
+    runway_18 = vfr_module.CIFPObjects.Runway()
+    runway_18.airport_id = "KCMH"
+    runway_18.name = "RW18"
+    other = object()
+    threads = []
+
+    def find_objects(_dbpath, _index_path, lat, lng):
+        threads.append(vfr_module.QThread.currentThread())
+        return [runway_09, other, runway_27, runway_18]
+
+    monkeypatch.setattr(vfr_module.CIFPObjects, "find_objects", find_objects)
+    results = []
+    loader = vfr_module.TileLoader("/db", "/idx", lambda *args: results.append(args))
+    try:
+        loader.request((40, -83))
+        loader.request((40, -83))
+        assert loader.busy()
+        qtbot.waitUntil(lambda: len(results) == 1)
+    finally:
+        loader.stop()
+
+    assert threads[0] is not vfr_module.QThread.currentThread()
+    assert len(threads) == 1
+    assert loader.busy() is False
+    block, objects = results[0]
+    assert block == (40, -83)
+    assert objects == [runway_09, other, runway_18]
+    assert runway_09.matched() is True
+
+
+def test_pointofview_loader_prefetches_along_track_and_holds_partial_loads():
+    pov = vfr_module.PointOfView("/db", "/idx", 0.25)
+    pov.loader = mock.Mock()
+    pov.loader.busy.return_value = False
+    pov.redraw = mock.Mock()
+    pov.gps_lat = 40.5
+    pov.gps_lng = -83.5
+    pov.true_heading = 0
+    pov.groundspeed = 600
+
+    pov.update_cache()
+
+    requested = [c.args[0] for c in pov.loader.request.call_args_list]
+    assert requested[:9] == list(pov.cache_window())
+    assert set(requested[9:]) - set(requested[:9]) == {(42, -84), (42, -83), (42, -82)}
+    assert pov.object_cache == {}
+
+    pov.loader.busy.return_value = True
+    pov.tile_loaded((40, -83), ["airport"])
+    assert pov.object_cache == {}
+    pov.redraw.assert_not_called()
+
+    pov.loader.busy.return_value = False
+    pov.tile_loaded((42, -83), [])
+    assert pov.object_cache == {(40, -83): ["airport"], (42, -83): []}
+    assert pov.loaded_tiles == {}
+    assert pov.do_render is True
+    pov.redraw.assert_called_once_with()
+
+    pov.groundspeed = 0
+    pov.prefetch()
+    assert pov.prefetch_blocks == set()
+
+
+def test_pointofview_start_and_stop_loader(qtbot):
+    pov = vfr_module.PointOfView("/db", "/idx", 0.25)
+    pov.start_loader()
+    loader = pov.loader
+    pov.start_loader()
+    assert pov.loader is loader
+    assert loader.thread.isRunning()
+
+    pov.stop_loader()
+    assert pov.loader is None
+    assert loader.thread.isRunning() is False
+
+
+def test_pointofview_only_looks_at_blocks_around_aircraft():
+    near = RenderableObject("Custom", lat=40.5, lng=-83.5)
+    far = RenderableObject("Custom", lat=45.5, lng=-90.5)
+    pov = vfr_module.PointOfView("/db", "/idx", 0.25)
+    pov.gps_lat = 40
+    pov.gps_lng = -83
+    pov.display_width = 320
+    pov.show_object_types = {"Custom"}
+    pov.do_render = True
+    pov.object_cache = {(45, -90): [far], (40, -83): [near]}
+
+    pov.render(object())
+
+    near.render.assert_called_once()
+    far.render.assert_not_called()
+
+
 def test_pointofview_update_cache_with_prepopulated_blocks_loops_without_loading(monkeypatch):
     calls = []
     monkeypatch.setattr(
@@ -1174,6 +1427,45 @@ def test_pointofview_update_screen_throttles_and_handles_poles(monkeypatch):
     assert normal_pov.do_render is True
 
 
+def test_pointofview_resize_rebuilds_view_screen_inside_refresh_period(monkeypatch):
+    pov = vfr_module.PointOfView("/db", "/idx", 100)
+    pov.gps_lat = 40
+    pov.gps_lng = -83
+    pov.display_width = 320
+    pov.altitude = 1000
+    pov.update_screen()
+    screen = pov.view_screen
+    pov.do_render = False
+    now = pov.last_time + 0.5
+    monkeypatch.setattr(vfr_module.time, "time", lambda: now)
+
+    pov.resize(640)
+
+    assert pov.display_width == 640
+    assert pov.view_screen is not screen
+    assert pov.do_render is True
+
+
+def test_pointofview_throttled_update_is_caught_up(monkeypatch):
+    pov = vfr_module.PointOfView("/db", "/idx", 100)
+    pov.last_time = 1000
+    monkeypatch.setattr(vfr_module.time, "time", lambda: 1000.5)
+
+    pov.update_screen()
+    assert pov.screen_throttle.pending()
+    pov.screen_throttle.cancel()
+
+    pov.update_position = mock.Mock()
+    pov.redraw = mock.Mock()
+    pov.deferred_update()
+    pov.update_position.assert_called_once_with(0, 0)
+    pov.redraw.assert_not_called()
+
+    pov.do_render = True
+    pov.deferred_update()
+    pov.redraw.assert_called_once_with()
+
+
 def test_pointofview_update_screen_can_flip_westward_yvec(monkeypatch):
     monkeypatch.setattr(vfr_module, "yvec_points_east", lambda *_args: False)
     pov = vfr_module.PointOfView("/db", "/idx", 0.25)
@@ -1215,6 +1507,53 @@ def test_pointofview_point2d_returns_projection_without_debug_logging():
     assert pov.point2D(40, -83) == "projected"
 
 
+def test_pointofview_project_matches_spatial_projection():
+    pov = vfr_module.PointOfView("/db", "/idx", 0.25)
+    pov.gps_lat = 40
+    pov.gps_lng = -83
+    pov.display_width = 320
+    pov.altitude = 3000
+    pov.elevation = 800
+    pov.true_heading = 90
+    pov.update_screen()
+    points = [(40.01, -82.9), (40.2, -82.5), (39.9, -82.95), (40, -83.2)]
+
+    projected = pov.project(points)
+    pov.view_matrix = None
+    expected = [pov.point2D(lat, lng) for lat, lng in points]
+
+    assert projected[3] is None
+    assert expected[3] is None
+    for p, e in zip(projected[:3], expected[:3]):
+        assert p == pytest.approx(e, abs=1e-6)
+
+
+def test_pointofview_render_projects_visible_objects_once():
+    pov = vfr_module.PointOfView("/db", "/idx", 0.25)
+    pov.gps_lat = 40
+    pov.gps_lng = -83
+    pov.display_width = 320
+    pov.altitude = 3000
+    pov.true_heading = 90
+    pov.show_object_types = {"Custom"}
+    pov.update_screen()
+    lookups = []
+    obj = RenderableObject("Custom", lat=40.01, lng=-82.9)
+    obj.opposing_rw = RenderableObject("Custom", lat=40.02, lng=-82.8)
+    obj.render.side_effect = lambda view, *_args: lookups.append(
+        (dict(view.projected), view.point2D(40.02, -82.8))
+    )
+    pov.object_cache = {(40, -83): [obj]}
+    pov.project = mock.Mock(wraps=pov.project)
+
+    pov.render(object())
+
+    pov.project.assert_called_once_with([(40.01, -82.9), (40.02, -82.8)])
+    projected, point = lookups[0]
+    assert point == projected[(40.02, -82.8)]
+    assert pov.projected is None
+
+
 class ThetaVector:
     def __init__(self, theta):
         self.theta = theta
@@ -1248,3 +1587,27 @@ def test_yvec_points_east_wraps_theta_differences(vector_theta, pov_theta, expec
         )
         is expected
     )
+
+
+def test_virtualvfr_suspended_setters_resync_on_resume(fix, fake_pov, qtbot):
+    widget, _parent, pov = _make_widget(fix, fake_pov, qtbot)
+    for mocked in (pov.render, pov.update_position, pov.update_altitude, pov.update_heading):
+        mocked.reset_mock()
+
+    widget.suspend()
+    widget.setLatitude(40.1)
+    widget.setLongitude(-83.1)
+    widget.setAltitude(1400)
+    widget.setHeading(270)
+
+    pov.update_position.assert_not_called()
+    pov.update_altitude.assert_not_called()
+    pov.update_heading.assert_not_called()
+    pov.render.assert_not_called()
+
+    widget.resume()
+
+    pov.update_altitude.assert_called_once_with(1400)
+    pov.update_heading.assert_called_once_with(270)
+    pov.update_position.assert_called_once_with(40.1, -83.1)
+    pov.render.assert_called_once_with(widget)
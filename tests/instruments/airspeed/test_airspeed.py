@@ -3,7 +3,9 @@ from unittest import mock
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QBrush, QPaintEvent
+from pyefis import fixhub
 from pyefis.instruments import airspeed
+from pyefis.instruments.NumericalDisplay import NumericalDisplay
 import pyefis.hmi as hmi
 
 
@@ -40,6 +42,28 @@ def test_aux_not_set_for_airspeed_tape(fix, qtbot):
     assert widget.Vne == 200
     assert widget.Vfe == 0
 
+def test_airspeed_face_cache(fix, qtbot):
+    widget = airspeed.Airspeed()
+    qtbot.addWidget(widget)
+    widget.resize(200, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.paintEvent(None)
+    face = widget.face
+    assert face is not None
+    # Only the needle moves with the airspeed
+    widget.setAirspeed(95)
+    widget.paintEvent(None)
+    assert widget.face is face
+    # V speeds and size are part of the face
+    widget.Vne = 150
+    widget.paintEvent(None)
+    assert widget.face is not face
+    face = widget.face
+    widget.resize(250, 250)
+    widget.paintEvent(None)
+    assert widget.face is not face
+
 def test_numerical_airspeed(fix, qtbot):
     widget = airspeed.Airspeed()
     assert widget.getRatio() == 1
@@ -164,3 +188,20 @@ def test_airspeed_box_explicit_ias_mode_and_hidden_updates(fix, qtbot):
 
     assert widget.valueText == "111"
     widget.update.assert_called()
+
+
+def test_airspeed_tape_resize_reuses_display_and_subscriptions(fix, qtbot):
+    widget = airspeed.Airspeed_Tape()
+    qtbot.addWidget(widget)
+    widget.resize(100, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    display = widget.numerical_display
+    for width in (90, 110, 120):
+        widget.resize(width, 200)
+    assert widget.numerical_display is display
+    assert widget.findChildren(NumericalDisplay) == [display]
+    assert fixhub.subscriptions["IAS"].count() == 4
+    with mock.patch.object(NumericalDisplay, "bad", new_callable=mock.PropertyMock) as bad:
+        fix.db.get_item("IAS").bad = True
+    bad.assert_called_once_with(True)
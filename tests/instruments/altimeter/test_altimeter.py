@@ -4,7 +4,9 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, qRound
 from PyQt6.QtGui import QColor, QBrush, QPen, QFont, QPainter, QPaintEvent, QFontMetrics
 from PyQt6 import QtGui
+from pyefis import fixhub
 from pyefis.instruments import altimeter
+from pyefis.instruments.NumericalDisplay import NumericalDisplay
 import pyefis.hmi as hmi
 from tests.utils import track_calls
 
@@ -44,6 +46,24 @@ def test_altimeter(fix,qtbot):
             widget.paintEvent(None)
             assert tracker2.was_called_with("setBrush",QBrush(QColor(Qt.GlobalColor.red)))
 
+def test_altimeter_face_cache(fix,qtbot):
+    widget = altimeter.Altimeter()
+    qtbot.addWidget(widget)
+    widget.resize(200,200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.paintEvent(None)
+    face = widget.face
+    assert face is not None
+    widget.setAltimeter(1500)
+    widget.paintEvent(None)
+    assert widget.face is face
+    # The face is drawn gray when the data is bad
+    fix.db.get_item("ALT").bad = True
+    widget.paintEvent(None)
+    assert widget.face is not face
+    fix.db.get_item("ALT").bad = False
+
 def test_altimeter_unit_switching(fix,qtbot):
     hmi.initialize({})
     widget = altimeter.Altimeter()
@@ -128,3 +148,41 @@ def test_altimeter_tape_unit_switching(fix,qtbot):
     widget.wheelEvent(None)
     widget.hide()
     widget.setUnitSwitching()
+
+
+def test_altimeter_tape_resize_reuses_display_and_subscriptions(fix, qtbot):
+    widget = altimeter.Altimeter_Tape()
+    qtbot.addWidget(widget)
+    widget.resize(100, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    display = widget.numerical_display
+    for width in (90, 110, 120):
+        widget.resize(width, 200)
+    assert widget.numerical_display is display
+    assert widget.findChildren(NumericalDisplay) == [display]
+    assert fixhub.subscriptions["ALT"].count() == 4
+    with mock.patch.object(NumericalDisplay, "old", new_callable=mock.PropertyMock) as old:
+        fix.db.get_item("ALT").old = True
+    old.assert_called_once_with(True)
+
+
+def test_altimeter_tape_only_draws_ticks_near_altitude(fix, qtbot):
+    widget = altimeter.Altimeter_Tape()
+    qtbot.addWidget(widget)
+    widget.resize(100, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    items = len(widget.scene.items())
+    assert items < 100
+
+    widget.setAltimeter(30000)
+    widget.redraw()
+    labels = [
+        int(item.toPlainText())
+        for item in widget.scene.items()
+        if item.isVisible() and hasattr(item, "toPlainText")
+    ]
+    assert len(widget.scene.items()) == items
+    assert 30000 in labels
+    assert min(labels) >= 28000 and max(labels) <= 32000
@@ -89,6 +89,74 @@ def test_simple_button(fix,mock_parent_widget,qtbot):
     #qtbot.wait(2000)
 
 
+def test_conditions_compiled_once_and_reevaluated_by_key(fix,mock_parent_widget,qtbot):
+    hmi.initialize({})
+    widget = button.Button(mock_parent_widget, config_file="tests/data/buttons/simple.yaml")
+    qtbot.addWidget(mock_parent_widget)
+    qtbot.addWidget(widget)
+    mock_parent_widget.show()
+    widget.show()
+    qtbot.waitExposed(widget)
+    assert widget._condition_index["HIDEBUTTON"] == {0, 1, 2, 3}
+    assert "INT" not in widget._condition_index
+    assert widget._volatile == [False, False, True, True]
+    hide = mock.Mock(wraps=widget._compiled[0])
+    widget._compiled[0] = hide
+    with mock.patch.object(button.pc, "pycond") as pycond:
+        with mock.patch.object(widget, "processConditions") as process:
+            fix.db.get_item("INT").value = 42
+            process.assert_not_called()
+        widget.processConditions()
+        widget.processConditions()
+        hide.assert_not_called()
+        fix.db.get_item("HIDEBUTTON").value = True
+        assert hide.call_count == 1
+        assert widget._title == "Show\nMenu"
+        pycond.assert_not_called()
+
+def test_style_sheet_only_applied_on_change(fix,mock_parent_widget,qtbot):
+    hmi.initialize({})
+    widget = button.Button(mock_parent_widget, config_file="tests/data/buttons/simple.yaml")
+    qtbot.addWidget(mock_parent_widget)
+    qtbot.addWidget(widget)
+    widget.resize(100,80)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.setStyle()
+    sheet = widget._button.styleSheet()
+    with mock.patch.object(widget._button, "setStyleSheet") as set_sheet, \
+         mock.patch.object(widget._button, "setFont") as set_font:
+        widget.setStyle()
+        widget.setStyle('set text', "Units")
+        set_sheet.assert_not_called()
+        set_font.assert_not_called()
+        widget.enc_highlight(True)
+        widget.enc_highlight(True)
+        assert set_sheet.call_count == 1
+        assert "#ffa500" in set_sheet.call_args.args[0]
+        widget.enc_highlight(False)
+        assert set_sheet.call_args.args[0] == sheet
+        set_font.assert_not_called()
+    assert button.Button.style_sheets[widget._style_key] == sheet
+
+def test_conditions_deferred_while_suspended(fix,mock_parent_widget,qtbot):
+    hmi.initialize({})
+    widget = button.Button(mock_parent_widget, config_file="tests/data/buttons/simple.yaml")
+    qtbot.addWidget(mock_parent_widget)
+    qtbot.addWidget(widget)
+    title = widget._title
+    widget.suspend()
+    with mock.patch.object(widget, "processConditions", wraps=widget.processConditions) as process:
+        fix.db.get_item("HIDEBUTTON").value = True
+        fix.db.get_item("HIDEBUTTON").value = False
+        fix.db.get_item("HIDEBUTTON").value = True
+        process.assert_not_called()
+        assert widget._title == title
+        widget.resume()
+        widget.resume()
+        assert process.call_count == 1
+    assert widget._title == "Show\nMenu"
+
 def test_toggle_button(fix,mock_parent_widget,qtbot):
     hmi.initialize({})
     widget = button.Button(mock_parent_widget, config_file="tests/data/buttons/toggle.yaml")
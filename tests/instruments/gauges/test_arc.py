@@ -2,7 +2,7 @@ import pytest
 from unittest import mock
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QBrush, QPen, QPaintEvent, QFontMetrics
+from PyQt6.QtGui import QColor, QBrush, QPen, QPaintEvent, QFontMetrics, QFont, QPainter
 from pyefis.instruments import gauges
 import pyefis.hmi as hmi
 from tests.utils import track_calls
@@ -126,3 +126,71 @@ def test_unknown_location(fix,qtbot):
     widget.resize(100,100)
     widget.show()
     widget.paintEvent(None)
+
+
+def test_arc_gauge_static_cache(fix,qtbot):
+    widget = gauges.ArcGauge(min_size=False)
+    widget.setDbkey("NUMOK")
+    qtbot.addWidget(widget)
+    widget.resize(300, 150)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.paintEvent(None)
+    pixmap = widget._static_pixmap
+    assert pixmap is not None
+
+    # Value changes only redraw the pointer and value
+    widget.setValue(55)
+    widget.paintEvent(None)
+    assert widget._static_pixmap is pixmap
+
+    # Range and color changes rebuild the static layer
+    widget.setAuxData({"highWarn": 70})
+    widget.paintEvent(None)
+    assert widget._static_pixmap is not pixmap
+    pixmap = widget._static_pixmap
+    widget.badFlag(True)
+    widget.paintEvent(None)
+    assert widget._static_pixmap is not pixmap
+    pixmap = widget._static_pixmap
+    widget.resize(200, 100)
+    widget.resizeEvent(None)
+    widget.paintEvent(None)
+    assert widget._static_pixmap is not pixmap
+
+    widget.invalidateStatic()
+    assert widget._static_pixmap is None
+    widget.cache_static = False
+    widget.paintEvent(None)
+    assert widget._static_pixmap is None
+
+
+def test_arc_gauge_units_are_drawn_in_the_name_font(fix,qtbot,monkeypatch):
+    widget = gauges.ArcGauge(min_size=False)
+    widget.setDbkey("NUMOK")
+    widget.setupGauge()
+    widget.name = "TEST"
+    widget.show_units = True
+    widget.name_font_mask = "0000"
+    widget.units_font_mask = "000"
+    qtbot.addWidget(widget)
+    widget.resize(300, 150)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.resizeEvent(None)
+
+    fonts = {}
+    drawText = QPainter.drawText
+    def record(p, *args):
+        for a in args:
+            if isinstance(a, str):
+                fonts[a] = QFont(p.font())
+        return drawText(p, *args)
+    monkeypatch.setattr(QPainter, "drawText", record)
+    for cache in (True, False):
+        fonts.clear()
+        widget.cache_static = cache
+        widget.invalidateStatic()
+        widget.grab()
+        assert fonts[widget.units] == fonts["TEST"]
+        assert fonts[widget.units].pointSizeF() == widget.nameFontSize
@@ -98,3 +98,21 @@ def test_horizontal_bar_gauge_optional_sections_hidden(fix, qtbot):
         widget.paintEvent(None)
 
     assert tracker.was_not_called_with("setColor", QColor(Qt.GlobalColor.black))
+
+
+def test_horizontal_bar_gauge_static_cache(fix,qtbot):
+    widget = gauges.HorizontalBar(min_size=False)
+    widget.setDbkey("NUMOK")
+    qtbot.addWidget(widget)
+    widget.resize(200, 100)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.paintEvent(None)
+    pixmap = widget._static_pixmap
+    assert pixmap is not None
+    widget.setValue(15)
+    widget.paintEvent(None)
+    assert widget._static_pixmap is pixmap
+    widget.annunciateFlag(True)
+    widget.paintEvent(None)
+    assert widget._static_pixmap is not pixmap
@@ -138,3 +138,20 @@ def test_vertical_bar_gauge_min_size_false(fix,qtbot):
     widget.resizeEvent(None)
     widget.paintEvent(None)
 
+
+def test_vertical_bar_gauge_static_cache(fix,qtbot):
+    widget = gauges.VerticalBar(min_size=False)
+    widget.setDbkey("NUMOK")
+    qtbot.addWidget(widget)
+    widget.resize(50, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.paintEvent(None)
+    pixmap = widget._static_pixmap
+    assert pixmap is not None
+    widget.setValue(15)
+    widget.paintEvent(None)
+    assert widget._static_pixmap is pixmap
+    widget.setAuxData({"lowWarn": 30})
+    widget.paintEvent(None)
+    assert widget._static_pixmap is not pixmap
@@ -5,6 +5,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QPaintEvent, QPen
 from PyQt6.QtWidgets import QApplication
 
+from pyefis import gui
 from pyefis.instruments import hsi
 from tests.utils import track_calls
 
@@ -280,3 +281,74 @@ def test_dg_tape_heading_and_events(fix, qtbot):
 
     assert widget.heading == 45
     assert widget.centerOn.call_count == 2
+
+
+def test_hsi_heading_coalesced_by_render_scheduler(fix, qtbot, monkeypatch):
+    widget = hsi.HSI(font_percent=0.1)
+    qtbot.addWidget(widget)
+    widget.resize(300, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    monkeypatch.setattr(gui, "render_scheduler", gui.RenderScheduler(30))
+
+    widget.rotate = mock.Mock()
+    widget.heading = 350
+    widget.heading = 10
+    widget.heading = 20
+    widget.rotate.assert_not_called()
+
+    gui.render_scheduler.flush()
+    assert widget.rotate.call_args_list[0].args == (-20,)
+    assert widget.rotate.call_count == 1
+    gui.render_scheduler.flush()
+    assert widget.rotate.call_count == 1
+
+
+def test_hsi_update_period_rotates_to_final_heading(fix, qtbot):
+    parent = mock.Mock()
+    parent.get_config_item = mock.Mock(return_value=0.05)
+    widget = hsi.HSI(font_percent=0.1)
+    widget.myparent = parent
+    qtbot.addWidget(widget)
+    widget.resize(300, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+
+    assert widget.update_period == 0.05
+    parent.get_config_item.assert_called_with("hsi_update_period")
+    widget.rotate = mock.Mock()
+    widget.heading = 10
+    widget.heading = 20
+    widget.heading = 30
+    assert widget.rotate.call_count == 1
+    assert widget.rotate.call_args.args == (-10,)
+
+    qtbot.waitUntil(lambda: widget.rotate.call_count == 2)
+    assert widget.rotate.call_args.args == (-20,)
+    assert widget.throttle.pending() is False
+
+
+def test_hsi_resize_rebuilds_labels_and_rotation(fix, qtbot):
+    _set_quality(fix.db.get_item("HEAD"))
+    _set_quality(fix.db.get_item("COURSE"))
+    fix.db.set_value("HEAD", 90)
+    widget = hsi.HSI()
+    qtbot.addWidget(widget)
+    widget.resize(300, 300)
+    widget.show()
+    qtbot.waitExposed(widget)
+    count = len(widget.labels)
+    for size in (250, 320, 300):
+        widget.resize(size, size)
+
+    assert len(widget.labels) == count
+    assert all(label.scene() is widget.scene for label in widget.labels)
+    # Turned by the heading once, not once per resize
+    assert widget.transform().m11() == pytest.approx(0, abs=1e-9)
+    assert widget.transform().m12() == pytest.approx(-1)
+
+    widget.setHeadBad(True)
+    widget.setHeadFail(True)
+    assert all(label.opacity() == 0 for label in widget.labels)
+    widget.resize(310, 310)
+    assert all(label.opacity() == 0 for label in widget.labels)
@@ -0,0 +1,65 @@
+import pytest
+from unittest import mock
+from PyQt6.QtGui import QFont, QFontMetricsF
+from PyQt6.QtWidgets import QApplication
+
+from pyefis.instruments import helpers
+
+
+@pytest.fixture
+def app(qtbot):
+    test_app = QApplication.instance()
+    if test_app is None:
+        test_app = QApplication([])
+    return test_app
+
+
+@pytest.fixture(autouse=True)
+def clear_font_cache():
+    helpers.font_fit_cache.clear()
+    yield
+    helpers.font_fit_cache.clear()
+
+
+def test_fit_to_mask_fits_the_tighter_dimension(app):
+    family = "DejaVu Sans Condensed"
+    for width, height in ((200, 20), (40, 200)):
+        size = helpers.fit_to_mask(width, height, "0000", family)
+        font = QFont(family)
+        font.setPointSizeF(size)
+        fm = QFontMetricsF(font)
+        assert fm.horizontalAdvance("0000") <= width
+        assert fm.boundingRect("0000").height() <= height
+        fit = max(fm.horizontalAdvance("0000") / width, fm.boundingRect("0000").height() / height)
+        assert fit == pytest.approx(0.98, abs=0.05)
+
+
+def test_fit_to_mask_leaves_room_for_units(app):
+    family = "DejaVu Sans Mono"
+    plain = helpers.fit_to_mask(120, 400, "000.0", family, numeric=True)
+    with_units = helpers.fit_to_mask(120, 400, "000.0", family, "degC", 0.8, True)
+    assert with_units < plain
+
+
+def test_fit_to_mask_is_memoized(app):
+    with mock.patch.object(helpers, "font_metrics", wraps=helpers.font_metrics) as metrics:
+        first = helpers.fit_to_mask(100, 30, "XXXX", "DejaVu Sans Condensed")
+        second = helpers.fit_to_mask(100, 30, "XXXX", "DejaVu Sans Condensed")
+    assert first == second
+    assert metrics.call_count == 1
+    assert helpers.font_metrics("DejaVu Sans Condensed") is helpers.font_metrics("DejaVu Sans Condensed")
+
+
+def test_font_fit_cache_drops_least_recently_used(app, monkeypatch):
+    monkeypatch.setattr(helpers, "font_fit_cache_size", 2)
+    helpers.fit_to_width(100, "9", "DejaVu Sans Mono")
+    helpers.fit_to_width(200, "9", "DejaVu Sans Mono")
+    helpers.fit_to_width(100, "9", "DejaVu Sans Mono")
+    helpers.fit_to_width(300, "9", "DejaVu Sans Mono")
+    assert list(helpers.font_fit_cache) == [
+        (100, "9", "DejaVu Sans Mono"),
+        (300, "9", "DejaVu Sans Mono"),
+    ]
+    assert helpers.fit_to_width(200, "9", "DejaVu Sans Mono") == pytest.approx(
+        2 * helpers.fit_to_width(100, "9", "DejaVu Sans Mono")
+    )
@@ -0,0 +1,71 @@
+import pytest
+from PyQt6.QtGui import QColor, QFont, QPen
+from PyQt6.QtWidgets import QApplication, QGraphicsScene
+
+from pyefis.instruments.tape import TapeScale
+
+
+@pytest.fixture
+def app(qtbot):
+    test_app = QApplication.instance()
+    if test_app is None:
+        test_app = QApplication([])
+    return test_app
+
+
+class Drawn:
+    def __init__(self):
+        self.values = []
+
+    def draw(self, tape, value):
+        self.values.append(value)
+        tape.line(0, -value, 10, -value, QPen())
+        if value % 20 == 0:
+            t = tape.text(str(value), QFont(), QColor(255, 255, 255))
+            t.setY(-value)
+
+
+def visible(scene):
+    return sorted(-item.y() for item in scene.items() if item.isVisible() and hasattr(item, "toPlainText"))
+
+
+def test_only_the_window_is_drawn_whatever_the_range(app):
+    counts = []
+    for last in (1000, 100000):
+        scene = QGraphicsScene()
+        drawn = Drawn()
+        tape = TapeScale(scene, 0, last, 10, drawn.draw, span=100)
+        tape.scroll(500)
+        counts.append(len(scene.items()))
+        assert min(drawn.values) == 350
+        assert max(drawn.values) == 650
+    assert counts[0] == counts[1]
+
+
+def test_scrolling_recycles_items(app):
+    scene = QGraphicsScene()
+    drawn = Drawn()
+    tape = TapeScale(scene, 0, 10000, 10, drawn.draw, span=100)
+    tape.scroll(500)
+    items = len(scene.items())
+
+    # Inside half a margin nothing changes
+    tape.scroll(540)
+    assert len(drawn.values) == 31
+
+    tape.scroll(5000)
+    tape.scroll(520)
+    assert len(scene.items()) == items
+    assert visible(scene) == list(range(380, 680, 20))
+    assert len(tape) == 31
+
+
+def test_descending_ticks_stop_at_the_ends(app):
+    scene = QGraphicsScene()
+    drawn = Drawn()
+    tape = TapeScale(scene, 100, 0, -10, drawn.draw, span=40, margin=20)
+    tape.scroll(5)
+    assert sorted(drawn.values) == [0, 10, 20, 30, 40]
+    tape.scroll(200)
+    assert len(tape) == 0
+    assert visible(scene) == []
@@ -5,6 +5,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QPaintEvent, QPen
 from PyQt6.QtWidgets import QApplication
 
+from pyefis import fixhub
 from pyefis.instruments import vsi
 from tests.utils import track_calls
 
@@ -75,6 +76,21 @@ def test_vsi_dial_defaults_setters_and_quality(fix, qtbot):
     assert tracker.was_called_with("__init__", QColor(Qt.GlobalColor.red))
 
 
+def test_vsi_dial_face_cache(fix, qtbot):
+    _reset_vs_item(fix)
+    widget = vsi.VSI_Dial()
+    event = _show_widget(qtbot, widget)
+    widget.paintEvent(event)
+    background = widget.background
+    assert background is not None
+    widget.roc = 1200
+    widget.paintEvent(event)
+    assert widget.background is background
+    widget.maxRange = 4000
+    widget.paintEvent(event)
+    assert widget.background is not background
+
+
 def test_vsi_pfd_value_branches_and_events(fix, qtbot):
     widget = vsi.VSI_PFD()
     event = _show_widget(qtbot, widget)
@@ -110,41 +126,35 @@ def test_vsi_pfd_resize_without_font_mask(fix, qtbot):
     assert widget.fontSize >= 0
 
 
-def test_as_trend_tape_tracks_changed_and_unchanged_values(fix, qtbot):
+def test_as_trend_tape_resizes_one_indicator_from_the_shared_trend(fix, qtbot):
     widget = vsi.AS_Trend_Tape()
     _show_widget(qtbot, widget)
+    widget.trend.timer.stop()
+    indicator = widget.indicator
+    items = len(widget.scene.items())
 
-    widget.setAS_Trend(10)
+    widget.setAS_Trend(111)
 
-    assert widget._airspeed == 10
-    assert widget._airspeed_trend == [10]
+    assert widget.trend.last == 111
+    assert list(widget.trend.changes) == [1]
+    # 1 knot in a tenth of a second
     assert widget._airspeed_diff == 600
+    assert indicator.rect().height() == -6000
 
-    widget.setAS_Trend(10)
-
-    assert widget._airspeed == 10
-    assert widget._airspeed_trend == [10, 0]
-
-    widget._airspeed_trend = list(range(widget.freq))
-    widget.setAS_Trend(20)
+    widget.setAS_Trend(111)
 
-    assert len(widget._airspeed_trend) == widget.freq
-    assert widget._airspeed_trend[-1] == 10
+    assert list(widget.trend.changes) == [1, 0]
+    assert widget._airspeed_diff == 300
 
-    widget._airspeed_trend = list(range(widget.freq))
-    widget.setAS_Trend(20)
+    # The timer reads IAS from the FIX database
+    fix.db.get_item("IAS").value = 112
+    for reading in range(widget.freq):
+        widget.trend.tick()
 
-    assert len(widget._airspeed_trend) == widget.freq
-    assert widget._airspeed_trend[-1] == 0
-
-    class NeitherEqualNorDifferent:
-        def __eq__(self, other):
-            return False
-
-        def __ne__(self, other):
-            return False
-
-    widget.setAS_Trend(NeitherEqualNorDifferent())
+    assert list(widget.trend.changes) == [1] + [0] * (widget.freq - 1)
+    assert widget._airspeed_diff == 60
+    assert widget.indicator is indicator
+    assert len(widget.scene.items()) == items
 
 
 def test_alt_trend_tape_resize_config_and_redraw_states(fix, qtbot):
@@ -216,6 +226,24 @@ def test_alt_trend_tape_default_update_period_and_throttle(fix, qtbot):
     widget.indicator_line.setRect.assert_not_called()
 
 
+def test_alt_trend_tape_throttle_redraws_final_value(fix, qtbot):
+    _reset_vs_item(fix)
+    widget = vsi.Alt_Trend_Tape()
+    widget.myparent = _parent(qtbot, update_period=0.05)
+    _show_widget(qtbot, widget)
+    widget.throttle.cancel()
+    widget.last_update_time = 0
+
+    widget.setVs(500)
+    widget.setVs(-500)
+    assert widget.indicator_line.rect().y() < widget.zero_y
+    assert widget.throttle.pending()
+
+    qtbot.waitUntil(lambda: not widget.throttle.pending())
+    assert widget.indicator_line.rect().y() == widget.zero_y
+    assert widget.vstext.toPlainText() == "-500"
+
+
 def test_alt_trend_tape_unchanged_setters_skip_redraw(fix, qtbot):
     _reset_vs_item(fix)
     widget = vsi.Alt_Trend_Tape()
@@ -230,3 +258,40 @@ def test_alt_trend_tape_unchanged_setters_skip_redraw(fix, qtbot):
 
     assert widget.getFail() is False
     widget.redraw.assert_not_called()
+
+
+def test_as_trend_tape_samples_but_skips_drawing_while_suspended(fix, qtbot):
+    widget = vsi.AS_Trend_Tape()
+    _show_widget(qtbot, widget)
+    widget.redraw = mock.Mock()
+
+    widget.suspend()
+    widget.trend.timer.stop()
+    widget.setAS_Trend(10)
+    widget.setAS_Trend(12)
+
+    assert list(widget.trend.changes) == [-100, 2]
+    widget.redraw.assert_not_called()
+
+    widget.resume()
+
+    widget.redraw.assert_called_once_with()
+
+
+def test_alt_trend_tape_resize_keeps_single_subscriptions(fix, qtbot):
+    item = _reset_vs_item(fix)
+    widget = vsi.Alt_Trend_Tape()
+    widget.myparent = _parent(qtbot, update_period=0)
+    _show_widget(qtbot, widget)
+    for height in (180, 220, 240):
+        widget.resize(300, height)
+
+    assert fixhub.subscriptions["VS"].count() == 4
+    with mock.patch.object(widget, "redraw") as redraw:
+        item.bad = True
+    redraw.assert_called_once_with()
+
+    # The indicator belongs to the current scene after a resize
+    item.bad = False
+    widget.setVs(500)
+    assert widget.indicator_line.scene() is widget.scene
@@ -17,6 +17,7 @@ from PyQt6.QtWidgets import QApplication, QWidget
 
 import pyefis.hmi as hmi
 from pyefis.screens import screenbuilder
+from pyefis.screens import screenbuilder_config
 from pyefis.screens.screenbuilder import Screen
 
 
@@ -512,6 +513,32 @@ instruments:
         assert screen.instrument_config[0]["span"]["rows"] == pytest.approx(2 * 4 / 3)
         assert screen.instrument_config[0]["span"]["columns"] == pytest.approx(3 * 6 / 5)
 
+    def test_substitute_replaces_placeholders_in_keys_and_strings_only(self, qtbot):
+        template = {
+            "dbkey": "COMACTFREQ{radio_id}",
+            "text": "{label}{label_long}",
+            "set": {"COMACTNAMESET{radio_id}": "{Name}", "value": 12},
+            "items": ["{radio_id}", 1.5, None, True],
+        }
+
+        result = screenbuilder_config.substitute(
+            template,
+            {"{radio_id}": 2, "{label}": "A", "{label_long}": "{label}"},
+        )
+
+        assert result == {
+            "dbkey": "COMACTFREQ2",
+            "text": "A{label}",
+            "set": {"COMACTNAMESET2": "{Name}", "value": 12},
+            "items": ["2", 1.5, None, True],
+        }
+        assert template["dbkey"] == "COMACTFREQ{radio_id}"
+        copied = screenbuilder_config.substitute(template, {})
+        assert copied == template
+        assert copied["set"] is not template["set"]
+        assert screenbuilder_config.placeholder_pattern(("{a}",)) is \
+            screenbuilder_config.placeholder_pattern(("{a}",))
+
     def test_include_can_be_resolved_from_preferences(self, fix, qtbot, tmp_path):
         include_file = tmp_path / "aliased.yaml"
         include_file.write_text(
@@ -1787,11 +1814,74 @@ class TestScreenBuilderLayout:
 
         screen.resize(200, 100)
         screen.resizeEvent(None)
-        assert screen.grid_layout_calls == 1
+        assert screen.grid_layout_calls == 0
+        qtbot.waitUntil(lambda: screen.grid_layout_calls == 1)
 
         screen.resize(300, 200)
         screen.resizeEvent(None)
-        assert screen.grid_layout_calls == 2
+        qtbot.waitUntil(lambda: screen.grid_layout_calls == 2)
+
+    def test_resize_events_in_a_row_are_laid_out_once(self, fix, qtbot):
+        config = _config_with_instruments([
+            {
+                "type": "static_text",
+                "row": 0,
+                "column": 0,
+                "span": {"rows": 1, "columns": 1},
+                "options": {"text": "Resize"},
+            }
+        ])
+        config["layout"] = {"rows": 1, "columns": 1}
+        screen = Screen(_TestParent(config))
+        qtbot.addWidget(screen)
+        screen.resize(100, 100)
+        screen.init_screen()
+        calls = []
+        original_grid_layout = screen.grid_layout
+        screen.grid_layout = lambda: calls.append(1) or original_grid_layout()
+
+        for width in (200, 300, 400):
+            screen.resize(width, 100)
+            screen.resizeEvent(None)
+        qtbot.waitUntil(lambda: calls == [1])
+        qtbot.wait(10)
+
+        assert calls == [1]
+        assert screen.instruments[0].geometry().getRect() == (0, 0, 400, 100)
+
+    def test_grid_layout_skips_unmoved_widgets_and_sets_up_once(self, fix, qtbot):
+        screen = Screen(_TestParent(_config_with_instruments([])))
+        qtbot.addWidget(screen)
+        screen.resize(300, 100)
+        screen.layout = {"rows": 1, "columns": 2}
+        left = _RatioWidget(screen, ratio=1)
+        right = _RatioWidget(screen, ratio=1)
+        screen.instruments = {0: left, 1: right}
+        screen.instrument_config = {
+            0: {"type": "ratio_widget", "row": 0, "column": 0},
+            1: {"type": "ratio_widget", "row": 0, "column": 1},
+        }
+        screen.grid_layout()
+        screen.init = True
+        geometries = []
+
+        def recorded(widget):
+            def setGeometry(rect):
+                geometries.append(rect.getRect())
+                QWidget.setGeometry(widget, rect)
+            return setGeometry
+
+        left.setGeometry = recorded(left)
+        right.setGeometry = recorded(right)
+
+        # The second pass finds both widgets already in place
+        screen.resize(300, 120)
+        screen.grid_layout()
+        screen.grid_layout()
+
+        assert geometries == [(15, 0, 120, 120), (165, 0, 120, 120)]
+        assert (left.setup_gauge_calls, right.setup_gauge_calls) == (1, 1)
+        assert screen.updatesEnabled()
 
     def test_horizontal_ganged_layout_places_grouped_widgets(self, fix, qtbot):
         config = _config_with_instruments([
@@ -1863,7 +1953,7 @@ class TestScreenBuilderLayout:
 
         assert screen.instruments[0].geometry().getRect() == (0, 10, 180, 180)
         assert screen.instruments[1].geometry().getRect() == (220, 10, 180, 180)
-        assert screen.instruments[0].setup_gauge_calls == 2
+        assert screen.instruments[0].setup_gauge_calls == 1
 
     def test_ganged_disabled_and_state_visibility(self, fix, qtbot):
         config = _config_with_instruments([
@@ -2358,6 +2448,53 @@ class TestScreenBuilderEncoder:
         assert widgets[0].highlight_calls == [False]
 
 
+class TestScreenBuilderSuspend:
+
+    def test_suspend_and_resume_reach_nested_instruments(self, fix, qtbot):
+        class Instrument(QWidget):
+            def __init__(self, parent=None):
+                super().__init__(parent)
+                self.calls = []
+
+            def suspend(self):
+                self.calls.append("suspend")
+
+            def resume(self):
+                self.calls.append("resume")
+
+        screen = Screen(_TestParent(_config_with_instruments([])))
+        qtbot.addWidget(screen)
+        outer = Instrument(screen)
+        inner = Instrument(QWidget(outer))
+
+        screen.suspend()
+        assert screen.suspended is True
+        screen.resume()
+
+        assert screen.suspended is False
+        assert outer.calls == ["suspend", "resume"]
+        assert inner.calls == ["suspend", "resume"]
+
+    def test_instruments_built_while_suspended_start_suspended(self, fix, qtbot):
+        screen = Screen(_TestParent(_config_with_instruments([
+            {
+                "type": "static_text",
+                "row": 0,
+                "column": 0,
+                "options": {"text": "Text"},
+            },
+        ])))
+        qtbot.addWidget(screen)
+        screen.suspend()
+        calls = []
+        screen.suspend = lambda: calls.append(screen.instruments)
+
+        screen.init_screen()
+
+        assert calls == [screen.instruments]
+        assert len(screen.instruments) == 1
+
+
 class TestScreenBuilderClose:
 
     def test_close_event_closes_each_instrument(self, fix, qtbot):
@@ -2408,6 +2545,28 @@ class TestScreenBuilderClose:
 
         screen.closeEvent(None)
 
+    def test_close_event_disconnects_fix_inputs_and_display_timer(self, fix, qtbot):
+        screen = Screen(_TestParent(_config_with_instruments([])))
+        qtbot.addWidget(screen)
+        screen.instruments = {}
+        screen.encoder_input = fix.db.get_item("INT")
+        screen.encoder_button_input = fix.db.get_item("HIDEBUTTON")
+        screen.encoder_input.valueWrite[int].connect(screen.encoderChanged)
+        screen.encoder_button_input.valueChanged[bool].connect(screen.encoderButtonChanged)
+        screen.timer = _FakeTimer(250)
+        screen.timer.add_callback(screen.change_display_states)
+        calls = []
+        screen.encoder_controller.changed = calls.append
+        screen.encoder_controller.button_changed = calls.append
+
+        screen.closeEvent(None)
+        screen.closeEvent(None)
+        screen.encoder_input.value = 3
+        screen.encoder_button_input.value = True
+
+        assert calls == []
+        assert screen.timer.callbacks == []
+
     def test_close_event_before_init_is_safe(self, fix, qtbot):
         screen = Screen(_TestParent(_config_with_instruments([])))
         qtbot.addWidget(screen)
@@ -177,3 +177,108 @@ def test_top_level_include_ignores_non_mapping_recursive_result(tmp_path):
         )
 
     assert result == {}
+
+
+@pytest.fixture
+def empty_caches(monkeypatch):
+    monkeypatch.setattr(cfg, "yaml_cache", {})
+    monkeypatch.setattr(cfg, "resolved_configs", {})
+    monkeypatch.setattr(cfg, "snapshot_dirty", True)
+
+
+def test_load_yaml_parses_once_and_returns_copies(tmp_path, empty_caches):
+    config = tmp_path / "config.yaml"
+    config.write_text("a:\n  - 1\n")
+
+    with patch("pyefis.cfg.yaml.load", wraps=cfg.yaml.load) as load:
+        first = cfg.load_yaml(str(config))
+        first["a"].append(2)
+        second = cfg.load_yaml(str(config))
+
+    assert load.call_count == 1
+    assert load.call_args.kwargs["Loader"] is getattr(cfg.yaml, "CSafeLoader", cfg.yaml.SafeLoader)
+    assert second == {"a": [1]}
+    assert cfg.load_yaml(str(config), shared=True) is cfg.load_yaml(str(config), shared=True)
+
+
+def test_snapshot_is_used_until_config_files_change(tmp_path, empty_caches):
+    config = tmp_path / "config.yaml"
+    included = tmp_path / "included.yaml"
+    snapshot = str(tmp_path / cfg.SNAPSHOT_FILE)
+    config.write_text("include: included.yaml\n")
+    included.write_text("value: 1\n")
+
+    assert cfg.load_config(str(config)) == {"value": 1}
+    assert cfg.save_snapshot(snapshot, str(tmp_path)) is True
+    assert cfg.snapshot_dirty is False
+
+    cfg.yaml_cache.clear()
+    cfg.resolved_configs.clear()
+    assert cfg.load_snapshot(snapshot, str(tmp_path)) is True
+    with patch("pyefis.cfg.from_yaml") as from_yaml_mock:
+        assert cfg.load_config(str(config)) == {"value": 1}
+    from_yaml_mock.assert_not_called()
+    assert cfg.snapshot_dirty is False
+
+    # A new file might be an include that shadows one in the base path
+    (tmp_path / "new.yaml").write_text("new: true\n")
+    assert cfg.load_snapshot(snapshot, str(tmp_path)) is False
+    cfg.save_snapshot(snapshot, str(tmp_path))
+    included.write_text("value: 22\n")
+    assert cfg.load_snapshot(snapshot, str(tmp_path)) is False
+
+    (tmp_path / cfg.SNAPSHOT_FILE).write_text("garbage")
+    assert cfg.load_snapshot(snapshot, str(tmp_path)) is False
+    assert cfg.load_snapshot(str(tmp_path / "missing"), str(tmp_path)) is False
+
+
+def test_compile_files_parses_every_config_file(tmp_path, empty_caches):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "button.yaml").write_text("type: simple\n")
+    (tmp_path / "broken.yaml").write_text("a: [\n")
+    (tmp_path / "notes.txt").write_text("a: 1\n")
+
+    cfg.compile_files(str(tmp_path))
+
+    assert list(cfg.yaml_cache) == [str(tmp_path / "sub" / "button.yaml")]
+    assert cfg.save_snapshot(str(tmp_path / "nodir" / "snap"), str(tmp_path)) is False
+
+
+def test_repeated_includes_are_resolved_once(tmp_path, empty_caches):
+    config = tmp_path / "config.yaml"
+    (tmp_path / "shared.yaml").write_text("shared:\n  value: 1\n")
+    (tmp_path / "list.yaml").write_text("items:\n  - one\n")
+    sections = "".join(
+        f"section{n}:\n  include: shared.yaml\n  things:\n    - include: list.yaml\n"
+        for n in range(600)
+    )
+    config.write_text(sections + "empty: {}\n")
+
+    with patch("pyefis.cfg.load_yaml", wraps=cfg.load_yaml) as load:
+        result = from_yaml(str(config))
+
+    assert len(result) == 601
+    assert result["section599"] == {"shared": {"value": 1}, "things": ["one"]}
+    assert result["empty"] == {}
+    assert load.call_count == 3
+    result["section0"]["shared"]["value"] = 2
+    assert result["section1"]["shared"]["value"] == 1
+
+
+def test_loop_detection_reports_the_include_stack(tmp_path, empty_caches):
+    (tmp_path / "a.yaml").write_text("include: b.yaml\n")
+    (tmp_path / "b.yaml").write_text("nested:\n  include: a.yaml\n")
+
+    with pytest.raises(RecursionError) as exc:
+        from_yaml(str(tmp_path / "a.yaml"))
+
+    assert str(exc.value).count("a.yaml") == 2
+    assert str(exc.value).count("b.yaml") == 1
+
+
+def test_empty_include_is_an_empty_config(tmp_path, empty_caches):
+    (tmp_path / "a.yaml").write_text("a:\n  include: e.yaml\nb:\n  include: c.yaml\n")
+    (tmp_path / "e.yaml").write_text("")
+    (tmp_path / "c.yaml").write_text("# include: d.yaml\n")
+
+    assert from_yaml(str(tmp_path / "a.yaml")) == {"a": {}, "b": {}}
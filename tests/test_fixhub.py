@@ -0,0 +1,198 @@
+import threading
+from unittest import mock
+
+import pytest
+from PyQt6 import sip
+from PyQt6.QtWidgets import QWidget
+
+from pyefis import fixhub
+
+
+@pytest.fixture(autouse=True)
+def clean_subscriptions():
+    fixhub.subscriptions.clear()
+    fixhub.mailbox = None
+    fixhub.coalesced_period = None
+    yield
+    fixhub.subscriptions.clear()
+    fixhub.mailbox = None
+    fixhub.coalesced_period = None
+
+
+class Consumer:
+    def __init__(self):
+        self.values = []
+        self.quality = []
+        self.changes = []
+
+    def setValue(self, value):
+        self.values.append(value)
+
+    def qualityChanged(self, flag, state):
+        self.quality.append((flag, state))
+
+    def dataChanged(self, key, event):
+        self.changes.append((key, event))
+
+
+class Label(QWidget):
+    def setValue(self, value):
+        self.setWindowTitle(str(value))
+
+
+def test_one_subscription_per_key_fans_out(fix):
+    first = Consumer()
+    second = Consumer()
+
+    item = fixhub.subscribe("NUMOK", "value", first.setValue)
+    assert fixhub.subscribe("NUMOK", "value", second.setValue) is item
+    fixhub.subscribe("NUMOK", "value", second.setValue)
+    assert len(fixhub.subscriptions) == 1
+    assert fixhub.subscriptions["NUMOK"].count() == 2
+
+    item.value = 42.0
+
+    assert first.values == [42.0]
+    assert second.values == [42.0]
+
+
+def test_quality_flags_and_changed_events(fix):
+    consumer = Consumer()
+    old = mock.Mock()
+    fixhub.subscribe("INT", "quality", consumer.qualityChanged)
+    fixhub.subscribe("INT", "old", old)
+    item = fixhub.subscribe("INT", "changed", consumer.dataChanged)
+
+    expected = []
+    for flag in fixhub.QUALITY_FLAGS:
+        state = not getattr(item, flag)
+        setattr(item, flag, state)
+        expected.append((flag, state))
+    item.value = item.value + 1
+
+    assert consumer.quality == expected
+    old.assert_called_once_with(expected[0][1])
+    assert consumer.changes == [
+        ("INT", "old"),
+        ("INT", "bad"),
+        ("INT", "fail"),
+        ("INT", "annunciate"),
+        ("INT", "value"),
+    ]
+
+
+def test_unsubscribe_and_dead_consumers_are_dropped(fix, qtbot):
+    consumer = Consumer()
+    item = fixhub.subscribe("NUMOK", "value", consumer.setValue)
+    fixhub.unsubscribe("NUMOK", "value", consumer.setValue)
+    fixhub.unsubscribe("NOPE", "value", consumer.setValue)
+    item.value = 1.0
+    assert consumer.values == []
+
+    fixhub.subscribe("NUMOK", "value", Consumer().setValue)
+    widget = Label()
+    fixhub.subscribe("NUMOK", "value", widget.setValue)
+    sip.delete(widget)
+    item.value = 2.0
+
+    assert fixhub.subscriptions["NUMOK"].count() == 0
+
+
+def test_new_database_gets_new_subscription(fix):
+    sub = fixhub.subscription("NUMOK")
+    fixhub.subscriptions["NUMOK"].item = object()
+
+    assert fixhub.subscription("NUMOK") is not sub
+
+    with pytest.raises(ValueError):
+        fixhub.subscribe("NUMOK", "nope", print)
+
+
+def test_client_thread_changes_are_coalesced_in_mailbox(fix, qtbot):
+    consumer = Consumer()
+    report = mock.Mock()
+    item = fixhub.subscribe("NUMOK", "value", consumer.setValue)
+    fixhub.subscribe("NUMOK", "changed", consumer.dataChanged)
+    fixhub.mailbox.report = report
+
+    def client():
+        for value in range(1, 51):
+            item.value = float(value)
+        item.bad = not item.bad
+
+    thread = threading.Thread(target=client)
+    thread.start()
+    thread.join()
+    assert consumer.values == []
+
+    qtbot.waitUntil(lambda: len(consumer.values) > 0, timeout=1000)
+
+    assert consumer.values == [50.0]
+    assert consumer.changes == [("NUMOK", "value"), ("NUMOK", "bad")]
+    report.assert_called_once_with({"NUMOK": 49})
+    assert fixhub.mailbox.coalesced == {"NUMOK": 49}
+    assert fixhub.mailbox.pending == {}
+
+
+def test_report_signal_reaches_subscribers(fix):
+    report = mock.Mock()
+    item = fixhub.subscribe("NUMOK", "report", report)
+    changed = mock.Mock()
+    fixhub.subscribe("NUMOK", "changed", changed)
+
+    item.reportReceived.emit()
+
+    report.assert_called_once_with()
+    changed.assert_not_called()
+
+
+def test_a_failing_consumer_does_not_drop_other_mailbox_updates(fix, qtbot):
+    consumer = Consumer()
+    first = fixhub.subscribe("NUMOK", "value", mock.Mock(side_effect=ValueError("broken")))
+    second = fixhub.subscribe("NUMBAD", "value", consumer.setValue)
+
+    def client():
+        first.value = 12.0
+        second.value = 34.0
+
+    thread = threading.Thread(target=client)
+    thread.start()
+    thread.join()
+
+    with pytest.raises(ValueError, match="broken"):
+        fixhub.mailbox.drain()
+    assert consumer.values == [34.0]
+    assert fixhub.mailbox.pending == {}
+
+
+def test_report_coalesced_logs_the_dropped_counts(fix, qtbot, monkeypatch):
+    log = mock.Mock()
+    monkeypatch.setattr(fixhub, "log", log)
+    fixhub.report_coalesced(60)
+    consumer = Consumer()
+    item = fixhub.subscribe("NUMOK", "value", consumer.setValue)
+    report = fixhub.mailbox.report
+    assert isinstance(report, fixhub.CoalescedLog)
+
+    def client():
+        for value in range(1, 11):
+            item.value = float(value)
+
+    thread = threading.Thread(target=client)
+    thread.start()
+    thread.join()
+    qtbot.waitUntil(lambda: consumer.values == [10.0], timeout=1000)
+
+    # Nothing is logged until the period is up
+    log.info.assert_not_called()
+    assert report.counts == {"NUMOK": 9}
+
+    report.start -= 60
+    report({"NUMOK": 1, "NUMBAD": 0})
+
+    log.info.assert_called_once()
+    assert "{'NUMOK': 10}" in log.info.call_args.args[0]
+    assert report.counts == {}
+
+    fixhub.report_coalesced(None)
+    assert fixhub.mailbox.report is None
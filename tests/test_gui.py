@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import QApplication, QWidget
 
 import pyefis.gui as gui
 import pyefis.hmi as hmi
+from pyefis import fixhub
 
 
 @pytest.fixture
@@ -32,6 +33,7 @@ def reset_gui_state():
             except RuntimeError:
                 pass
     gui.screens.clear()
+    gui.render_scheduler = None
     sys.modules.pop("qtui", None)
 
 
@@ -145,6 +147,22 @@ def test_screen_wraps_module_object_and_emits_visibility_signals(app):
     hidden.assert_called_once_with()
 
 
+def test_screen_suspends_when_hidden_and_resumes_before_shown(app):
+    _screen_module("tests.fake_gui_screen_suspend")
+    screen = gui.Screen("PFD", "tests.fake_gui_screen_suspend", {})
+    screen.object = mock.Mock()
+
+    screen.hide()
+    screen.show()
+
+    assert screen.object.mock_calls == [
+        mock.call.hide(),
+        mock.call.suspend(),
+        mock.call.resume(),
+        mock.call.show(),
+    ]
+
+
 def test_set_default_screen_by_index_name_and_missing(app):
     _screen_module("tests.fake_gui_screen_default")
     first = _add_screen("FIRST", "tests.fake_gui_screen_default")
@@ -247,6 +265,94 @@ def test_main_uses_primary_screen_when_size_not_configured(app, qtbot, monkeypat
     assert window.nodeID == 99
 
 
+def test_main_lazy_screens_build_default_first_then_idle(app, qtbot):
+    mods = [_screen_module(f"tests.fake_gui_screen_lazy_{n}") for n in range(4)]
+    for n in range(4):
+        _add_screen(f"S{n}", f"tests.fake_gui_screen_lazy_{n}", {}, n == 1)
+
+    window = gui.Main(_config(default=1, lazy_screens=True), ".", {})
+    qtbot.addWidget(window)
+
+    assert [len(mod.Screen.instances) for mod in mods] == [0, 1, 0, 0]
+    assert window.running_screen == 1
+    assert mods[1].Screen.instances[0].shown is True
+    assert window.prebuild == [0, 2, 3]
+
+    window.prebuildNext()
+    assert [len(mod.Screen.instances) for mod in mods] == [1, 1, 0, 0]
+    assert mods[0].Screen.instances[0].hidden is True
+    assert mods[0].Screen.instances[0].init_count == 1
+
+    # Showing a screen before its turn builds it on demand
+    window.showScreen("S3")
+    assert mods[3].Screen.instances[0].shown is True
+    assert window.running_screen == 3
+
+    qtbot.waitUntil(lambda: not window.prebuild_timer.isActive(), timeout=1000)
+    assert [len(mod.Screen.instances) for mod in mods] == [1, 1, 1, 1]
+
+
+def test_main_lazy_screens_on_demand_and_neighbours(app, qtbot, monkeypatch):
+    mods = [_screen_module(f"tests.fake_gui_screen_demand_{n}") for n in range(5)]
+    for n in range(5):
+        _add_screen(f"S{n}", f"tests.fake_gui_screen_demand_{n}", {}, n == 0)
+
+    window = gui.Main(
+        _config(lazy_screens=True, prebuild_screens=False, prebuild_neighbours=True),
+        ".",
+        {},
+    )
+    qtbot.addWidget(window)
+    assert window.prebuild == [4, 1]
+    window.prebuild_timer.stop()
+    window.prebuild.clear()
+
+    window.showScreen(2)
+    assert window.prebuild == [1, 3]
+    window.prebuildNext()
+    window.prebuildNext()
+    assert not window.prebuild_timer.isActive()
+    assert [len(mod.Screen.instances) for mod in mods] == [1, 1, 1, 1, 0]
+
+    monkeypatch.setattr(gui.fix, "stop", mock.Mock())
+    monkeypatch.setattr(gui.time, "sleep", mock.Mock())
+    monkeypatch.setattr(gui.QCoreApplication, "quit", mock.Mock())
+    window.doExit()
+    assert mods[2].Screen.instances[0].closed is True
+    assert gui.screens[4].object is None
+
+
+def test_main_max_resident_screens_tears_down_least_recently_used(app, qtbot):
+    mods = [_screen_module(f"tests.fake_gui_screen_lru_{n}") for n in range(4)]
+    for n in range(4):
+        _add_screen(f"S{n}", f"tests.fake_gui_screen_lru_{n}", {}, n == 3)
+
+    window = gui.Main(_config(default=3, max_resident_screens=2), ".", {})
+    qtbot.addWidget(window)
+
+    # The default screen always gets built and takes the oldest slot
+    assert window.resident == [1, 3]
+    assert mods[0].Screen.instances[0].closed is True
+    assert gui.screens[0].object is None
+    assert window.prebuild == [2]
+    window.prebuildNext()
+    assert window.prebuild == [2]
+    assert not window.prebuild_timer.isActive()
+
+    window.showScreen(1)
+    window.showScreen(0)
+    assert window.resident == [1, 0]
+    assert mods[3].Screen.instances[0].closed is True
+    assert gui.screens[3].object is None
+
+    window.showScreen(3)
+    assert len(mods[3].Screen.instances) == 2
+    assert gui.screens[3].object is mods[3].Screen.instances[1]
+    assert gui.screens[3].object.shown is True
+    assert gui.screens[1].object is None
+    assert window.resident == [0, 3]
+
+
 def test_main_events_running_screen_and_exit(app, qtbot, monkeypatch):
     _screen_module("tests.fake_gui_screen_events")
     _add_screen("FIRST", "tests.fake_gui_screen_events", {}, True)
@@ -457,3 +563,73 @@ def test_initialize_raises_when_screen_module_fails(app):
 
     with pytest.raises(ModuleNotFoundError):
         gui.initialize(config, ".", {})
+
+
+def test_schedule_render_without_scheduler_calls_immediately(app):
+    callback = mock.Mock()
+
+    gui.scheduleRender(callback, 1, 2)
+
+    callback.assert_called_once_with(1, 2)
+
+
+def test_render_scheduler_coalesces_to_latest_arguments(app, qtbot):
+    gui.render_scheduler = gui.RenderScheduler(50)
+    first = mock.Mock()
+    second = mock.Mock()
+
+    assert gui.render_scheduler.timer.interval() == 20
+    gui.scheduleRender(first, 1)
+    gui.scheduleRender(second)
+    gui.scheduleRender(first, 2)
+    gui.scheduleRender(first, 3)
+    first.assert_not_called()
+
+    qtbot.waitUntil(lambda: first.called)
+    first.assert_called_once_with(3)
+    second.assert_called_once_with()
+    assert gui.render_scheduler.pending == {}
+
+
+def test_render_scheduler_ignores_deleted_widgets(app):
+    scheduler = gui.RenderScheduler(30)
+    callback = mock.Mock()
+    scheduler.schedule(
+        mock.Mock(side_effect=RuntimeError("wrapped C/C++ object of type AI has been deleted"))
+    )
+    scheduler.schedule(callback)
+
+    scheduler.flush()
+
+    callback.assert_called_once_with()
+
+    scheduler.schedule(mock.Mock(side_effect=RuntimeError("a real bug")))
+    with pytest.raises(RuntimeError, match="a real bug"):
+        scheduler.flush()
+
+
+def test_initialize_creates_render_scheduler_from_max_fps(app, monkeypatch):
+    _screen_module("tests.fake_gui_screen_initialize_fps")
+    config = _config(max_fps=25)
+    config["screens"] = {
+        "FIRST": {"module": "tests.fake_gui_screen_initialize_fps"},
+    }
+
+    gui.initialize(config, ".", {})
+
+    assert isinstance(gui.render_scheduler, gui.RenderScheduler)
+    assert gui.render_scheduler.timer.interval() == 40
+
+
+def test_initialize_sets_report_coalesced(app, monkeypatch):
+    _screen_module("tests.fake_gui_screen_initialize_coalesced")
+    monkeypatch.setattr(fixhub, "mailbox", None)
+    monkeypatch.setattr(fixhub, "coalesced_period", None)
+    config = _config(report_coalesced=30)
+    config["screens"] = {
+        "FIRST": {"module": "tests.fake_gui_screen_initialize_coalesced"},
+    }
+
+    gui.initialize(config, ".", {})
+
+    assert fixhub.coalesced_period == 30
@@ -435,3 +435,55 @@ def test_import_path_setup_uses_map_env_and_skips_missing_tools_env(monkeypatch)
 
     assert "/map-env" in imported.sys.path
     assert "/app" in imported.sys.path
+
+
+def test_main_compile_config_writes_snapshot_and_exits(
+    monkeypatch, config_files, patched_runtime
+):
+    config_file, _preferences_file = config_files
+    config_file.write_text("main: {nodeID: 1}\n")
+    monkeypatch.setattr(main_module.cfg, "yaml_cache", {})
+    monkeypatch.setattr(main_module.cfg, "resolved_configs", {})
+    monkeypatch.setattr(
+        main_module.sys,
+        "argv",
+        ["pyefis", "--config-file", str(config_file), "--compile-config"],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main_module.main()
+
+    assert exc.value.code == 0
+    assert (config_file.parent / main_module.cfg.SNAPSHOT_FILE).exists()
+    main_module.gui.initialize.assert_not_called()
+
+
+def test_main_loads_unchanged_config_from_snapshot(
+    monkeypatch, config_files, patched_runtime
+):
+    config_file, _preferences_file = config_files
+    config_file.write_text("main: {nodeID: 1}\nhooks: [one]\n")
+    monkeypatch.setattr(main_module.cfg, "yaml_cache", {})
+    monkeypatch.setattr(main_module.cfg, "resolved_configs", {})
+    monkeypatch.setattr(main_module.sys, "argv", ["pyefis", "--config-file", str(config_file)])
+
+    with pytest.raises(SystemExit):
+        main_module.main()
+
+    assert (config_file.parent / main_module.cfg.SNAPSHOT_FILE).exists()
+    monkeypatch.setattr(main_module.cfg, "yaml_cache", {})
+    monkeypatch.setattr(main_module.cfg, "resolved_configs", {})
+    monkeypatch.setattr(main_module.cfg, "from_yaml", mock.Mock())
+    load = mock.Mock()
+    monkeypatch.setattr(main_module.cfg.yaml, "load", load)
+
+    with pytest.raises(SystemExit):
+        main_module.main()
+
+    main_module.cfg.from_yaml.assert_not_called()
+    load.assert_not_called()
+    main_module.gui.initialize.assert_called_with(
+        {"main": {"nodeID": 1}, "hooks": ["one"]},
+        str(config_file.parent),
+        {"enabled": {"AUTO_START": True}},
+    )
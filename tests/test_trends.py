@@ -0,0 +1,98 @@
+import pytest
+
+from pyefis import trends
+
+
+@pytest.fixture(autouse=True)
+def clean_trends():
+    trends.trends.clear()
+    yield
+    for trend in trends.trends.values():
+        trend.timer.stop()
+    trends.trends.clear()
+
+
+class Consumer:
+    def __init__(self):
+        self.values = []
+
+    def setTrend(self, value):
+        self.values.append(value)
+
+
+def test_ring_buffer_keeps_the_last_samples_and_their_sum():
+    ring = trends.RingBuffer(3)
+    assert ring.mean() == 0.0
+
+    for sample in (1, 2, 3, 4, 5):
+        ring.append(sample)
+
+    assert list(ring) == [3, 4, 5]
+    assert len(ring) == 3
+    assert ring.total == 12
+    assert ring.mean() == 4
+
+    ring.clear()
+    assert list(ring) == []
+    ring.append(0.1)
+    assert ring.mean() == 0.1
+
+
+def test_ring_buffer_sum_does_not_drift():
+    ring = trends.RingBuffer(10)
+    for i in range(100000):
+        ring.append(0.1 * (i % 7))
+    assert ring.total == pytest.approx(sum(ring), abs=1e-12)
+
+
+def test_one_trend_per_key_feeds_every_consumer(fix, qtbot):
+    first = Consumer()
+    second = Consumer()
+    trend = trends.subscribe("ALT", first.setTrend, samples=4, rate=2)
+    assert trends.subscribe("ALT", second.setTrend, samples=4, rate=2) is trend
+    trends.subscribe("ALT", second.setTrend, samples=4, rate=2)
+    assert len(trend.consumers) == 2
+    assert trend.timer.isActive()
+    assert trend.timer.interval() == 500
+
+    item = fix.db.get_item("ALT")
+    item.value = 10
+    trend.tick()
+    item.value = 30
+    trend.tick()
+
+    # 10 then 20 feet in half a second
+    assert first.values == [1200, 1800]
+    assert second.values == [1200, 1800]
+
+    trends.unsubscribe("ALT", second.setTrend, samples=4, rate=2)
+    trends.unsubscribe("NOPE", second.setTrend)
+    trend.tick()
+    assert len(first.values) == 3
+    assert len(second.values) == 2
+
+    trends.unsubscribe("ALT", first.setTrend, samples=4, rate=2)
+    assert not trend.timer.isActive()
+
+
+def test_trend_falls_to_zero_once_the_value_holds(fix, qtbot):
+    consumer = Consumer()
+    trend = trends.subscribe("ALT", consumer.setTrend, samples=5, rate=100)
+
+    fix.db.get_item("ALT").value = 100
+    qtbot.waitUntil(lambda: len(consumer.values) >= 8, timeout=2000)
+
+    assert consumer.values[:5] == [600000, 300000, 200000, 150000, 120000]
+    assert consumer.values[-1] == 0
+    assert trend.value == 0
+
+
+def test_dead_consumers_are_dropped_and_new_database_gets_new_trend(fix, qtbot):
+    trend = trends.subscribe("ALT", Consumer().setTrend)
+    trend.tick()
+    assert trend.consumers == []
+    assert not trend.timer.isActive()
+
+    trend.item = object()
+    assert trends.trend("ALT") is not trend
+    assert trends.trend("ALT", 5) is not trends.trend("ALT")